@@ -0,0 +1,66 @@
+import json
+import logging
+import random
+import time
+from typing import Optional
+
+from app.core.config import settings
+
+access_logger = logging.getLogger("app.access")
+
+
+class AccessLog:
+    """One compact JSON record per request.
+
+    Successful (< 400) responses are sampled at ``sample_rate``; errors and
+    requests slower than ``slow_threshold_ms`` are always logged.
+    """
+
+    def __init__(self, enabled: bool = True, sample_rate: float = 1.0,
+                 slow_threshold_ms: float = 500.0, rng=random.random):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self._rng = rng
+
+    def should_log(self, status: int, duration_ms: float) -> bool:
+        if not self.enabled:
+            return False
+        if status >= 400 or duration_ms >= self.slow_threshold_ms:
+            return True
+        return self.sample_rate >= 1.0 or self._rng() < self.sample_rate
+
+    def log(self, method: str, route: str, status: int, duration_ms: float,
+            user_id: Optional[int] = None, bytes_sent: Optional[int] = None,
+            error: Optional[str] = None):
+        if not self.should_log(status, duration_ms):
+            return
+
+        if status >= 500 or error:
+            level = logging.ERROR
+        elif status >= 400 or duration_ms >= self.slow_threshold_ms:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        if not access_logger.isEnabledFor(level):
+            return
+
+        record = {
+            "ts": round(time.time(), 3),
+            "method": method,
+            "route": route,
+            "status": status,
+            "duration_ms": round(duration_ms, 3),
+            "user_id": user_id,
+            "bytes": bytes_sent,
+        }
+        if error:
+            record["error"] = error
+        access_logger.log(level, json.dumps(record, separators=(",", ":")))
+
+
+access_log = AccessLog(
+    enabled=settings.ACCESS_LOG_ENABLED,
+    sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+    slow_threshold_ms=settings.ACCESS_LOG_SLOW_THRESHOLD_MS,
+)
@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.jobs import enqueue_job, job_handler
+from app.core.rate_limit import client_ip
+from app.models.audit_event import AuditEvent
+
+
+@job_handler("audit")
+async def write_audit_event(payload: dict, db: AsyncSession) -> None:
+    await db.execute(insert(AuditEvent).values(
+        event=payload["event"],
+        username=payload.get("username"),
+        user_id=payload.get("user_id"),
+        client_ip=payload.get("client_ip"),
+        details=payload.get("details") or {},
+        occurred_at=datetime.fromisoformat(payload["occurred_at"]),
+    ))
+
+
+async def audit(
+    event: str,
+    request: Optional[Request] = None,
+    username: Optional[str] = None,
+    user_id: Optional[int] = None,
+    **details,
+) -> None:
+    """Record ``event`` in audit_events after the response (see app.core.jobs)"""
+    if not settings.AUDIT_EVENTS_ENABLED:
+        return
+    await enqueue_job("audit", {
+        "event": event,
+        "username": username,
+        "user_id": user_id,
+        "client_ip": client_ip(request) if request is not None else None,
+        "details": details,
+        "occurred_at": datetime.now(timezone.utc).isoformat(),
+    })
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -7,20 +8,149 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 365
+    JWT_DECODE_CACHE_SIZE: int = 10000  # Verified tokens kept in memory, 0 disables
+    # Asymmetric signing (ALGORITHM=ES256 or EdDSA): key files in JWT_KEYS_DIR,
+    # shared by every worker and managed with `python -m app.core.keys`
+    JWT_KEYS_DIR: str = "keys"
+    JWT_KEYS_RELOAD_SECONDS: float = 60.0  # How often workers pick up new key files
+    JWT_KEY_ROTATION_DAYS: float = 30.0  # `keys rotate --if-due` adds a key this often
+    # A new key is published in the JWKS this long before it signs anything;
+    # keep it above JWKS_CACHE_MAX_AGE_SECONDS so verifiers already have it
+    JWT_KEY_ACTIVATION_DELAY_HOURS: float = 2.0
+    JWKS_CACHE_MAX_AGE_SECONDS: int = 3600
     POSTGRES_USER: str = os.getenv("POSTGRES_USER", "postgres")
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "password")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "fastapi_db")
     POSTGRES_SERVER: str = os.getenv("POSTGRES_SERVER", "localhost")
     POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
+
+    # Connection Pool Configuration
+    # Each worker holds up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections;
+    # python -m app.server shrinks both so that all workers together stay
+    # within DB_MAX_CONNECTIONS (keep it below Postgres' max_connections,
+    # leaving room for migrations and admin sessions).
+    DB_MAX_CONNECTIONS: int = 80
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 0
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced, -1 disables
+    # Pings every connection on checkout, one extra round trip per request;
+    # only for networks that silently drop idle connections
+    DB_POOL_PRE_PING: bool = False
+    DB_ECHO: bool = False
+    # Prepared statements kept per connection (0 disables, e.g. behind
+    # pgbouncer in transaction mode) and SQLAlchemy compiled-SQL cache size
+    DB_STATEMENT_CACHE_SIZE: int = 256
+    DB_COMPILED_CACHE_SIZE: int = 500
+    DB_PREWARM_STATEMENTS: bool = True  # Prepare hot statements on new connections
+    # /internal/* and /metrics answer only "Authorization: Bearer <INTERNAL_ENDPOINTS_TOKEN>";
+    # while no token is set they respond 404
+    INTERNAL_ENDPOINTS_ENABLED: bool = True
+    INTERNAL_ENDPOINTS_TOKEN: Optional[str] = None
+
+    # Metrics Configuration
+    METRICS_ENABLED: bool = True
+    # Shared directory for per-worker snapshots when running several workers
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_SNAPSHOT_INTERVAL_SECONDS: float = 5.0
     
     # Application Configuration
     PORT: int = int(os.getenv("PORT", "8000"))
     HOST: str = os.getenv("HOST", "0.0.0.0")
+
+    # Production Server Configuration (python -m app.server)
+    SERVER_WORKERS: int = 0  # 0 uses the CPU count
+    SERVER_LOOP: str = "auto"  # auto (uvloop when installed), uvloop or asyncio
+    SERVER_HTTP: str = "auto"  # auto (httptools when installed), httptools or h11
+    SERVER_LIMIT_MAX_REQUESTS: int = 0  # Recycle a worker after this many requests, 0 disables
+    SERVER_GRACEFUL_TIMEOUT: int = 30  # Seconds in-flight requests get on shutdown/restart
+    SERVER_KEEPALIVE_TIMEOUT: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_PROXY_HEADERS: bool = True
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"  # Proxies trusted for X-Forwarded-For
     
     # Logging Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE_LEVEL: str = os.getenv("LOG_FILE_LEVEL", "INFO")
     LOG_CONSOLE_LEVEL: str = os.getenv("LOG_CONSOLE_LEVEL", "INFO")
+    LOG_QUEUE_ENABLED: bool = False  # Format and write logs on a background thread
+    LOG_QUEUE_MAX_SIZE: int = 10000
+    LOG_QUEUE_OVERFLOW: str = "drop_new"  # drop_new or drop_oldest
+    # Set by python -m app.server for its workers: file records go over this
+    # socket to the launcher, the only process writing (and rotating) the files
+    LOG_SOCKET_PATH: Optional[str] = None
+
+    # Access Log Configuration
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0  # Fraction of successful requests logged
+    ACCESS_LOG_SLOW_THRESHOLD_MS: float = 500.0  # Slower requests are always logged
+
+    # Items Listing Configuration
+    ITEMS_PAGE_SIZE: int = 50
+    ITEMS_MAX_PAGE_SIZE: int = 500
+    ITEMS_STREAM_CHUNK_SIZE: int = 1000
+    ITEMS_BULK_BATCH_SIZE: int = 1000  # Rows per INSERT ... RETURNING statement
+    ITEMS_BULK_MAX_ITEMS: int = 50000
+    ITEMS_SEARCH_MAX_QUERY_LENGTH: int = 200
+
+    # Encode response models with pydantic-core directly instead of
+    # FastAPI's validate + jsonable_encoder + json.dumps pipeline
+    FAST_JSON_RESPONSES: bool = True
+
+    # Authenticated User Cache Configuration
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_TTL_SECONDS: float = 60.0
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # Item Response Cache Configuration (ETag / If-None-Match)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_MAX_ENTRY_BYTES: int = 1024 * 1024
+
+    # Rate Limiting Configuration (token buckets: N requests per period,
+    # bursts of up to N; 0 requests disables a limit)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_LOGIN_IP_REQUESTS: int = 30
+    RATE_LIMIT_LOGIN_IP_PERIOD_SECONDS: float = 60.0
+    RATE_LIMIT_LOGIN_USERNAME_REQUESTS: int = 5
+    RATE_LIMIT_LOGIN_USERNAME_PERIOD_SECONDS: float = 60.0
+    RATE_LIMIT_REGISTER_IP_REQUESTS: int = 10
+    RATE_LIMIT_REGISTER_IP_PERIOD_SECONDS: float = 60.0
+    RATE_LIMIT_MAX_KEYS: int = 100000
+
+    # Token Revocation Configuration (logout, refresh-token rotation)
+    REVOCATION_CHECK_ENABLED: bool = True  # Reject revoked access tokens
+    REVOCATION_REBUILD_SECONDS: float = 30.0  # Longest delay before other workers see a logout
+    REVOCATION_BLOOM_FP_RATE: float = 0.001
+    REVOCATION_BLOOM_MIN_CAPACITY: int = 10000
+
+    # Background Jobs Configuration (deferred work such as audit events)
+    JOBS_BACKEND: str = "memory"  # memory, postgres (durable) or inline (run in the request)
+    JOBS_WORKERS: int = 2  # Job tasks per worker process
+    JOBS_QUEUE_MAX_SIZE: int = 10000  # memory: jobs beyond this run in the request
+    JOBS_MAX_ATTEMPTS: int = 5
+    JOBS_RETRY_BASE_SECONDS: float = 1.0  # Doubled after each failed attempt
+    JOBS_POLL_INTERVAL_SECONDS: float = 1.0  # postgres: how often idle tasks look for due jobs
+    JOBS_DRAIN_TIMEOUT_SECONDS: float = 10.0  # Shutdown waits this long for queued jobs
+    AUDIT_EVENTS_ENABLED: bool = True
+
+    # Password Hashing Configuration
+    PASSWORD_HASH_EXECUTOR: str = "process"  # process, thread or inline
+    PASSWORD_HASH_WORKERS: int = 0  # 0 means one per CPU core
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Calls beyond this are rejected with 429
+
+    # Password Hashing Policy: new hashes use the first scheme; hashes in the
+    # other schemes or under the configured cost are replaced at next login.
+    # Pick costs with `python -m app.core.password_policy calibrate`.
+    PASSWORD_SCHEMES: str = "bcrypt"  # Comma-separated: bcrypt, scrypt, argon2 (needs argon2-cffi)
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # log2 of the iterations
+    PASSWORD_SCRYPT_ROUNDS: int = 16  # log2 of N
+    PASSWORD_SCRYPT_BLOCK_SIZE: int = 8
+    PASSWORD_ARGON2_TIME_COST: int = 3
+    PASSWORD_ARGON2_MEMORY_KIB: int = 65536
+    PASSWORD_ARGON2_PARALLELISM: int = 1
+    PASSWORD_REHASH_ON_LOGIN: bool = True
 
     @property
     def SQLALCHEMY_DATABASE_URL(self):
@@ -1,20 +1,227 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
-from databases import Database
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+from sqlalchemy import event, exc
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import registry, db_query_duration_seconds
 
 DATABASE_URL = settings.SQLALCHEMY_DATABASE_URL
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,
-    pool_size=10,
-    max_overflow=0
+db_pool_checkout_wait_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection"
 )
-AsyncSessionLocal = sessionmaker(
-    bind=engine, class_=AsyncSession, expire_on_commit=False
+db_pool_checkout_timeouts_total = registry.counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that gave up after DB_POOL_TIMEOUT"
 )
+db_pool_connections = registry.gauge(
+    "db_pool_connections", "Pooled connections by state", ("state",)
+)
+db_statement_cache_total = registry.counter(
+    "db_statement_cache_total", "Statement cache lookups by cache (compiled, prepared) and result",
+    ("cache", "result"),
+)
+db_statements_prewarmed_total = registry.counter(
+    "db_statements_prewarmed_total", "Hot statements prepared when a new connection was opened"
+)
+
+# Per-request [query count, query seconds], set by the request middleware
+request_db_stats: ContextVar[Optional[list]] = ContextVar("request_db_stats", default=None)
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long checkouts wait"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            db_pool_checkout_timeouts_total.inc()
+            raise
+        finally:
+            db_pool_checkout_wait_seconds.observe(time.perf_counter() - start)
+
+# The engine (and with it the asyncpg driver import and the pool) is
+# created on first use rather than at import; in the server that first use
+# is the startup schema check.
+_engine: Optional[AsyncEngine] = None
+
+def get_engine() -> AsyncEngine:
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(
+            DATABASE_URL,
+            echo=settings.DB_ECHO,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            query_cache_size=settings.DB_COMPILED_CACHE_SIZE,
+            connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+        )
+        event.listen(_engine.sync_engine.pool, "connect", _prewarm_statements)
+        event.listen(_engine.sync_engine, "before_cursor_execute", _start_query_timer)
+        event.listen(_engine.sync_engine, "after_cursor_execute", _record_query_time)
+    return _engine
+
+async def dispose_engine():
+    """Close the pool's connections, if the engine was ever created"""
+    if _engine is not None:
+        await _engine.dispose()
+
+class _LazyAsyncSessionmaker(async_sessionmaker):
+    """Session factory that binds to the engine when the first session is made"""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+AsyncSessionLocal = _LazyAsyncSessionmaker(class_=AsyncSession, expire_on_commit=False)
+
+# Statements issued on (nearly) every request, registered by the routers
+# and prepared on each new pooled connection so the first request served
+# by that connection does not pay for PREPARE.
+_hot_statements: List = []
+_hot_statement_sql: Optional[List[str]] = None
+
+def register_hot_statements(*statements):
+    global _hot_statement_sql
+    _hot_statements.extend(statements)
+    _hot_statement_sql = None
+
+def _compiled_hot_statements() -> List[str]:
+    # The text must match what SQLAlchemy sends, since the per-connection
+    # prepared statement cache is keyed by SQL string
+    global _hot_statement_sql
+    if _hot_statement_sql is None:
+        dialect = get_engine().dialect
+        _hot_statement_sql = [str(stmt.compile(dialect=dialect)) for stmt in _hot_statements]
+    return _hot_statement_sql
+
+_prewarm_supported = True
+
+def _disable_prewarm(reason: str) -> None:
+    global _prewarm_supported
+    if _prewarm_supported:
+        _prewarm_supported = False
+        logger.warning(f"Statement pre-warming disabled: {reason}")
+
+def _prewarm_statements(dbapi_connection, connection_record):
+    if not settings.DB_PREWARM_STATEMENTS or not settings.DB_STATEMENT_CACHE_SIZE or not _prewarm_supported:
+        return
+    # The SQLAlchemy asyncpg adapter has no public API for filling its
+    # statement cache; _prepare is what cursor execution calls. (asyncpg's
+    # own Connection.prepare bypasses both caches, so it would not help.)
+    # _prepare and the dialect's _invalidate_schema_cache_asof are private,
+    # so on a SQLAlchemy that changed them pre-warming is switched off
+    # rather than failing connections.
+    prepare = getattr(dbapi_connection, "_prepare", None)
+    invalidate_asof = getattr(get_engine().dialect, "_invalidate_schema_cache_asof", None)
+    if prepare is None or invalidate_asof is None:
+        _disable_prewarm("SQLAlchemy no longer exposes the asyncpg statement cache internals")
+        return
+    for sql in _compiled_hot_statements():
+        try:
+            dbapi_connection.await_(prepare(sql, invalidate_asof))
+            db_statements_prewarmed_total.inc()
+        except TypeError as e:
+            _disable_prewarm(f"_prepare signature changed ({str(e)})")
+            return
+        except Exception as e:
+            # e.g. tables not created yet on the very first connection
+            logger.debug(f"Skipped pre-warming statement: {str(e)}")
+
+def _record_cache_lookups(conn, statement, context, executemany):
+    if context is not None:
+        if context.cache_hit is CACHE_HIT:
+            db_statement_cache_total.labels("compiled", "hit").inc()
+        elif context.cache_hit is CACHE_MISS:
+            db_statement_cache_total.labels("compiled", "miss").inc()
+    if not executemany:
+        cache = getattr(conn.connection.dbapi_connection, "_prepared_statement_cache", None)
+        if cache is not None:
+            db_statement_cache_total.labels("prepared", "hit" if statement in cache else "miss").inc()
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    _record_cache_lookups(conn, statement, context, executemany)
+    # Kept on the execution context, which is dropped with it when the
+    # statement fails and after_cursor_execute never runs
+    if context is not None:
+        context._query_start_time = time.perf_counter()
+
+def _record_query_time(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start_time", None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    db_query_duration_seconds.observe(elapsed)
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats[0] += 1
+        stats[1] += elapsed
+
+def get_pool_status() -> dict:
+    pool = get_engine().sync_engine.pool
+    wait = db_pool_checkout_wait_seconds.labels()
+    cumulative = 0
+    buckets = {}
+    for bound, count in zip(wait.upper_bounds + (float("inf"),), wait.counts):
+        cumulative += count
+        buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # QueuePool counts overflow from -pool_size until the pool is full
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout": pool.timeout(),
+        "checkout_timeouts": int(db_pool_checkout_timeouts_total.labels().value),
+        "wait_seconds": {
+            "count": wait.count,
+            "sum": wait.sum,
+            "buckets": buckets,
+        },
+    }
+
+def _cache_counts(cache: str) -> dict:
+    hits = int(db_statement_cache_total.labels(cache, "hit").value)
+    misses = int(db_statement_cache_total.labels(cache, "miss").value)
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_ratio": hits / total if total else None}
+
+def get_statement_cache_status() -> dict:
+    compiled_cache = getattr(get_engine().sync_engine, "_compiled_cache", None)
+    return {
+        "compiled": {
+            **_cache_counts("compiled"),
+            "size": len(compiled_cache) if compiled_cache is not None else 0,
+            "max_size": settings.DB_COMPILED_CACHE_SIZE,
+        },
+        "prepared": {
+            **_cache_counts("prepared"),
+            "max_size_per_connection": settings.DB_STATEMENT_CACHE_SIZE,
+            "hot_statements": len(_hot_statements),
+            "prewarmed": int(db_statements_prewarmed_total.labels().value),
+        },
+    }
+
+def _refresh_pool_metrics():
+    if _engine is None:
+        return
+    pool = _engine.sync_engine.pool
+    db_pool_connections.labels("checked_out").set(pool.checkedout())
+    db_pool_connections.labels("checked_in").set(pool.checkedin())
+    db_pool_connections.labels("overflow").set(max(pool.overflow(), 0))
+    db_pool_connections.labels("max").set(pool.size() + max(settings.DB_MAX_OVERFLOW, 0))
 
-database = Database(DATABASE_URL, min_size=1, max_size=10)
+registry.add_refresh_hook(_refresh_pool_metrics)
 
-Base = declarative_base() 
\ No newline at end of file
+Base = declarative_base()
\ No newline at end of file
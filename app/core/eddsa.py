@@ -0,0 +1,101 @@
+"""
+EdDSA (Ed25519) keys for python-jose
+
+python-jose has no EdDSA support; importing this module registers an
+Ed25519 key class under the JWS algorithm name "EdDSA" (RFC 8037), so
+``jwt.encode``/``jwt.decode`` sign and verify with it like any other
+algorithm. Imported by app.core.keys when the first key is loaded.
+"""
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+from jose.utils import base64url_decode, base64url_encode
+
+ALGORITHM = "EdDSA"
+
+
+class Ed25519Key(Key):
+    """An Ed25519 private or public key, from PEM, a JWK dict or a cryptography key"""
+
+    def __init__(self, key, algorithm):
+        if algorithm != ALGORITHM:
+            raise JWKError(f"Ed25519 keys only support {ALGORITHM}, not {algorithm}")
+        self._algorithm = algorithm
+
+        if isinstance(key, (Ed25519PrivateKey, Ed25519PublicKey)):
+            self._key = key
+        elif isinstance(key, dict):
+            self._key = self._from_dict(key)
+        else:
+            pem = key.encode("utf-8") if isinstance(key, str) else key
+            try:
+                if b"PRIVATE" in pem:
+                    self._key = serialization.load_pem_private_key(pem, password=None)
+                else:
+                    self._key = serialization.load_pem_public_key(pem)
+            except ValueError as e:
+                raise JWKError(e)
+            if not isinstance(self._key, (Ed25519PrivateKey, Ed25519PublicKey)):
+                raise JWKError("Not an Ed25519 key")
+
+    @staticmethod
+    def _from_dict(jwk_dict: dict):
+        if jwk_dict.get("kty") != "OKP" or jwk_dict.get("crv") != "Ed25519":
+            raise JWKError("Not an Ed25519 JWK")
+        if "d" in jwk_dict:
+            return Ed25519PrivateKey.from_private_bytes(base64url_decode(jwk_dict["d"].encode("ascii")))
+        return Ed25519PublicKey.from_public_bytes(base64url_decode(jwk_dict["x"].encode("ascii")))
+
+    def _public(self) -> Ed25519PublicKey:
+        if isinstance(self._key, Ed25519PrivateKey):
+            return self._key.public_key()
+        return self._key
+
+    def is_public(self) -> bool:
+        return isinstance(self._key, Ed25519PublicKey)
+
+    def sign(self, msg: bytes) -> bytes:
+        if self.is_public():
+            raise JWKError("A public key cannot sign")
+        return self._key.sign(msg)
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        try:
+            self._public().verify(sig, msg)
+            return True
+        except InvalidSignature:
+            return False
+
+    def public_key(self) -> "Ed25519Key":
+        return Ed25519Key(self._public(), self._algorithm)
+
+    def to_pem(self) -> bytes:
+        if self.is_public():
+            return self._key.public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+        return self._key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+
+    def to_dict(self) -> dict:
+        public = self._public().public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        data = {
+            "alg": self._algorithm,
+            "kty": "OKP",
+            "crv": "Ed25519",
+            "x": base64url_encode(public).decode("ascii"),
+        }
+        if not self.is_public():
+            private = self._key.private_bytes(
+                serialization.Encoding.Raw, serialization.PrivateFormat.Raw, serialization.NoEncryption()
+            )
+            data["d"] = base64url_encode(private).decode("ascii")
+        return data
+
+
+jwk.register_key(ALGORITHM, Ed25519Key)
\ No newline at end of file
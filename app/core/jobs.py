@@ -0,0 +1,406 @@
+"""
+Background jobs: work a request triggers but its response does not need
+
+Handlers are registered by name and get a JSON-serialisable payload and a
+session; the runner commits after the handler returns:
+
+    @job_handler("audit")
+    async def write_audit_event(payload: dict, db: AsyncSession): ...
+
+    await enqueue_job("audit", {...})
+
+JOBS_BACKEND selects where queued jobs wait:
+
+    memory    a bounded asyncio queue served by JOBS_WORKERS tasks in each
+              worker process. Jobs still queued when a process dies are
+              lost; a clean shutdown drains the queue first.
+    postgres  rows in the jobs table, claimed with FOR UPDATE SKIP LOCKED by
+              any worker of any instance. The claim, the job's writes and
+              the row's deletion commit together, so a crash mid-job
+              leaves the job queued for another worker.
+    inline    no queue; jobs run in the request, before the response.
+
+Failed attempts are retried up to JOBS_MAX_ATTEMPTS times with exponential
+backoff. A job the queue cannot take (memory queue full or not started,
+postgres insert failed) runs in the request instead of being dropped.
+"""
+
+import asyncio
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import logger
+from app.core.metrics import registry
+from app.models.job import Job
+
+job_queue_depth = registry.gauge(
+    "job_queue_depth", "Jobs waiting to run, by backend", ("backend",)
+)
+job_latency_seconds = registry.histogram(
+    "job_latency_seconds", "Time from enqueue until a job succeeded, retries included", ("job",),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+job_duration_seconds = registry.histogram(
+    "job_duration_seconds", "Run time of one job attempt", ("job",)
+)
+jobs_total = registry.counter(
+    "jobs_total", "Job attempts by result (succeeded, retried, failed, inline)", ("job", "result")
+)
+
+JobHandler = Callable[[dict, AsyncSession], Awaitable[None]]
+_handlers: Dict[str, JobHandler] = {}
+
+MAX_RETRY_DELAY_SECONDS = 300.0
+
+
+def job_handler(name: str):
+    """Register the decorated coroutine as the handler for jobs named ``name``"""
+
+    def register(func: JobHandler) -> JobHandler:
+        _handlers[name] = func
+        return func
+
+    return register
+
+
+def retry_delay(attempt: int, base: float) -> float:
+    """Seconds before retrying after failed attempt number ``attempt`` (1-based)"""
+    return min(MAX_RETRY_DELAY_SECONDS, base * 2 ** (attempt - 1))
+
+
+async def run_job(name: str, payload: dict, db: AsyncSession) -> Optional[str]:
+    """Run one attempt of a job in ``db``; returns None on success, the error otherwise"""
+    handler = _handlers.get(name)
+    if handler is None:
+        return f"No handler registered for job {name}"
+    start = time.perf_counter()
+    try:
+        await handler(payload, db)
+        return None
+    except Exception as e:
+        logger.error(f"Job {name} failed: {str(e)}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        return str(e) or type(e).__name__
+    finally:
+        job_duration_seconds.labels(name).observe(time.perf_counter() - start)
+
+
+async def run_job_in_session(name: str, payload: dict) -> Optional[str]:
+    """One attempt of a job in its own session, committed when the handler succeeds"""
+    async with AsyncSessionLocal() as session:
+        error = await run_job(name, payload, session)
+        if error is None:
+            try:
+                await session.commit()
+            except Exception as e:
+                logger.error(f"Job {name} commit failed: {str(e)}")
+                error = str(e) or type(e).__name__
+        return error
+
+
+class MemoryJobQueue:
+    """Bounded in-process queue served by worker tasks on the event loop"""
+
+    backend = "memory"
+
+    def __init__(self, workers: int = 2, max_size: int = 10000, max_attempts: int = 5, retry_base_seconds: float = 1.0):
+        self.workers = max(1, workers)
+        self.max_size = max_size
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_seconds = retry_base_seconds
+        # Created in start(), on the loop that serves requests
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._accepting = False
+        self.enqueued = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue(self.max_size)
+        self._tasks = [asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)]
+        self._accepting = True
+        logger.info(f"Memory job queue started with {self.workers} workers")
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def enqueue(self, name: str, payload: dict) -> bool:
+        if not self._accepting:
+            return False
+        try:
+            self._queue.put_nowait((name, payload, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            logger.warning(f"Job queue full ({self.max_size} jobs); running {name} in the request")
+            return False
+        self.enqueued += 1
+        return True
+
+    async def _worker(self) -> None:
+        while True:
+            name, payload, enqueued_at = await self._queue.get()
+            try:
+                await self._run(name, payload, enqueued_at)
+            except Exception as e:
+                # Keep the worker alive: a dead task would leave the queue undrained
+                logger.error(f"Job worker error: {str(e)}")
+                logger.error(f"Traceback: {traceback.format_exc()}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, name: str, payload: dict, enqueued_at: float) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            error = await run_job_in_session(name, payload)
+            if error is None:
+                self.succeeded += 1
+                jobs_total.labels(name, "succeeded").inc()
+                job_latency_seconds.labels(name).observe(time.perf_counter() - enqueued_at)
+                return
+            if attempt == self.max_attempts:
+                self.failed += 1
+                jobs_total.labels(name, "failed").inc()
+                logger.error(f"Job {name} abandoned after {attempt} attempts: {error}")
+                return
+            jobs_total.labels(name, "retried").inc()
+            await asyncio.sleep(retry_delay(attempt, self.retry_base_seconds))
+
+    async def drain(self, timeout: float) -> None:
+        """Stop taking jobs and wait up to ``timeout`` seconds for the queued ones"""
+        self._accepting = False
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+            logger.info("Job queue drained")
+        except asyncio.TimeoutError:
+            logger.warning(f"Job queue drain timed out after {timeout}s; {self._queue.qsize()} queued jobs dropped")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "backend": self.backend,
+            "workers": self.workers,
+            "depth": self.depth,
+            "max_size": self.max_size,
+            "enqueued": self.enqueued,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
+
+
+class _JobFailed(Exception):
+    """Rolls back the savepoint of a failed job attempt"""
+
+
+def _claim_query():
+    return (
+        select(Job.id, Job.name, Job.payload, Job.attempts, Job.created_at)
+        .where(Job.failed_at.is_(None), Job.run_at <= func.now())
+        .order_by(Job.run_at, Job.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def _pending_count_query():
+    return select(func.count()).select_from(Job).where(Job.failed_at.is_(None))
+
+
+class PostgresJobQueue:
+    """Jobs stored in the jobs table and claimed with SKIP LOCKED.
+
+    Each worker task holds one connection while it runs a job, so
+    JOBS_WORKERS counts against DB_POOL_SIZE. Idle tasks poll every
+    ``poll_interval`` seconds; a job enqueued by this process wakes them
+    at once.
+    """
+
+    backend = "postgres"
+    DEPTH_REFRESH_SECONDS = 5.0
+
+    def __init__(self, workers: int = 2, max_attempts: int = 5, retry_base_seconds: float = 1.0, poll_interval: float = 1.0):
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_seconds = retry_base_seconds
+        self.poll_interval = poll_interval
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+        self._depth = 0
+        self._depth_checked_at = 0.0
+        self.enqueued = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retried = 0
+
+    def start(self) -> None:
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._tasks = [asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)]
+        logger.info(f"Postgres job queue started with {self.workers} workers")
+
+    @property
+    def depth(self) -> int:
+        """Pending jobs in the table, counted at most every DEPTH_REFRESH_SECONDS"""
+        return self._depth
+
+    async def enqueue(self, name: str, payload: dict) -> bool:
+        async with AsyncSessionLocal() as session:
+            await session.execute(insert(Job).values(name=name, payload=payload))
+            await session.commit()
+        self.enqueued += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    async def _worker(self) -> None:
+        while not self._stopping:
+            try:
+                ran = await self._run_next()
+                await self._refresh_depth()
+            except Exception as e:
+                logger.error(f"Job worker error: {str(e)}")
+                ran = False
+            if not ran and not self._stopping:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _run_next(self) -> bool:
+        """Claim, run and settle one due job; False when there was none"""
+        async with AsyncSessionLocal() as session:
+            job = (await session.execute(_claim_query())).first()
+            if job is None:
+                return False
+
+            try:
+                # A savepoint, so a failed job's writes roll back while the
+                # row lock (and with it the claim) is kept for the update below
+                async with session.begin_nested():
+                    error = await run_job(job.name, job.payload, session)
+                    if error is not None:
+                        raise _JobFailed()
+            except _JobFailed:
+                pass
+
+            if error is None:
+                await session.execute(delete(Job).where(Job.id == job.id))
+                await session.commit()
+                self.succeeded += 1
+                jobs_total.labels(job.name, "succeeded").inc()
+                job_latency_seconds.labels(job.name).observe(
+                    (datetime.now(timezone.utc) - job.created_at).total_seconds()
+                )
+                return True
+
+            attempts = job.attempts + 1
+            values = {"attempts": attempts, "last_error": error[:1000]}
+            if attempts >= self.max_attempts:
+                values["failed_at"] = func.now()
+                self.failed += 1
+                jobs_total.labels(job.name, "failed").inc()
+                logger.error(f"Job {job.name} (id {job.id}) abandoned after {attempts} attempts: {error}")
+            else:
+                values["run_at"] = func.now() + timedelta(seconds=retry_delay(attempts, self.retry_base_seconds))
+                self.retried += 1
+                jobs_total.labels(job.name, "retried").inc()
+            await session.execute(update(Job).where(Job.id == job.id).values(**values))
+            await session.commit()
+            return True
+
+    async def _refresh_depth(self) -> None:
+        now = time.monotonic()
+        if now - self._depth_checked_at < self.DEPTH_REFRESH_SECONDS:
+            return
+        self._depth_checked_at = now
+        async with AsyncSessionLocal() as session:
+            self._depth = (await session.execute(_pending_count_query())).scalar_one()
+
+    async def drain(self, timeout: float) -> None:
+        """Let running jobs finish (up to ``timeout`` seconds); queued ones stay in the table"""
+        self._stopping = True
+        if not self._tasks:
+            return
+        self._wakeup.set()
+        done, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            # Cancelling rolls back the claim, so the job runs again elsewhere
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info(f"Postgres job queue stopped ({len(pending)} running jobs interrupted)")
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "backend": self.backend,
+            "workers": self.workers,
+            "depth": self._depth,
+            "enqueued": self.enqueued,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+async def enqueue_job(name: str, payload: dict) -> None:
+    """Run job ``name`` after the response, or now when no queue can take it"""
+    queue = _job_queue
+    if queue is not None:
+        try:
+            if await queue.enqueue(name, payload):
+                return
+        except Exception as e:
+            logger.error(f"Enqueueing job {name} failed: {str(e)}")
+    jobs_total.labels(name, "inline").inc()
+    await run_job_in_session(name, payload)
+
+
+def _create_job_queue():
+    if settings.JOBS_BACKEND == "postgres":
+        return PostgresJobQueue(
+            settings.JOBS_WORKERS, settings.JOBS_MAX_ATTEMPTS,
+            settings.JOBS_RETRY_BASE_SECONDS, settings.JOBS_POLL_INTERVAL_SECONDS,
+        )
+    if settings.JOBS_BACKEND == "memory":
+        return MemoryJobQueue(
+            settings.JOBS_WORKERS, settings.JOBS_QUEUE_MAX_SIZE,
+            settings.JOBS_MAX_ATTEMPTS, settings.JOBS_RETRY_BASE_SECONDS,
+        )
+    return None
+
+
+_job_queue = _create_job_queue()
+
+
+def _refresh_queue_metrics():
+    if _job_queue is not None:
+        job_queue_depth.labels(_job_queue.backend).set(_job_queue.depth)
+
+
+registry.add_refresh_hook(_refresh_queue_metrics)
+
+
+def get_job_queue():
+    return _job_queue
+
+
+def set_job_queue(queue) -> None:
+    """Replace the job queue; ``None`` runs jobs in the request"""
+    global _job_queue
+    _job_queue = queue
\ No newline at end of file
@@ -0,0 +1,268 @@
+"""
+JWT signing keys for the asymmetric algorithms (ES256, EdDSA)
+
+Each key is a ``<kid>.json`` file in JWT_KEYS_DIR holding its algorithm,
+activation time and private key; every worker and instance issuing tokens
+reads the same directory. Keys are managed with:
+
+    python -m app.core.keys rotate --now      # first key, signing at once
+    python -m app.core.keys rotate --if-due   # from cron: a new key every JWT_KEY_ROTATION_DAYS
+    python -m app.core.keys list
+    python -m app.core.keys prune             # delete keys no unexpired token was signed with
+    python -m app.core.keys jwks              # print the public key set
+
+A rotated key is published in /.well-known/jwks.json
+JWT_KEY_ACTIVATION_DELAY_HOURS before it starts signing, so services
+caching the key set already hold it when the first token signed with it
+arrives. Tokens are signed by the newest active key and carry its ``kid``;
+they are verified with whichever key the kid names, so older keys keep
+verifying until pruned.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import ensure_logging, logger
+
+ASYMMETRIC_ALGORITHMS = ("ES256", "EdDSA")
+EMPTY_JWKS = b'{"keys":[]}'
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    not_before: float
+    signer: Any = None  # python-jose private key
+    verifier: Any = None  # python-jose public key
+    public_jwk: Optional[dict] = None
+
+
+def _jose_key(private_pem: str, algorithm: str):
+    from jose import jwk
+
+    if algorithm == "EdDSA":
+        import app.core.eddsa  # noqa: F401  registers EdDSA with python-jose
+    return jwk.construct(private_pem, algorithm)
+
+
+def load_key(path: Path) -> SigningKey:
+    data = json.loads(path.read_text())
+    if data["alg"] not in ASYMMETRIC_ALGORITHMS:
+        raise ValueError(f"unsupported algorithm {data['alg']}")
+    signer = _jose_key(data["private_key"], data["alg"])
+    verifier = signer.public_key()
+    public_jwk = {
+        key: value for key, value in verifier.to_dict().items() if key in ("kty", "crv", "x", "y", "alg")
+    }
+    public_jwk.update({"kid": data["kid"], "use": "sig"})
+    return SigningKey(data["kid"], data["alg"], float(data["not_before"]), signer, verifier, public_jwk)
+
+
+def generate_private_pem(algorithm: str) -> str:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+    if algorithm == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+    elif algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        raise ValueError(f"Cannot generate a key for {algorithm}; use one of {', '.join(ASYMMETRIC_ALGORITHMS)}")
+    return private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode("ascii")
+
+
+def write_key(directory: Path, algorithm: str, not_before: float) -> Path:
+    """Create a key file; written under a temporary name and renamed so workers never read it half-written"""
+    directory.mkdir(parents=True, exist_ok=True)
+    kid = f"{datetime.fromtimestamp(not_before, tz=timezone.utc):%Y%m%d%H%M}-{uuid.uuid4().hex[:8]}"
+    data = {"kid": kid, "alg": algorithm, "not_before": not_before, "private_key": generate_private_pem(algorithm)}
+    path = directory / f"{kid}.json"
+    tmp_path = directory / f".{kid}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+class KeyRing:
+    """The signing keys in a directory, re-read when its files change.
+
+    The directory is checked at most every ``reload_seconds``; a check
+    costs one stat per key file, and keys are only parsed again when a
+    file was added, removed or modified. The JWKS document is rendered
+    once per reload.
+    """
+
+    def __init__(self, directory: str, reload_seconds: float = 60.0, clock: Callable[[], float] = time.time):
+        self.directory = Path(directory)
+        self.reload_seconds = reload_seconds
+        self._clock = clock
+        self._keys: Dict[str, SigningKey] = {}
+        self._active: List[SigningKey] = []  # newest first
+        self._fingerprint: Optional[Tuple] = None
+        self._checked_at: Optional[float] = None
+        self._jwks = (EMPTY_JWKS, self._etag(EMPTY_JWKS))
+        self.reloads = 0
+
+    @staticmethod
+    def _etag(body: bytes) -> str:
+        return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    def _refresh(self) -> None:
+        now = self._clock()
+        if self._checked_at is not None and now - self._checked_at < self.reload_seconds:
+            return
+        self._checked_at = now
+        paths = sorted(self.directory.glob("*.json")) if self.directory.is_dir() else []
+        fingerprint = tuple((path.name, path.stat().st_mtime_ns) for path in paths)
+        if fingerprint == self._fingerprint:
+            return
+
+        keys = {}
+        for path in paths:
+            try:
+                key = load_key(path)
+                keys[key.kid] = key
+            except Exception as e:
+                logger.error(f"Skipping JWT signing key {path.name}: {str(e)}")
+        ordered = sorted(keys.values(), key=lambda key: key.not_before, reverse=True)
+        body = json.dumps({"keys": [key.public_jwk for key in ordered]}, separators=(",", ":")).encode("utf-8")
+        self._keys = keys
+        self._active = ordered
+        self._jwks = (body, self._etag(body))
+        self._fingerprint = fingerprint
+        self.reloads += 1
+        logger.info(f"Loaded {len(keys)} JWT signing key(s) from {self.directory}")
+
+    def signing_key(self) -> SigningKey:
+        """The newest key whose activation time has passed"""
+        self._refresh()
+        now = self._clock()
+        for key in self._active:
+            if key.not_before <= now:
+                return key
+        raise RuntimeError(
+            f"No active JWT signing key in {self.directory}; run `python -m app.core.keys rotate --now`"
+        )
+
+    def verification_key(self, kid: Optional[str]) -> Optional[SigningKey]:
+        self._refresh()
+        return self._keys.get(kid) if kid else None
+
+    def keys(self) -> List[SigningKey]:
+        self._refresh()
+        return list(self._active)
+
+    def jwks(self) -> Tuple[bytes, str]:
+        """The public key set as rendered JSON, with its ETag"""
+        self._refresh()
+        return self._jwks
+
+
+def token_kid(token: str) -> Optional[str]:
+    """The ``kid`` from a token's header, read without verifying anything"""
+    header = token.split(".", 1)[0]
+    data = json.loads(base64.urlsafe_b64decode(header + "=" * (-len(header) % 4)))
+    return data.get("kid") if isinstance(data, dict) else None
+
+
+def max_token_lifetime() -> float:
+    return max(settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60, settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400)
+
+
+def prunable_keys(keys: List[SigningKey], now: float, lifetime: float) -> List[SigningKey]:
+    """Keys whose successor has been signing for longer than any token lives"""
+    ordered = sorted(keys, key=lambda key: key.not_before)
+    return [
+        key for key, successor in zip(ordered, ordered[1:])
+        if successor.not_before + lifetime < now
+    ]
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
+
+
+def _rotate(directory: Path, algorithm: str, now: bool, if_due: bool) -> None:
+    current = time.time()
+    keys = KeyRing(str(directory), reload_seconds=0).keys()
+    if if_due and keys and keys[0].not_before + settings.JWT_KEY_ROTATION_DAYS * 86400 > current:
+        print(f"Newest key {keys[0].kid} activates {_format_time(keys[0].not_before)}; rotation not due")
+        return
+    not_before = current if now or not keys else current + settings.JWT_KEY_ACTIVATION_DELAY_HOURS * 3600
+    path = write_key(directory, algorithm, not_before)
+    print(f"Created {algorithm} key {path.stem}, signing from {_format_time(not_before)}")
+
+
+def _list(directory: Path) -> None:
+    current = time.time()
+    ring = KeyRing(str(directory), reload_seconds=0)
+    keys = ring.keys()
+    signing = next((key for key in keys if key.not_before <= current), None)
+    prunable = {key.kid for key in prunable_keys(keys, current, max_token_lifetime())}
+    for key in keys:
+        if key is signing:
+            state = "signing"
+        elif key.not_before > current:
+            state = "published"
+        elif key.kid in prunable:
+            state = "prunable"
+        else:
+            state = "verifying"
+        print(f"{key.kid:<32} {key.algorithm:<6} {_format_time(key.not_before)}  {state}")
+
+
+def _prune(directory: Path) -> None:
+    keys = KeyRing(str(directory), reload_seconds=0).keys()
+    for key in prunable_keys(keys, time.time(), max_token_lifetime()):
+        (directory / f"{key.kid}.json").unlink()
+        print(f"Deleted key {key.kid}")
+
+
+def main(argv=None):
+    default_algorithm = settings.ALGORITHM if settings.ALGORITHM in ASYMMETRIC_ALGORITHMS else "ES256"
+    parser = argparse.ArgumentParser(description="Manage JWT signing keys")
+    parser.add_argument("--dir", default=settings.JWT_KEYS_DIR, help="key directory (default JWT_KEYS_DIR)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    rotate_parser = subparsers.add_parser("rotate", help="add a signing key")
+    rotate_parser.add_argument("--alg", default=default_algorithm, choices=ASYMMETRIC_ALGORITHMS)
+    rotate_parser.add_argument("--now", action="store_true", help="sign with it at once instead of after the activation delay")
+    rotate_parser.add_argument("--if-due", action="store_true", help="only if the newest key is JWT_KEY_ROTATION_DAYS old")
+    subparsers.add_parser("list", help="list keys and their state")
+    subparsers.add_parser("prune", help="delete keys no unexpired token can have been signed with")
+    subparsers.add_parser("jwks", help="print the public key set")
+    args = parser.parse_args(argv)
+    ensure_logging()
+
+    directory = Path(args.dir)
+    try:
+        if args.command == "rotate":
+            _rotate(directory, args.alg, args.now, args.if_due)
+        elif args.command == "list":
+            _list(directory)
+        elif args.command == "prune":
+            _prune(directory)
+        else:
+            print(KeyRing(str(directory), reload_seconds=0).jwks()[0].decode("utf-8"))
+    except Exception as e:
+        logger.error(f"Key command failed: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
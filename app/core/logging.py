@@ -1,13 +1,21 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import pickle
+import queue
+import socketserver
+import struct
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 from app.core.config import settings
+from app.core.metrics import log_records_dropped_total
 
-# Create logs directory if it doesn't exist
+# Created by setup_logging, not at import
 logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
 
 # Convert string log level to logging constant
 def get_log_level(level_str: str) -> int:
@@ -20,56 +28,193 @@ def get_log_level(level_str: str) -> int:
     }
     return level_map.get(level_str.upper(), logging.INFO)
 
-# Configure logging
-def setup_logging():
-    # Get log levels from settings
-    file_level = get_log_level(settings.LOG_FILE_LEVEL)
-    console_level = get_log_level(settings.LOG_CONSOLE_LEVEL)
-    root_level = get_log_level(settings.LOG_LEVEL)
-    
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s - %(message)s'
-    )
-    
-    simple_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s'
-    )
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler with a bounded buffer and an overflow policy.
+
+    Records are enqueued unformatted; the QueueListener thread does the
+    formatting and disk writes, keeping both off the event loop. Enqueueing
+    never waits: it runs on the event loop, and a full queue means the
+    listener is already behind.
+
+    Policies for a full queue: ``drop_new`` discards the incoming record,
+    ``drop_oldest`` the oldest queued one. Only records below WARNING are
+    discarded to make room; a warning or error replaces the oldest queued
+    DEBUG/INFO record under either policy, and is dropped only when the
+    whole queue is warnings and errors. Drops are counted in
+    ``log_records_dropped_total``.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = "drop_new"):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.enqueued = 0
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Formatting is left to the listener thread
+        return record
+
+    def _drop(self, record) -> None:
+        self.dropped += 1
+        log_records_dropped_total.labels(record.levelname).inc()
+
+    def _replace_oldest_low_record(self, record) -> bool:
+        # queue.Queue has no API for removing an arbitrary item, so this
+        # edits its deque under the queue's own lock
+        log_queue = self.queue
+        with log_queue.mutex:
+            for queued in log_queue.queue:
+                # None is the listener's stop sentinel
+                if queued is not None and queued.levelno < logging.WARNING:
+                    log_queue.queue.remove(queued)
+                    log_queue.queue.append(record)
+                    log_queue.not_empty.notify()
+                    break
+            else:
+                return False
+        self._drop(queued)
+        return True
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+            return
+        except queue.Full:
+            pass
+        if (record.levelno >= logging.WARNING or self.overflow == "drop_oldest") and self._replace_oldest_low_record(record):
+            self.enqueued += 1
+            return
+        self._drop(record)
+
+_installed_handlers = []
+_file_handlers = []
+_queue_handler: Optional[BoundedQueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def stop_logging():
+    """Flush queued records and stop the background listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(stop_logging)
+
+def get_log_queue_stats() -> dict:
+    if _queue_handler is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "size": _queue_handler.queue.qsize(),
+        "max_size": _queue_handler.queue.maxsize,
+        "overflow": _queue_handler.overflow,
+        "enqueued": _queue_handler.enqueued,
+        "dropped": _queue_handler.dropped,
+    }
+
+def _create_file_handlers(log_dir: Path, file_level: int, formatter: logging.Formatter):
+    log_dir.mkdir(exist_ok=True)
 
-    # Create handlers
     # Daily rotating file handler for all logs
     daily_handler = logging.handlers.TimedRotatingFileHandler(
-        filename=logs_dir / "app.log",
+        filename=log_dir / "app.log",
         when="midnight",
         interval=1,
         backupCount=30,  # Keep 30 days of logs  For unlimited retention put it to 0
         encoding="utf-8"
     )
     daily_handler.setLevel(file_level)
-    daily_handler.setFormatter(detailed_formatter)
+    daily_handler.setFormatter(formatter)
+    # Access records go to access.log instead
+    daily_handler.addFilter(lambda record: not record.name.startswith("app.access"))
 
     # Error log handler
     error_handler = logging.handlers.TimedRotatingFileHandler(
-        filename=logs_dir / "error.log",
+        filename=log_dir / "error.log",
         when="midnight",
         interval=1,
         backupCount=30,
         encoding="utf-8"
     )
     error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(detailed_formatter)
+    error_handler.setFormatter(formatter)
+
+    # Access log handler: one JSON document per line, ready to ship
+    access_handler = logging.handlers.TimedRotatingFileHandler(
+        filename=log_dir / "access.log",
+        when="midnight",
+        interval=1,
+        backupCount=30,
+        encoding="utf-8"
+    )
+    access_handler.setLevel(file_level)
+    access_handler.setFormatter(logging.Formatter('%(message)s'))
+    access_handler.addFilter(logging.Filter("app.access"))
+
+    return [daily_handler, error_handler, access_handler]
+
+# Configure logging
+def setup_logging(queue_enabled: Optional[bool] = None, log_dir: Optional[Path] = None):
+    global _queue_handler, _queue_listener
+    if queue_enabled is None:
+        queue_enabled = settings.LOG_QUEUE_ENABLED
+    log_dir = Path(log_dir) if log_dir else logs_dir
+
+    # Calling setup_logging again replaces the handlers it installed before
+    root_logger = logging.getLogger()
+    stop_logging()
+    for handler in _installed_handlers:
+        root_logger.removeHandler(handler)
+        handler.close()
+    _installed_handlers.clear()
+    _file_handlers.clear()
+    _queue_handler = None
+
+    # Get log levels from settings
+    file_level = get_log_level(settings.LOG_FILE_LEVEL)
+    console_level = get_log_level(settings.LOG_CONSOLE_LEVEL)
+    root_level = get_log_level(settings.LOG_LEVEL)
+    
+    # Create formatters
+    detailed_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s - %(message)s'
+    )
+    
+    simple_formatter = logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(message)s'
+    )
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(console_level)
     console_handler.setFormatter(simple_formatter)
 
+    if settings.LOG_SOCKET_PATH:
+        # A worker of python -m app.server: the launcher writes the files, so
+        # workers never race each other rotating them at midnight
+        socket_handler = logging.handlers.SocketHandler(settings.LOG_SOCKET_PATH, None)
+        socket_handler.setLevel(min(file_level, logging.ERROR))
+        handlers = [socket_handler, console_handler]
+    else:
+        _file_handlers.extend(_create_file_handlers(log_dir, file_level, detailed_formatter))
+        handlers = [*_file_handlers, console_handler]
+
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(root_level)
-    root_logger.addHandler(daily_handler)
-    root_logger.addHandler(error_handler)
-    root_logger.addHandler(console_handler)
+    if queue_enabled:
+        _queue_handler = BoundedQueueHandler(
+            queue.Queue(maxsize=settings.LOG_QUEUE_MAX_SIZE),
+            overflow=settings.LOG_QUEUE_OVERFLOW,
+        )
+        _queue_listener = logging.handlers.QueueListener(
+            _queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+        handlers = [_queue_handler]
+    for handler in handlers:
+        root_logger.addHandler(handler)
+        _installed_handlers.append(handler)
 
     # Configure specific loggers
     # FastAPI logger
@@ -90,8 +235,49 @@ def setup_logging():
 
     return app_logger
 
-# Create logger instance
-logger = setup_logging()
+def ensure_logging():
+    """Install the handlers unless setup_logging already ran.
+
+    Called from the entry points (server startup, CLI commands) rather than
+    at import, so importing the app opens no files and starts no threads.
+    """
+    if not _installed_handlers:
+        setup_logging()
+
+# Application logger; handlers are attached to the root logger by setup_logging
+logger = logging.getLogger("app")
+
+class _LogRecordStreamHandler(socketserver.StreamRequestHandler):
+    """Reads the length-prefixed pickled records a worker's SocketHandler sends"""
+
+    def handle(self):
+        while True:
+            header = self.rfile.read(4)
+            if len(header) < 4:
+                return
+            length = struct.unpack(">L", header)[0]
+            data = self.rfile.read(length)
+            if len(data) < length:
+                return
+            record = logging.makeLogRecord(pickle.loads(data))
+            for handler in _file_handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+def start_log_writer() -> Optional[str]:
+    """Write the worker processes' file records from this process (python -m app.server).
+
+    Returns the socket path to hand to the workers as LOG_SOCKET_PATH, or
+    None where Unix sockets are unavailable.
+    """
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        logger.warning("Unix sockets unavailable: each worker writes (and rotates) the log files itself")
+        return None
+    path = os.path.join(tempfile.mkdtemp(prefix="fastapi_logs_"), "log.sock")
+    server = socketserver.ThreadingUnixStreamServer(path, _LogRecordStreamHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="log-writer", daemon=True).start()
+    return path
 
 # Custom exception logging decorator
 def log_exceptions(func):
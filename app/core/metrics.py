@@ -0,0 +1,314 @@
+import asyncio
+import bisect
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Per-worker metrics with Prometheus text exposition.
+#
+# Metrics are plain in-process counters updated from the event loop thread,
+# so recording is a dict lookup and an add with no locking. When
+# METRICS_MULTIPROC_DIR is set every worker also writes a snapshot there
+# and /metrics merges the snapshots of all workers: counters and histograms
+# are summed, gauges are reported per live worker with a ``pid`` label.
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Sequence[float]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric:
+    type = ""
+    _child_class = _CounterChild
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def _new_child(self):
+        return self._child_class()
+
+    def labels(self, *labelvalues):
+        child = self._children.get(labelvalues)
+        if child is None:
+            if len(labelvalues) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._children[labelvalues] = self._new_child()
+        return child
+
+    def snapshot(self) -> dict:
+        return {
+            "type": self.type,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "samples": {json.dumps(list(k)): self._dump_child(c) for k, c in self._children.items()},
+        }
+
+    def _dump_child(self, child):
+        return child.value
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    type = "gauge"
+    _child_class = _GaugeChild
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def snapshot(self) -> dict:
+        snapshot = super().snapshot()
+        snapshot["buckets"] = list(self.buckets)
+        return snapshot
+
+    def _dump_child(self, child):
+        return {"counts": list(child.counts), "sum": child.sum, "count": child.count}
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._refresh_hooks: List[Callable[[], None]] = []
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_refresh_hook(self, hook: Callable[[], None]):
+        """Register a callback that updates gauges right before they are read"""
+        self._refresh_hooks.append(hook)
+
+    def snapshot(self) -> dict:
+        for hook in self._refresh_hooks:
+            hook()
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def render(self, multiproc_dir: Optional[str] = None) -> str:
+        snapshots = {os.getpid(): self.snapshot()}
+        if multiproc_dir:
+            snapshots.update(_read_worker_snapshots(multiproc_dir, exclude=os.getpid()))
+        return _render(_merge(snapshots, per_pid_gauges=bool(multiproc_dir)))
+
+
+# Multi-process aggregation
+
+def _snapshot_path(directory: str, pid: int) -> Path:
+    return Path(directory) / f"metrics_{pid}.json"
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _read_worker_snapshots(directory: str, exclude: int) -> Dict[int, dict]:
+    snapshots = {}
+    for path in Path(directory).glob("metrics_*.json"):
+        try:
+            pid = int(path.stem.split("_", 1)[1])
+            if pid == exclude:
+                continue
+            with open(path, encoding="utf-8") as f:
+                snapshots[pid] = json.load(f)
+        except (ValueError, OSError):
+            continue
+    return snapshots
+
+def write_snapshot(directory: str, snapshot: Optional[dict] = None):
+    """Atomically publish this worker's metrics for the other workers"""
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    data = json.dumps(snapshot if snapshot is not None else registry.snapshot(), separators=(",", ":"))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics_")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp, _snapshot_path(directory, os.getpid()))
+
+def _merge(snapshots: Dict[int, dict], per_pid_gauges: bool) -> dict:
+    merged: Dict[str, dict] = {}
+    for pid, snapshot in snapshots.items():
+        gauge_pid_alive = None
+        for name, metric in snapshot.items():
+            target = merged.setdefault(name, {**metric, "samples": {}})
+            labelnames = list(metric["labelnames"])
+            if metric["type"] == "gauge" and per_pid_gauges:
+                if gauge_pid_alive is None:
+                    gauge_pid_alive = pid == os.getpid() or _pid_alive(pid)
+                if not gauge_pid_alive:
+                    continue
+                target["labelnames"] = labelnames + ["pid"]
+                for key, value in metric["samples"].items():
+                    target["samples"][json.dumps(json.loads(key) + [str(pid)])] = value
+                continue
+            for key, value in metric["samples"].items():
+                if metric["type"] == "histogram":
+                    current = target["samples"].setdefault(
+                        key, {"counts": [0] * len(value["counts"]), "sum": 0.0, "count": 0}
+                    )
+                    current["counts"] = [a + b for a, b in zip(current["counts"], value["counts"])]
+                    current["sum"] += value["sum"]
+                    current["count"] += value["count"]
+                else:
+                    target["samples"][key] = target["samples"].get(key, 0.0) + value
+    return merged
+
+
+# Text exposition format
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: List[str], values: List[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+def _render(merged: Dict[str, dict]) -> str:
+    lines = []
+    for name, metric in merged.items():
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        labelnames = metric["labelnames"]
+        for key, value in metric["samples"].items():
+            labelvalues = json.loads(key)
+            if metric["type"] == "histogram":
+                cumulative = 0
+                bounds = list(metric["buckets"]) + [float("inf")]
+                for bound, count in zip(bounds, value["counts"]):
+                    cumulative += count
+                    le = _format_labels(labelnames, labelvalues, ("le", _format_value(bound)))
+                    lines.append(f"{name}_bucket{le} {cumulative}")
+                labels = _format_labels(labelnames, labelvalues)
+                lines.append(f"{name}_sum{labels} {_format_value(value['sum'])}")
+                lines.append(f"{name}_count{labels} {value['count']}")
+            else:
+                lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# Application metrics
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by method, route template and status", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template", ("method", "route")
+)
+http_requests_in_progress = registry.gauge(
+    "http_requests_in_progress", "HTTP requests currently being served", ("method",)
+)
+http_request_db_queries = registry.histogram(
+    "http_request_db_queries", "Database queries issued per HTTP request", ("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+)
+http_request_db_seconds = registry.histogram(
+    "http_request_db_seconds", "Time spent in database queries per HTTP request", ("route",)
+)
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds", "Duration of individual database queries"
+)
+password_hash_duration_seconds = registry.histogram(
+    "password_hash_duration_seconds", "Password hash/verify time including pool queueing", ("operation",),
+    buckets=(0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+password_hash_rejected_total = registry.counter(
+    "password_hash_rejected_total", "Password operations rejected because the pool was saturated"
+)
+password_rehash_total = registry.counter(
+    "password_rehash_total", "Password hashes replaced at login to match the hashing policy"
+)
+log_records_dropped_total = registry.counter(
+    "log_records_dropped_total", "Log records discarded because the log queue was full", ("level",)
+)
+
+
+async def run_snapshot_writer(directory: str, interval: float):
+    """Background task publishing this worker's metrics every ``interval`` seconds"""
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            # Snapshot on the event loop thread, write the file off it
+            await loop.run_in_executor(None, write_snapshot, directory, registry.snapshot())
+    except asyncio.CancelledError:
+        write_snapshot(directory)
+        raise
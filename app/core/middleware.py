@@ -0,0 +1,80 @@
+import time
+import traceback
+from typing import Optional
+
+from app.core.access_log import access_log
+from app.core.config import settings
+from app.core.database import request_db_stats
+from app.core.logging import logger
+from app.core.metrics import (
+    http_requests_total, http_request_duration_seconds, http_requests_in_progress,
+    http_request_db_queries, http_request_db_seconds,
+)
+
+
+def record_request(scope, status_code: int, duration: float, db_stats: list,
+                   bytes_sent: Optional[int] = None, error: Optional[str] = None):
+    """Feed one finished request into the metrics and the access log"""
+    route = getattr(scope.get("route"), "path", None)
+    method = scope["method"]
+    if settings.METRICS_ENABLED:
+        # Unmatched paths share one label so scanners cannot blow up cardinality
+        route_label = route or "unmatched"
+        http_requests_total.labels(method, route_label, str(status_code)).inc()
+        http_request_duration_seconds.labels(method, route_label).observe(duration)
+        http_request_db_queries.labels(route_label).observe(db_stats[0])
+        http_request_db_seconds.labels(route_label).observe(db_stats[1])
+    access_log.log(
+        method,
+        route or scope["path"],
+        status_code,
+        duration * 1000,
+        user_id=scope.get("state", {}).get("user_id"),
+        bytes_sent=bytes_sent,
+        error=error,
+    )
+
+
+class RequestLoggingMiddleware:
+    """Times every HTTP request, records metrics/access log and logs failures.
+
+    Written as plain ASGI rather than with ``@app.middleware("http")`` so the
+    response is passed straight through: no extra task per request and
+    streaming bodies keep their back-pressure.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        bytes_sent = 0
+        db_stats = [0, 0.0]
+        token = request_db_stats.set(db_stats)
+        in_progress = http_requests_in_progress.labels(scope["method"])
+        in_progress.inc()
+
+        async def send_wrapper(message):
+            nonlocal status_code, bytes_sent
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                bytes_sent += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            record_request(scope, 500, time.perf_counter() - start_time, db_stats, bytes_sent, error=str(e))
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            raise
+        else:
+            record_request(scope, status_code, time.perf_counter() - start_time, db_stats, bytes_sent)
+        finally:
+            in_progress.dec()
+            request_db_stats.reset(token)
@@ -0,0 +1,185 @@
+"""
+Versioned SQL migrations
+
+Migrations are the ``migrations/NNNN_name.sql`` files at the repository
+root, applied in version order and recorded in the ``schema_migrations``
+table. Apply them once per deploy, before the workers start:
+
+    python -m app.core.migrations upgrade
+    python -m app.core.migrations status
+
+Each file runs in its own transaction unless its first line is
+``-- migrate: no-transaction`` (needed for CREATE INDEX CONCURRENTLY);
+such files must hold a single statement, since Postgres wraps a
+multi-statement query string in an implicit transaction.
+Workers never migrate; on startup they only compare the recorded version
+with the newest file (``verify_schema_version``).
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from sqlalchemy import exc, text
+
+from app.core.config import settings
+from app.core.logging import ensure_logging, logger
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+VERSION_TABLE = "schema_migrations"
+NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+# Arbitrary key for pg_advisory_lock so concurrent upgrades run one at a time
+ADVISORY_LOCK_KEY = 7419283342
+
+_FILENAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+
+class SchemaVersionError(RuntimeError):
+    """The database schema is missing or older than this code expects"""
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    path: Path
+
+    @property
+    def sql(self) -> str:
+        return self.path.read_text(encoding="utf-8")
+
+    @property
+    def transactional(self) -> bool:
+        return not self.sql.lstrip().startswith(NO_TRANSACTION_MARKER)
+
+
+def discover_migrations(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    migrations = []
+    for path in sorted(directory.glob("*.sql")):
+        match = _FILENAME.match(path.name)
+        if not match:
+            raise ValueError(f"Migration file name must look like 0001_name.sql: {path.name}")
+        migrations.append(Migration(int(match.group(1)), match.group(2), path))
+    versions = [m.version for m in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"Duplicate migration versions in {directory}")
+    return sorted(migrations, key=lambda m: m.version)
+
+
+def expected_schema_version(directory: Path = MIGRATIONS_DIR) -> int:
+    migrations = discover_migrations(directory)
+    return migrations[-1].version if migrations else 0
+
+
+def _asyncpg_dsn() -> str:
+    return settings.SQLALCHEMY_DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+async def _applied_versions(conn) -> List[int]:
+    await conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE} ("
+        "version INTEGER PRIMARY KEY, "
+        "name VARCHAR NOT NULL, "
+        "applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now())"
+    )
+    return [row["version"] for row in await conn.fetch(f"SELECT version FROM {VERSION_TABLE} ORDER BY version")]
+
+
+async def upgrade(target: Optional[int] = None, directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """Apply pending migrations up to ``target`` (all by default); returns those applied"""
+    import asyncpg
+
+    conn = await asyncpg.connect(_asyncpg_dsn())
+    applied: List[Migration] = []
+    try:
+        await conn.execute("SELECT pg_advisory_lock($1)", ADVISORY_LOCK_KEY)
+        try:
+            done = set(await _applied_versions(conn))
+            for migration in discover_migrations(directory):
+                if migration.version in done or (target is not None and migration.version > target):
+                    continue
+                logger.info(f"Applying migration {migration.version:04d}_{migration.name}")
+                record = f"INSERT INTO {VERSION_TABLE} (version, name) VALUES ($1, $2)"
+                # asyncpg runs an argument-less execute() as a simple query,
+                # so a file may hold several statements
+                if migration.transactional:
+                    async with conn.transaction():
+                        await conn.execute(migration.sql)
+                        await conn.execute(record, migration.version, migration.name)
+                else:
+                    await conn.execute(migration.sql)
+                    await conn.execute(record, migration.version, migration.name)
+                applied.append(migration)
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", ADVISORY_LOCK_KEY)
+    finally:
+        await conn.close()
+
+    version = max(done | {m.version for m in applied}, default=0)
+    logger.info(f"Migrations complete: {len(applied)} applied, schema at version {version}")
+    return applied
+
+
+async def current_schema_version(engine) -> Optional[int]:
+    """Recorded schema version, or None when migrations were never run"""
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text(f"SELECT max(version) FROM {VERSION_TABLE}"))
+        except exc.ProgrammingError:
+            return None
+        return result.scalar() or 0
+
+
+async def verify_schema_version(engine) -> int:
+    """Worker startup check: one query, no DDL, no catalog inspection"""
+    expected = expected_schema_version()
+    current = await current_schema_version(engine)
+    if current is None or current < expected:
+        raise SchemaVersionError(
+            f"Database schema is at version {current or 0}, this build needs {expected}; "
+            "run `python -m app.core.migrations upgrade`"
+        )
+    if current > expected:
+        # Normal during a rolling deploy: the database was migrated for a newer build
+        logger.warning(f"Database schema version {current} is newer than this build ({expected})")
+    return current
+
+
+async def _status():
+    import asyncpg
+
+    conn = await asyncpg.connect(_asyncpg_dsn())
+    try:
+        done = set(await _applied_versions(conn))
+    finally:
+        await conn.close()
+    for migration in discover_migrations():
+        state = "applied" if migration.version in done else "pending"
+        print(f"{migration.version:04d}_{migration.name:<40} {state}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply or inspect database migrations")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    upgrade_parser = subparsers.add_parser("upgrade", help="apply pending migrations")
+    upgrade_parser.add_argument("--target", type=int, help="stop after this version")
+    subparsers.add_parser("status", help="list migrations and whether they are applied")
+    args = parser.parse_args(argv)
+    ensure_logging()
+
+    try:
+        if args.command == "upgrade":
+            asyncio.run(upgrade(args.target))
+        else:
+            asyncio.run(_status())
+    except Exception as e:
+        logger.error(f"Migration command failed: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
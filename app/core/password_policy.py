@@ -0,0 +1,142 @@
+"""
+Password hashing policy
+
+PASSWORD_SCHEMES lists the accepted hash schemes; the first one hashes new
+passwords and the rest are only verified. At login a hash in an older
+scheme, or under the configured cost, is replaced by one made under the
+current policy (PASSWORD_REHASH_ON_LOGIN), so raising the cost or moving
+to a memory-hard scheme needs no password resets.
+
+The cost sets how long each login and registration holds a CPU core, and
+so the logins per second per core. Measure it on the target machine:
+
+    python -m app.core.password_policy calibrate --target-ms 250
+    python -m app.core.password_policy calibrate --scheme scrypt --target-ms 100
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from app.core.config import settings
+from app.core.logging import ensure_logging, logger
+
+SUPPORTED_SCHEMES = ("bcrypt", "scrypt", "argon2")
+
+# The cost parameter each scheme is calibrated on, and its range
+_CALIBRATION_RANGE = {
+    "bcrypt": range(4, 20),  # rounds, log2 of the iterations
+    "scrypt": range(10, 21),  # rounds, log2 of N
+    "argon2": range(1, 21),  # rounds, the argon2 time cost
+}
+
+
+def configured_schemes() -> List[str]:
+    schemes = [scheme.strip() for scheme in settings.PASSWORD_SCHEMES.split(",") if scheme.strip()]
+    unknown = [scheme for scheme in schemes if scheme not in SUPPORTED_SCHEMES]
+    if not schemes or unknown:
+        raise ValueError(
+            f"PASSWORD_SCHEMES must list schemes from {', '.join(SUPPORTED_SCHEMES)}, got {settings.PASSWORD_SCHEMES!r}"
+        )
+    return schemes
+
+
+def configured_costs() -> Dict[str, Dict[str, int]]:
+    """Cost parameters per scheme, as passlib option names"""
+    return {
+        "bcrypt": {"rounds": settings.PASSWORD_BCRYPT_ROUNDS},
+        "scrypt": {"rounds": settings.PASSWORD_SCRYPT_ROUNDS, "block_size": settings.PASSWORD_SCRYPT_BLOCK_SIZE},
+        "argon2": {
+            "rounds": settings.PASSWORD_ARGON2_TIME_COST,
+            "memory_cost": settings.PASSWORD_ARGON2_MEMORY_KIB,
+            "parallelism": settings.PASSWORD_ARGON2_PARALLELISM,
+        },
+    }
+
+
+def build_context(schemes: List[str], costs: Dict[str, Dict[str, int]]):
+    from passlib.context import CryptContext
+
+    options = {}
+    for scheme in schemes:
+        for name, value in costs.get(scheme, {}).items():
+            options[f"{scheme}__{name}"] = value
+        if "rounds" in costs.get(scheme, {}):
+            # Makes needs_update() true for hashes made with fewer rounds
+            options[f"{scheme}__min_rounds"] = costs[scheme]["rounds"]
+    # Every scheme but the first is deprecated, so its hashes are replaced too
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+def measure_hash_ms(context, samples: int) -> float:
+    """Median time of one hash under ``context``; a verify costs the same"""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.hash("calibration-password")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(scheme: str, target_ms: float, samples: int = 5) -> Iterator[Tuple[int, float]]:
+    """Yield (rounds, hash ms) at increasing cost until one exceeds ``target_ms``.
+
+    The other cost parameters (scrypt block size, argon2 memory and
+    parallelism) stay as configured.
+    """
+    costs = configured_costs()
+    for rounds in _CALIBRATION_RANGE[scheme]:
+        cost = {**costs[scheme], "rounds": rounds}
+        elapsed_ms = measure_hash_ms(build_context([scheme], {scheme: cost}), samples)
+        yield rounds, elapsed_ms
+        if elapsed_ms > target_ms:
+            return
+
+
+def _rounds_setting(scheme: str) -> str:
+    return {
+        "bcrypt": "PASSWORD_BCRYPT_ROUNDS",
+        "scrypt": "PASSWORD_SCRYPT_ROUNDS",
+        "argon2": "PASSWORD_ARGON2_TIME_COST",
+    }[scheme]
+
+
+def _calibrate_command(scheme: str, target_ms: float, samples: int) -> None:
+    cores = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+    print(f"{scheme}: hash time per cost on this machine (median of {samples}), target {target_ms:g} ms")
+    print(f"{'rounds':>8}{'hash_ms':>12}{'logins/s/core':>16}{f'logins/s x{cores}':>18}")
+    recommended = None
+    for rounds, elapsed_ms in calibrate(scheme, target_ms, samples):
+        print(f"{rounds:>8}{elapsed_ms:>12.1f}{1000 / elapsed_ms:>16.1f}{cores * 1000 / elapsed_ms:>18.1f}")
+        if elapsed_ms <= target_ms or recommended is None:
+            recommended = rounds
+
+    configured = configured_costs()[scheme]["rounds"]
+    print(f"\nRecommended: {_rounds_setting(scheme)}={recommended} (configured: {configured})")
+    if scheme == "scrypt":
+        print(f"Memory per hash: {128 * settings.PASSWORD_SCRYPT_BLOCK_SIZE * 2 ** recommended // 2 ** 20} MiB")
+    print("Login throughput counts one verify per login with the hashing pool on every core.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and tune the password hashing policy")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    calibrate_parser = subparsers.add_parser("calibrate", help="recommend a cost for a target hash time")
+    calibrate_parser.add_argument("--scheme", choices=SUPPORTED_SCHEMES, help="default: the first of PASSWORD_SCHEMES")
+    calibrate_parser.add_argument("--target-ms", type=float, default=250.0, help="longest acceptable hash time")
+    calibrate_parser.add_argument("--samples", type=int, default=5, help="hashes timed per cost")
+    args = parser.parse_args(argv)
+    ensure_logging()
+
+    try:
+        _calibrate_command(args.scheme or configured_schemes()[0], args.target_ms, args.samples)
+    except Exception as e:
+        logger.error(f"Password policy command failed: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import password_hash_duration_seconds, password_hash_rejected_total
+from app.core.security import get_pwd_context
+
+
+class PasswordServiceBusy(Exception):
+    """Raised when too many hash/verify calls are already queued"""
+
+
+# Executed inside the pool workers. They stay free of logging so child
+# processes never write to the parent's log files.
+
+def _init_worker() -> None:
+    """Set up a fresh pool worker: problems go to stderr, and the passlib
+    context is built before the first request waits on it"""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - password worker - %(message)s'))
+    logging.basicConfig(level=logging.WARNING, handlers=[handler])
+    get_pwd_context()
+
+def _hash_password(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+def _verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return get_pwd_context().verify_and_update(plain_password, hashed_password)
+
+
+class PasswordService:
+    """Runs password hashing off the event loop with bounded queueing.
+
+    ``executor`` is one of ``process`` (default, a pool sized to the CPU
+    count, or its share of the CPUs under python -m app.server), ``thread`` or ``inline`` (run on the event loop, the old
+    behaviour; useful for debugging and benchmarks).
+    """
+
+    def __init__(self, executor: str = "process", workers: int = 0, max_pending: int = 64):
+        self.executor_type = executor
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self.executor_type == "inline":
+            return None
+        if self._executor is None:
+            if self.executor_type == "thread":
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password"
+                )
+            else:
+                # The pool starts inside the running server, which already has
+                # threads (event loop executor, log listener); forking that
+                # can deadlock a child, so workers come from a clean process
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=_init_worker,
+                )
+            logger.info(f"Password {self.executor_type} pool started with {self.workers} workers")
+        return self._executor
+
+    async def _run(self, operation: str, func, *args):
+        if self.max_pending and self.pending >= self.max_pending:
+            self.rejected += 1
+            password_hash_rejected_total.inc()
+            logger.warning(f"Password service saturated: {self.pending} calls pending")
+            raise PasswordServiceBusy()
+
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            executor = self._get_executor()
+            if executor is None:
+                return func(*args)
+            return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+        finally:
+            self.pending -= 1
+            password_hash_duration_seconds.labels(operation).observe(time.perf_counter() - start)
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._run("hash", _hash_password, password)
+        logger.debug("Password hashed successfully")
+        return hashed
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        try:
+            result = await self._run("verify", _verify_password, plain_password, hashed_password)
+        except PasswordServiceBusy:
+            raise
+        except Exception as e:
+            logger.error(f"Password verification error: {str(e)}")
+            return False
+        logger.debug(f"Password verification: {'success' if result else 'failed'}")
+        return result
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify, and return a replacement hash when ``hashed_password`` no longer meets the policy"""
+        try:
+            result, new_hash = await self._run("verify", _verify_and_update, plain_password, hashed_password)
+        except PasswordServiceBusy:
+            raise
+        except Exception as e:
+            logger.error(f"Password verification error: {str(e)}")
+            return False, None
+        logger.debug(f"Password verification: {'success' if result else 'failed'}{', rehashed' if new_hash else ''}")
+        return result, new_hash
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+            logger.info("Password pool shut down")
+
+
+password_service = PasswordService(
+    executor=settings.PASSWORD_HASH_EXECUTOR,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
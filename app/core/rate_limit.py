@@ -0,0 +1,151 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import registry
+
+rate_limit_rejected_total = registry.counter(
+    "rate_limit_rejected_total", "Requests rejected by a rate limit", ("limit",)
+)
+
+
+class RateLimitBackend(ABC):
+    """Token buckets keyed by limit name and caller (IP, username, ...).
+
+    The in-memory backend below is per worker process, so with N workers a
+    caller can get up to N times the configured rate; deployments that need
+    exact limits can plug in a shared backend (e.g. Redis) with
+    ``set_rate_limiter``.
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, capacity: int, refill_per_second: float) -> float:
+        """Take one token; returns 0 when allowed, else seconds until one is available"""
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        ...
+
+
+class InMemoryRateLimiter(RateLimitBackend):
+    """Token buckets held in the worker process, bounded by LRU on keys"""
+
+    def __init__(self, max_keys: int = 100000, clock=time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+        self.allowed = 0
+        self.rejected = 0
+        self.evictions = 0
+
+    def acquire(self, key: str, capacity: int, refill_per_second: float) -> float:
+        now = self._clock()
+        entry = self._buckets.get(key)
+        if entry is None:
+            tokens = float(capacity)
+        else:
+            tokens, updated_at = entry
+            tokens = min(float(capacity), tokens + (now - updated_at) * refill_per_second)
+            self._buckets.move_to_end(key)
+
+        if tokens >= 1.0:
+            self._buckets[key] = (tokens - 1.0, now)
+            self.allowed += 1
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+            return 0.0
+
+        self._buckets[key] = (tokens, now)
+        self.rejected += 1
+        return (1.0 - tokens) / refill_per_second
+
+    def reset(self, key: str) -> None:
+        self._buckets.pop(key, None)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "keys": len(self._buckets),
+            "max_keys": self.max_keys,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "evictions": self.evictions,
+        }
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """``requests`` per ``period_seconds``, allowing bursts of up to ``requests``"""
+
+    name: str
+    requests: int
+    period_seconds: float
+
+    def _key(self, identifier: str) -> str:
+        return f"{self.name}:{identifier}"
+
+    def check(self, identifier: str) -> None:
+        """Raise 429 with Retry-After when ``identifier`` is over the limit"""
+        if not settings.RATE_LIMIT_ENABLED or self.requests <= 0 or _rate_limiter is None:
+            return
+        retry_after = _rate_limiter.acquire(
+            self._key(identifier), self.requests, self.requests / self.period_seconds
+        )
+        if retry_after > 0:
+            rate_limit_rejected_total.labels(self.name).inc()
+            logger.warning(f"Rate limit {self.name} exceeded for {identifier}, retry in {retry_after:.1f}s")
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests, please retry later",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+
+    def reset(self, identifier: str) -> None:
+        if _rate_limiter is not None:
+            _rate_limiter.reset(self._key(identifier))
+
+
+def client_ip(request: Request) -> str:
+    # Behind a reverse proxy run uvicorn with --proxy-headers and
+    # --forwarded-allow-ips so this is the real client address
+    return request.client.host if request.client else "unknown"
+
+
+def limit_by_ip(limit: RateLimit):
+    """Route dependency enforcing ``limit`` per client IP"""
+
+    async def dependency(request: Request):
+        limit.check(client_ip(request))
+
+    return dependency
+
+
+_rate_limiter: Optional[RateLimitBackend] = InMemoryRateLimiter(settings.RATE_LIMIT_MAX_KEYS)
+
+
+def get_rate_limiter() -> Optional[RateLimitBackend]:
+    return _rate_limiter
+
+
+def set_rate_limiter(backend: Optional[RateLimitBackend]) -> None:
+    """Replace the rate limit backend; ``None`` disables rate limiting"""
+    global _rate_limiter
+    _rate_limiter = backend
\ No newline at end of file
@@ -0,0 +1,192 @@
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from fastapi import Response
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.etag) + sum(len(k) + len(v) for k, v in self.headers.items())
+
+
+class ResponseCacheBackend(ABC):
+    """Encoded GET responses per user, keyed by path and query string.
+
+    Callers only reuse an entry whose ETag matches the version they just
+    read from the database, so entries left behind in another worker's
+    cache after a write are never served. Entries are also dropped for the
+    whole user whenever that user writes items through this worker.
+    """
+
+    @abstractmethod
+    def get(self, user_id: int, key: str) -> Optional[CachedResponse]:
+        ...
+
+    @abstractmethod
+    def set(self, user_id: int, key: str, response: CachedResponse) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate_user(self, user_id: int) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        ...
+
+
+class InMemoryResponseCache(ResponseCacheBackend):
+    """TTL + LRU cache bounded by the total size of the cached responses"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entry_bytes: int = 1024 * 1024,
+                 ttl_seconds: float = 30.0, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[int, str], tuple]" = OrderedDict()
+        self._keys_by_user: Dict[int, set] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _remove(self, entry_key: Tuple[int, str]) -> None:
+        response, _ = self._entries.pop(entry_key)
+        self.bytes -= response.size + len(entry_key[1])
+        user_keys = self._keys_by_user.get(entry_key[0])
+        if user_keys is not None:
+            user_keys.discard(entry_key[1])
+            if not user_keys:
+                del self._keys_by_user[entry_key[0]]
+
+    def get(self, user_id: int, key: str) -> Optional[CachedResponse]:
+        entry_key = (user_id, key)
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        response, expires_at = entry
+        if expires_at <= self._clock():
+            self._remove(entry_key)
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(entry_key)
+        self.hits += 1
+        return response
+
+    def set(self, user_id: int, key: str, response: CachedResponse) -> None:
+        size = response.size + len(key)
+        if size > self.max_entry_bytes or size > self.max_bytes:
+            return
+        entry_key = (user_id, key)
+        if entry_key in self._entries:
+            self._remove(entry_key)
+        self._entries[entry_key] = (response, self._clock() + self.ttl_seconds)
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        for key in list(self._keys_by_user.get(user_id, ())):
+            self._remove((user_id, key))
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._keys_by_user.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def compute_etag(rows: Iterable[Tuple[int, datetime]], *extra: Optional[str]) -> str:
+    """Strong ETag over the (id, created_at) of every row in the response.
+
+    Items are immutable once created, so the id set plus creation times
+    identify the body; ``extra`` covers anything else in the response,
+    such as the next-page cursor.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for item_id, created_at in rows:
+        digest.update(f"{item_id}:{created_at.isoformat()};".encode())
+    for value in extra:
+        digest.update(f"|{value or ''}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison as required for If-None-Match (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in candidates)
+
+
+def render_cached(response: CachedResponse, if_none_match: Optional[str]) -> Response:
+    """304 when the client already holds ``response``, the full body otherwise"""
+    headers = {**response.headers, "ETag": response.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, response.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=response.body, headers=headers, media_type="application/json")
+
+
+_response_cache: Optional[ResponseCacheBackend] = (
+    InMemoryResponseCache(
+        settings.RESPONSE_CACHE_MAX_BYTES,
+        settings.RESPONSE_CACHE_MAX_ENTRY_BYTES,
+        settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+    if settings.RESPONSE_CACHE_ENABLED else None
+)
+
+
+def get_response_cache() -> Optional[ResponseCacheBackend]:
+    return _response_cache
+
+
+def set_response_cache(backend: Optional[ResponseCacheBackend]) -> None:
+    """Replace the cache backend; ``None`` disables caching"""
+    global _response_cache
+    _response_cache = backend
+
+
+def invalidate_user_responses(user_id: int) -> None:
+    """Drop every cached response of a user after their items changed"""
+    if _response_cache is not None:
+        _response_cache.invalidate_user(user_id)
\ No newline at end of file
@@ -0,0 +1,41 @@
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+
+def json_response(adapter: TypeAdapter, data: Any, status_code: int = 200,
+                  headers: Optional[Dict[str, str]] = None) -> Any:
+    """Validate and encode ``data`` with pydantic-core in a single pass.
+
+    Returns a ready ``Response`` so FastAPI skips its own response-model
+    validation, ``jsonable_encoder`` step and stdlib ``json.dumps``. With
+    FAST_JSON_RESPONSES disabled the data is returned untouched and goes
+    through FastAPI's default pipeline; in that case ``headers`` must be set
+    on the injected response by the caller.
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return data
+    body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
+
+
+
+def encode_json(adapter: TypeAdapter, data: Any) -> bytes:
+    """Encode ``data`` for a body FastAPI never serializes itself (cached or
+    streamed responses).
+
+    With FAST_JSON_RESPONSES disabled this takes the default pipeline's
+    steps instead, ``jsonable_encoder`` then ``json.dumps`` as Starlette's
+    JSONResponse renders it, so the setting covers these responses too.
+    """
+    value = adapter.validate_python(data, from_attributes=True)
+    if settings.FAST_JSON_RESPONSES:
+        return adapter.dump_json(value)
+    return json.dumps(
+        jsonable_encoder(value), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"),
+    ).encode("utf-8")
\ No newline at end of file
@@ -0,0 +1,224 @@
+import asyncio
+import hashlib
+import math
+import struct
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import logger
+from app.core.metrics import registry
+from app.models.revoked_token import RevokedToken
+
+token_revocation_checks_total = registry.counter(
+    "token_revocation_checks_total",
+    "Access token revocation checks by result (bloom_negative, revoked, false_positive, unfiltered)",
+    ("result",),
+)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Sized for ``capacity`` keys at ``fp_rate``. The k bit positions are
+    k 32-bit words of a single blake2b digest, so k is capped at 16 (a
+    64-byte digest), which is optimal down to an fp_rate of about 1e-5.
+    """
+
+    MAX_HASHES = 16
+
+    def __init__(self, capacity: int, fp_rate: float):
+        self.capacity = max(1, capacity)
+        self.size_bits = max(64, math.ceil(-self.capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.hash_count = min(self.MAX_HASHES, max(1, round(self.size_bits / self.capacity * math.log(2))))
+        self._bits = bytearray((self.size_bits + 7) // 8)
+        self._unpack = struct.Struct(f"<{self.hash_count}I").unpack
+        self._digest_size = 4 * self.hash_count
+        self.count = 0
+
+    def _positions(self, key: str) -> List[int]:
+        size = self.size_bits
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=self._digest_size).digest()
+        return [word % size for word in self._unpack(digest)]
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def expected_fp_rate(self) -> float:
+        """False positive rate for the keys added so far"""
+        return (1.0 - math.exp(-self.hash_count * self.count / self.size_bits)) ** self.hash_count
+
+
+def _revoked_query(jti: str):
+    return select(RevokedToken.jti).where(RevokedToken.jti == jti)
+
+
+class RevocationList:
+    """Revoked access-token ids, with a Bloom filter in front of revoked_tokens.
+
+    A jti missing from the filter is certainly not revoked and is answered
+    without a query; a hit may be a false positive and is confirmed in
+    Postgres. The filter is rebuilt from the table every
+    REVOCATION_REBUILD_SECONDS, which is how logouts handled by other
+    workers arrive. Until the first build every check queries the table.
+    """
+
+    def __init__(self, fp_rate: float = 0.001, min_capacity: int = 10000):
+        self.fp_rate = fp_rate
+        self.min_capacity = min_capacity
+        self._filter: Optional[BloomFilter] = None
+        self._added_during_rebuild: Optional[List[str]] = None
+        self.rebuilt_at: Optional[float] = None
+        self.rebuilds = 0
+        self.checks = 0
+        self.bloom_negatives = 0
+        self.revoked = 0
+        self.false_positives = 0
+
+    def add(self, jti: str) -> None:
+        """Record a revocation made by this worker, visible before the next rebuild"""
+        if self._filter is not None:
+            self._filter.add(jti)
+        if self._added_during_rebuild is not None:
+            self._added_during_rebuild.append(jti)
+
+    def build(self, jtis: Iterable[str]) -> BloomFilter:
+        jtis = list(jtis)
+        # Headroom so the revocations added until the next rebuild keep the rate
+        bloom = BloomFilter(max(self.min_capacity, 2 * len(jtis)), self.fp_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        return bloom
+
+    def install(self, bloom: BloomFilter) -> None:
+        for jti in self._added_during_rebuild or ():
+            bloom.add(jti)
+        self._filter = bloom
+        self.rebuilt_at = time.time()
+        self.rebuilds += 1
+
+    async def is_revoked(self, db: AsyncSession, jti: str) -> bool:
+        self.checks += 1
+        if self._filter is not None and jti not in self._filter:
+            self.bloom_negatives += 1
+            token_revocation_checks_total.labels("bloom_negative").inc()
+            return False
+
+        revoked = (await db.execute(_revoked_query(jti))).first() is not None
+        if revoked:
+            self.revoked += 1
+            token_revocation_checks_total.labels("revoked").inc()
+        elif self._filter is not None:
+            self.false_positives += 1
+            token_revocation_checks_total.labels("false_positive").inc()
+        else:
+            token_revocation_checks_total.labels("unfiltered").inc()
+        return revoked
+
+    async def rebuild(self) -> None:
+        """Reload the filter from revoked_tokens and purge expired rows"""
+        self._added_during_rebuild = []
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(RevokedToken).where(RevokedToken.expires_at < func.now()))
+                await session.commit()
+                result = await session.execute(
+                    select(RevokedToken.jti).where(
+                        RevokedToken.token_type == "access", RevokedToken.expires_at > func.now()
+                    )
+                )
+                jtis = result.scalars().all()
+            # Hashing is CPU work; keep it off the event loop
+            bloom = await asyncio.to_thread(self.build, jtis)
+            self.install(bloom)
+            logger.debug(f"Revocation filter rebuilt: {bloom.count} ids, {bloom.size_bytes} bytes")
+        finally:
+            self._added_during_rebuild = None
+
+    def stats(self) -> Dict[str, object]:
+        bloom = self._filter
+        return {
+            "filter_ready": bloom is not None,
+            "ids": bloom.count if bloom else 0,
+            "capacity": bloom.capacity if bloom else 0,
+            "size_bytes": bloom.size_bytes if bloom else 0,
+            "hash_count": bloom.hash_count if bloom else 0,
+            "expected_fp_rate": bloom.expected_fp_rate() if bloom else None,
+            "rebuilt_at": self.rebuilt_at,
+            "rebuilds": self.rebuilds,
+            "checks": self.checks,
+            "bloom_negatives": self.bloom_negatives,
+            "revoked": self.revoked,
+            "false_positives": self.false_positives,
+        }
+
+
+async def revoke_token(db: AsyncSession, payload: dict) -> bool:
+    """Revoke the token described by ``payload`` (committed by the caller).
+
+    Returns False when its jti was already revoked, which is what makes
+    refresh-token rotation single use even for concurrent requests.
+    """
+    jti = payload.get("jti")
+    if not jti:
+        return False
+    token_type = payload.get("type", "access")
+    result = await db.execute(
+        pg_insert(RevokedToken)
+        .values(jti=jti, token_type=token_type, expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc))
+        .on_conflict_do_nothing()
+        .returning(RevokedToken.jti)
+    )
+    if token_type == "access" and _revocation_list is not None:
+        _revocation_list.add(jti)
+    return result.first() is not None
+
+
+async def run_revocation_rebuilder(interval: float):
+    """Background task rebuilding the revocation filter every ``interval`` seconds"""
+    while True:
+        await asyncio.sleep(interval)
+        revocation_list = _revocation_list
+        if revocation_list is None:
+            continue
+        try:
+            await revocation_list.rebuild()
+        except Exception as e:
+            # The previous filter stays in use; it only misses newer revocations
+            logger.error(f"Revocation filter rebuild failed: {str(e)}")
+
+
+_revocation_list: Optional[RevocationList] = (
+    RevocationList(settings.REVOCATION_BLOOM_FP_RATE, settings.REVOCATION_BLOOM_MIN_CAPACITY)
+    if settings.REVOCATION_CHECK_ENABLED else None
+)
+
+
+def get_revocation_list() -> Optional[RevocationList]:
+    return _revocation_list
+
+
+def set_revocation_list(revocation_list: Optional[RevocationList]) -> None:
+    """Replace the revocation list; ``None`` stops checking access tokens"""
+    global _revocation_list
+    _revocation_list = revocation_list
\ No newline at end of file
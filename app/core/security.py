@@ -1,33 +1,136 @@
-from passlib.context import CryptContext
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
+from fastapi import Header, HTTPException
+from functools import lru_cache
+from typing import Optional
+from jose import JWTError
 from app.core.config import settings
+from app.core.keys import ASYMMETRIC_ALGORITHMS, KeyRing, token_kid
 from app.core.logging import logger
+import hashlib
+import secrets
+import time
 import traceback
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import uuid
 
 # Password hashing
 
-def verify_password(plain_password, hashed_password):
-    try:
-        result = pwd_context.verify(plain_password, hashed_password)
-        logger.debug(f"Password verification: {'success' if result else 'failed'}")
-        return result
-    except Exception as e:
-        logger.error(f"Password verification error: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return False
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """The passlib context for the hashing policy, built (and its backends loaded) on first use"""
+    from app.core.password_policy import build_context, configured_costs, configured_schemes
 
-def get_password_hash(password):
-    try:
-        hashed = pwd_context.hash(password)
-        logger.debug("Password hashed successfully")
-        return hashed
-    except Exception as e:
-        logger.error(f"Password hashing error: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        raise
+    return build_context(configured_schemes(), configured_costs())
+
+# JWT signing / verification
+
+class TokenCodec:
+    """Signs and verifies JWTs.
+
+    HS256 signs with a key constructed once from SECRET_KEY. With a key
+    ring (ES256 / EdDSA, see app.core.keys) tokens are signed by the ring's
+    current key and carry its ``kid``, and are verified with the key their
+    kid names, under that key's algorithm only.
+
+    python-jose and its crypto backends are imported with the first token
+    rather than with the application.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str, key_ring: Optional[KeyRing] = None):
+        self.algorithm = algorithm
+        self.key_ring = key_ring
+        self._algorithms = [algorithm]
+        self._secret_key = secret_key
+        self._key = None
+        self._jwt = None
+
+    def _load(self):
+        from jose import jwk, jwt
+
+        if self.key_ring is None:
+            self._key = jwk.construct(self._secret_key, self.algorithm)
+        self._jwt = jwt
+
+    def encode(self, claims: dict) -> str:
+        if self._jwt is None:
+            self._load()
+        if self.key_ring is None:
+            return self._jwt.encode(claims, self._key, algorithm=self.algorithm)
+        key = self.key_ring.signing_key()
+        return self._jwt.encode(claims, key.signer, algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def decode(self, token: str) -> dict:
+        if self._jwt is None:
+            self._load()
+        if self.key_ring is None:
+            return self._jwt.decode(token, self._key, algorithms=self._algorithms)
+        try:
+            kid = token_kid(token)
+        except Exception:
+            raise JWTError("Invalid token header")
+        key = self.key_ring.verification_key(kid)
+        if key is None:
+            raise JWTError(f"Unknown signing key: {kid}")
+        return self._jwt.decode(token, key.verifier, algorithms=[key.algorithm])
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified token payloads, keyed by token digest.
+
+    Entries expire with the token's own ``exp`` claim, so a cached payload
+    is never returned for a token that python-jose would now reject.
+    """
+
+    def __init__(self, max_size: int = 10000, clock=time.time):
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, token: str):
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        payload, expires_at = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(payload)
+
+    def set(self, token: str, payload: dict) -> None:
+        if self.max_size <= 0:
+            return
+        exp = payload.get("exp")
+        self._entries[self._digest(token)] = (dict(payload), float(exp) if exp is not None else None)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+token_codec = TokenCodec(
+    settings.SECRET_KEY,
+    settings.ALGORITHM,
+    KeyRing(settings.JWT_KEYS_DIR, settings.JWT_KEYS_RELOAD_SECONDS)
+    if settings.ALGORITHM in ASYMMETRIC_ALGORITHMS else None,
+)
+token_cache = VerifiedTokenCache(settings.JWT_DECODE_CACHE_SIZE)
 
 # JWT token creation
 
@@ -35,8 +138,8 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     try:
         to_encode = data.copy()
         expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
-        to_encode.update({"exp": expire, "type": "access"})
-        encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
+        encoded_jwt = token_codec.encode(to_encode)
         
         username = data.get("sub", "unknown")
         logger.info(f"Access token created for user: {username}, expires: {expire}")
@@ -50,8 +153,8 @@ def create_refresh_token(data: dict):
     try:
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-        to_encode.update({"exp": expire, "type": "refresh"})
-        encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
+        encoded_jwt = token_codec.encode(to_encode)
         
         username = data.get("sub", "unknown")
         logger.info(f"Refresh token created for user: {username}, expires: {expire}")
@@ -63,7 +166,10 @@ def create_refresh_token(data: dict):
 
 def decode_access_token(token: str):
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = token_cache.get(token)
+        if payload is None:
+            payload = token_codec.decode(token)
+            token_cache.set(token, payload)
         token_type = payload.get("type", "unknown")
         username = payload.get("sub", "unknown")
         logger.debug(f"Token decoded successfully: type={token_type}, user={username}")
@@ -74,4 +180,17 @@ def decode_access_token(token: str):
     except Exception as e:
         logger.error(f"Token decode error: {str(e)}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return None 
\ No newline at end of file
+        return None 
+
+# Operational endpoints (/internal/*, /metrics)
+
+def require_internal_token(authorization: Optional[str] = Header(None)):
+    """Route dependency admitting only the bearer of INTERNAL_ENDPOINTS_TOKEN"""
+    expected = settings.INTERNAL_ENDPOINTS_TOKEN
+    if not expected:
+        # Not configured: behave as if the endpoints did not exist
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token.encode("utf-8"), expected.encode("utf-8")):
+        logger.warning("Internal endpoint access denied: missing or invalid token")
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
\ No newline at end of file
@@ -0,0 +1,115 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+
+class UserCacheBackend(ABC):
+    """Storage for authenticated users, keyed by the token ``sub`` claim.
+
+    The in-memory backend below is per worker process; deployments running
+    several workers can plug in a shared backend (e.g. Redis) with
+    ``set_user_cache`` so invalidations reach every worker.
+    """
+
+    @abstractmethod
+    def get(self, username: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, username: str, user: Any) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self, username: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        ...
+
+
+class InMemoryUserCache(UserCacheBackend):
+    """TTL + LRU cache held in the worker process"""
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 60.0, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, username: str) -> Optional[Any]:
+        entry = self._entries.get(username)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        user, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[username]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(username)
+        self.hits += 1
+        return user
+
+    def set(self, username: str, user: Any) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[username] = (user, self._clock() + self.ttl_seconds)
+        self._entries.move_to_end(username)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, username: str) -> None:
+        if self._entries.pop(username, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+_user_cache: Optional[UserCacheBackend] = (
+    InMemoryUserCache(settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_TTL_SECONDS)
+    if settings.USER_CACHE_ENABLED else None
+)
+
+
+def get_user_cache() -> Optional[UserCacheBackend]:
+    return _user_cache
+
+
+def set_user_cache(backend: Optional[UserCacheBackend]) -> None:
+    """Replace the cache backend; ``None`` disables caching"""
+    global _user_cache
+    _user_cache = backend
+
+
+def invalidate_user(username: str) -> None:
+    """Drop a user from the cache after it was changed or deactivated"""
+    if _user_cache is not None:
+        _user_cache.invalidate(username)
@@ -1,11 +1,18 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import auth, items
-from app.core.database import engine, Base, database
-from app.models.user import User
-from app.models.item import Item
-from app.core.logging import logger, log_exceptions
+from app.routers import auth, items, internal, metrics, well_known
+from app.core.config import settings
+from app.core.database import dispose_engine, get_engine
+from app.core.migrations import verify_schema_version
+from app.core.logging import ensure_logging, logger, log_exceptions
+from app.core.middleware import RequestLoggingMiddleware
+from app.core.password_service import password_service
+from app.core.metrics import run_snapshot_writer
+from app.core.revocation import get_revocation_list, run_revocation_rebuilder
+from app.core.security import token_codec
+from app.core.jobs import get_job_queue
+import asyncio
 import time
 import traceback
 
@@ -18,30 +25,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    
-    # Log request
-    logger.info(f"Request: {request.method} {request.url}")
-    
-    try:
-        response = await call_next(request)
-        
-        # Log response
-        process_time = time.time() - start_time
-        logger.info(f"Response: {response.status_code} - {process_time:.4f}s")
-        
-        return response
-    except Exception as e:
-        # Log error
-        process_time = time.time() - start_time
-        logger.error(f"Request failed: {request.method} {request.url} - {str(e)} - {process_time:.4f}s")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        raise
+# Request logging and metrics middleware (outermost)
+app.add_middleware(RequestLoggingMiddleware)
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -58,14 +46,37 @@ async def global_exception_handler(request: Request, exc: Exception):
 @app.on_event("startup")
 @log_exceptions
 async def startup():
+    ensure_logging()
     logger.info("Starting FastAPI application...")
     try:
-        await database.connect()
-        logger.info("Database connected successfully")
+        # Migrations run out-of-band (python -m app.core.migrations upgrade);
+        # a worker only checks the recorded version, which also opens the
+        # first pooled connection
+        schema_version = await verify_schema_version(get_engine())
+        logger.info(f"Database schema version {schema_version} verified")
+        
+        if token_codec.key_ring:
+            # Fail fast rather than on the first login when no key is active
+            signing_key = token_codec.key_ring.signing_key()
+            logger.info(f"Signing tokens with {signing_key.algorithm} key {signing_key.kid}")
+        
+        revocation_list = get_revocation_list()
+        if revocation_list:
+            await revocation_list.rebuild()
+            app.state.revocation_rebuilder = asyncio.create_task(
+                run_revocation_rebuilder(settings.REVOCATION_REBUILD_SECONDS)
+            )
+            logger.info(f"Token revocation filter loaded ({revocation_list.stats()['ids']} revoked access tokens)")
+        
+        job_queue = get_job_queue()
+        if job_queue:
+            job_queue.start()
         
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created/verified successfully")
+        if settings.METRICS_ENABLED and settings.METRICS_MULTIPROC_DIR:
+            app.state.metrics_writer = asyncio.create_task(run_snapshot_writer(
+                settings.METRICS_MULTIPROC_DIR, settings.METRICS_SNAPSHOT_INTERVAL_SECONDS
+            ))
+            logger.info(f"Publishing metrics snapshots to {settings.METRICS_MULTIPROC_DIR}")
         
         logger.info("FastAPI application started successfully")
     except Exception as e:
@@ -78,8 +89,21 @@ async def startup():
 async def shutdown():
     logger.info("Shutting down FastAPI application...")
     try:
-        await database.disconnect()
-        logger.info("Database disconnected successfully")
+        for task_name in ("metrics_writer", "revocation_rebuilder"):
+            task = getattr(app.state, task_name, None)
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        # Before the engine goes: queued jobs still need their connections
+        job_queue = get_job_queue()
+        if job_queue:
+            await job_queue.drain(settings.JOBS_DRAIN_TIMEOUT_SECONDS)
+        await dispose_engine()
+        logger.info("Database pool disposed successfully")
+        password_service.shutdown()
         logger.info("FastAPI application shut down successfully")
     except Exception as e:
         logger.error(f"Shutdown error: {str(e)}")
@@ -88,13 +112,18 @@ async def shutdown():
 # Routers
 app.include_router(auth)
 app.include_router(items)
+app.include_router(well_known)
+if settings.INTERNAL_ENDPOINTS_ENABLED:
+    app.include_router(internal)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics)
 
 @app.get("/")
 async def root():
-    logger.info("Root endpoint accessed")
+    logger.debug("Root endpoint accessed")
     return {"msg": "FastAPI JWT Template is running!"}
 
 @app.get("/health")
 async def health_check():
-    logger.info("Health check endpoint accessed")
+    logger.debug("Health check endpoint accessed")
     return {"status": "healthy", "timestamp": time.time()} 
\ No newline at end of file
@@ -1,2 +1,5 @@
 from .user import User
-from .item import Item 
\ No newline at end of file
+from .item import Item
+from .revoked_token import RevokedToken
+from .job import Job
+from .audit_event import AuditEvent
\ No newline at end of file
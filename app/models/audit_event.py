@@ -0,0 +1,19 @@
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.database import Base
+
+class AuditEvent(Base):
+    """A security-relevant event, written after the response by the "audit" job"""
+    __tablename__ = "audit_events"
+    id = Column(BigInteger, primary_key=True)
+    event = Column(String, nullable=False)
+    username = Column(String, nullable=True)
+    user_id = Column(Integer, nullable=True)
+    client_ip = Column(String, nullable=True)
+    details = Column(JSON().with_variant(JSONB, "postgresql"), nullable=False, server_default=text("'{}'"))
+    # When the request happened, not when the job wrote the row
+    occurred_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_audit_events_username_occurred_at", "username", "occurred_at"),
+    )
\ No newline at end of file
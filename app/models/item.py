@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, func, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.core.database import Base
 
 class Item(Base):
@@ -7,4 +8,20 @@ class Item(Base):
     title = Column(String, index=True, nullable=False)
     description = Column(String, nullable=True)
     owner_id = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime(timezone=True), server_default=func.now()) 
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Fetch server defaults with RETURNING on INSERT instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Serves the owner-scoped keyset pagination in GET /api/items/
+        Index("ix_items_owner_id_created_at_id", "owner_id", "created_at", "id"),
+    )
+
+# Text search configuration of the generated items.search_vector column
+# (migration 0003); queries must parse with the same one.
+SEARCH_CONFIG = "english"
+
+# Postgres computes search_vector itself, so it is left out of the mapping:
+# INSERTs never send it and the metadata stays usable on other dialects.
+item_search_vector = literal_column("items.search_vector", TSVECTOR)
\ No newline at end of file
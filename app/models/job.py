@@ -0,0 +1,20 @@
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Index, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.database import Base
+
+class Job(Base):
+    """A deferred job of the postgres job queue backend (see app.core.jobs)"""
+    __tablename__ = "jobs"
+    id = Column(BigInteger, primary_key=True)
+    name = Column(String, nullable=False)
+    payload = Column(JSON().with_variant(JSONB, "postgresql"), nullable=False, server_default=text("'{}'"))
+    attempts = Column(Integer, nullable=False, server_default=text("0"))
+    run_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Set when the last allowed attempt failed; such rows are never picked up again
+    failed_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index("ix_jobs_pending_run_at", "run_at", "id", postgresql_where=failed_at.is_(None)),
+    )
\ No newline at end of file
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime, func
+from app.core.database import Base
+
+class RevokedToken(Base):
+    """A token id (jti) that may no longer be used: logged out, or a refresh token already rotated"""
+    __tablename__ = "revoked_tokens"
+    jti = Column(String, primary_key=True)
+    token_type = Column(String, nullable=False)
+    # Rows are only needed until the token would have expired anyway
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
\ No newline at end of file
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, event, func, inspect
 from app.core.database import Base
+from app.core.user_cache import invalidate_user
 
 class User(Base):
     __tablename__ = "users"
@@ -8,4 +9,16 @@ class User(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now()) 
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Fetch server defaults with RETURNING on INSERT instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+# Keep the authenticated-user cache coherent with ORM writes
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target):
+    invalidate_user(target.username)
+    # A renamed user must not stay reachable under the old name
+    for old_username in inspect(target).attrs.username.history.deleted:
+        invalidate_user(old_username)
\ No newline at end of file
@@ -1,2 +1,5 @@
 from .auth import router as auth
-from .items import router as items 
\ No newline at end of file
+from .items import router as items
+from .internal import router as internal
+from .metrics import router as metrics
+from .well_known import router as well_known
\ No newline at end of file
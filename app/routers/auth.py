@@ -1,25 +1,80 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from app.schemas.user import UserCreate, UserResponse
 from app.models.user import User
-from app.core.database import AsyncSessionLocal
-from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token, decode_access_token
+from app.core.database import AsyncSessionLocal, register_hot_statements
+from app.core.security import create_access_token, create_refresh_token, decode_access_token
+from app.core.password_service import password_service, PasswordServiceBusy
+from app.core.rate_limit import RateLimit, limit_by_ip
+from app.core.revocation import revoke_token
+from app.core.audit import audit
 from app.core.config import settings
 from app.core.logging import logger, log_exceptions
+from app.core.metrics import password_rehash_total
+from app.core.responses import json_response
 from jose import JWTError
+from pydantic import TypeAdapter
 from typing import Optional
 from datetime import timedelta
-from sqlalchemy import select
+from sqlalchemy import select, update
 import traceback
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+USER_ADAPTER = TypeAdapter(UserResponse)
+# Logout accepts whatever tokens the client still holds, valid or not
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+def _login_user_query(username: str):
+    # Login only needs the password hash (and the id to upgrade it by), not a full User instance
+    return select(User.id, User.username, User.hashed_password).where(User.username == username)
+
+register_hot_statements(_login_user_query(""))
+
+# Checked as route dependencies, before the body reaches the DB or bcrypt
+LOGIN_IP_LIMIT = RateLimit(
+    "login_ip", settings.RATE_LIMIT_LOGIN_IP_REQUESTS, settings.RATE_LIMIT_LOGIN_IP_PERIOD_SECONDS
+)
+LOGIN_USERNAME_LIMIT = RateLimit(
+    "login_username", settings.RATE_LIMIT_LOGIN_USERNAME_REQUESTS, settings.RATE_LIMIT_LOGIN_USERNAME_PERIOD_SECONDS
+)
+REGISTER_IP_LIMIT = RateLimit(
+    "register_ip", settings.RATE_LIMIT_REGISTER_IP_REQUESTS, settings.RATE_LIMIT_REGISTER_IP_PERIOD_SECONDS
+)
+
+async def limit_login_username(form_data: OAuth2PasswordRequestForm = Depends()):
+    LOGIN_USERNAME_LIMIT.check(form_data.username.lower())
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
 
-@router.post("/register", response_model=UserResponse)
+async def _upgrade_password_hash(db: AsyncSession, user, new_hash: str):
+    """Store a hash made under the current policy; on failure the old one stays valid"""
+    try:
+        # By id, and only while the verified hash is still the stored one,
+        # so a concurrent password change is never overwritten
+        await db.execute(
+            update(User)
+            .where(User.id == user.id, User.hashed_password == user.hashed_password)
+            .values(hashed_password=new_hash)
+        )
+        await db.commit()
+        password_rehash_total.inc()
+        logger.info(f"Password hash upgraded for user: {user.username}")
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Password hash upgrade failed for {user.username}: {str(e)}")
+
+def _password_service_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Server is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+@router.post("/register", response_model=UserResponse, dependencies=[Depends(limit_by_ip(REGISTER_IP_LIMIT))])
 @log_exceptions
 async def register(user: UserCreate, request: Request, db: AsyncSession = Depends(get_db)):
     logger.info(f"Registration attempt for username: {user.username}, email: {user.email}")
@@ -34,14 +89,19 @@ async def register(user: UserCreate, request: Request, db: AsyncSession = Depend
             raise HTTPException(status_code=400, detail="Username or email already registered")
         
         # Create new user
-        hashed_password = get_password_hash(user.password)
+        try:
+            hashed_password = await password_service.hash(user.password)
+        except PasswordServiceBusy:
+            logger.warning(f"Registration rejected: password service busy for username: {user.username}")
+            raise _password_service_busy()
         new_user = User(username=user.username, email=user.email, hashed_password=hashed_password)
         db.add(new_user)
+        # id and created_at come back via RETURNING on the INSERT (eager_defaults)
         await db.commit()
-        await db.refresh(new_user)
         
         logger.info(f"User registered successfully: {new_user.username} (ID: {new_user.id})")
-        return new_user
+        await audit("user.registered", request, new_user.username, new_user.id)
+        return json_response(USER_ADAPTER, new_user)
         
     except HTTPException:
         raise
@@ -50,24 +110,40 @@ async def register(user: UserCreate, request: Request, db: AsyncSession = Depend
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail="Registration failed")
 
-@router.post("/login")
+@router.post("/login", dependencies=[Depends(limit_by_ip(LOGIN_IP_LIMIT)), Depends(limit_login_username)])
 @log_exceptions
 async def login(form_data: OAuth2PasswordRequestForm = Depends(), request: Request = None, db: AsyncSession = Depends(get_db)):
     logger.info(f"Login attempt for username: {form_data.username}")
     
     try:
-        result = await db.execute(select(User).where(User.username == form_data.username))
-        user = result.scalars().first()
+        result = await db.execute(_login_user_query(form_data.username))
+        user = result.first()
         
-        if not user or not verify_password(form_data.password, user.hashed_password):
+        try:
+            password_ok, new_hash = (
+                await password_service.verify_and_update(form_data.password, user.hashed_password)
+                if user else (False, None)
+            )
+        except PasswordServiceBusy:
+            logger.warning(f"Login rejected: password service busy for username: {form_data.username}")
+            raise _password_service_busy()
+        
+        if not password_ok:
             logger.warning(f"Login failed: Invalid credentials for username: {form_data.username}")
+            await audit("user.login_failed", request, form_data.username, user.id if user else None)
             raise HTTPException(status_code=401, detail="Incorrect username or password")
         
+        if new_hash and settings.PASSWORD_REHASH_ON_LOGIN:
+            await _upgrade_password_hash(db, user, new_hash)
+        
         # Generate tokens
         access_token = create_access_token(data={"sub": user.username})
         refresh_token = create_refresh_token(data={"sub": user.username})
         
         logger.info(f"User logged in successfully: {user.username} (ID: {user.id})")
+        await audit("user.login", request, user.username, user.id, rehashed=bool(new_hash))
+        # A successful login clears the failed attempts against this username
+        LOGIN_USERNAME_LIMIT.reset(form_data.username.lower())
         
         return {
             "access_token": access_token, 
@@ -84,7 +160,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), request: Reque
 
 @router.post("/refresh")
 @log_exceptions
-async def refresh_token(refresh_token: str, request: Request = None):
+async def refresh_token(refresh_token: str, request: Request = None, db: AsyncSession = Depends(get_db)):
     logger.info("Token refresh attempt")
     
     try:
@@ -94,14 +170,25 @@ async def refresh_token(refresh_token: str, request: Request = None):
             raise HTTPException(status_code=401, detail="Invalid refresh token")
         
         username = payload.get("sub")
-        if not username:
+        if not username or not payload.get("jti"):
+            # Tokens issued before rotation carry no jti and cannot be rotated
             logger.warning("Token refresh failed: Invalid token payload")
             raise HTTPException(status_code=401, detail="Invalid token payload")
         
+        # Rotation: revoking the presented token is also the check that it
+        # was not used before, in one INSERT ... ON CONFLICT DO NOTHING, so
+        # concurrent refreshes with the same token cannot both succeed
+        if not await revoke_token(db, payload):
+            logger.warning(f"Token refresh failed: Refresh token already used or revoked for user: {username}")
+            raise HTTPException(status_code=401, detail="Refresh token has been revoked")
+        await db.commit()
+        
         access_token = create_access_token(data={"sub": username})
+        new_refresh_token = create_refresh_token(data={"sub": username})
         logger.info(f"Token refreshed successfully for user: {username}")
+        await audit("token.refreshed", request, username)
         
-        return {"access_token": access_token, "token_type": "bearer"}
+        return {"access_token": access_token, "refresh_token": new_refresh_token, "token_type": "bearer"}
         
     except HTTPException:
         raise
@@ -112,6 +199,32 @@ async def refresh_token(refresh_token: str, request: Request = None):
 
 @router.post("/logout")
 @log_exceptions
-async def logout(request: Request = None):
+async def logout(
+    refresh_token: Optional[str] = None,
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    request: Request = None,
+    db: AsyncSession = Depends(get_db),
+):
     logger.info("Logout request received")
-    return {"msg": "Logout successful (client should delete tokens)"} 
\ No newline at end of file
+    
+    try:
+        # Revokes the bearer access token and, when given, the refresh token
+        revoked = 0
+        username = None
+        for candidate, token_type in ((token, "access"), (refresh_token, "refresh")):
+            payload = decode_access_token(candidate) if candidate else None
+            if payload and payload.get("type") == token_type and payload.get("jti"):
+                await revoke_token(db, payload)
+                revoked += 1
+                username = payload.get("sub")
+        if revoked:
+            await db.commit()
+            await audit("user.logout", request, username, revoked=revoked)
+        
+        logger.info(f"Logout completed: {revoked} token(s) revoked")
+        return {"msg": "Logout successful"}
+        
+    except Exception as e:
+        logger.error(f"Logout error: {str(e)}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        raise HTTPException(status_code=500, detail="Logout failed") 
\ No newline at end of file
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends
+from app.core.database import get_pool_status, get_statement_cache_status
+from app.core.jobs import get_job_queue
+from app.core.logging import logger
+from app.core.rate_limit import get_rate_limiter
+from app.core.response_cache import get_response_cache
+from app.core.revocation import get_revocation_list
+from app.core.security import require_internal_token
+from app.core.user_cache import get_user_cache
+
+router = APIRouter(
+    prefix="/internal", tags=["internal"], include_in_schema=False, dependencies=[Depends(require_internal_token)]
+)
+
+@router.get("/pool")
+async def pool_status():
+    logger.debug("Pool status endpoint accessed")
+    return get_pool_status()
+
+@router.get("/statements")
+async def statement_cache_status():
+    logger.debug("Statement cache status endpoint accessed")
+    return get_statement_cache_status()
+
+@router.get("/caches")
+async def cache_status():
+    logger.debug("Cache status endpoint accessed")
+    user_cache = get_user_cache()
+    response_cache = get_response_cache()
+    return {
+        "users": user_cache.stats() if user_cache else None,
+        "responses": response_cache.stats() if response_cache else None,
+    }
+
+@router.get("/rate-limits")
+async def rate_limit_status():
+    logger.debug("Rate limit status endpoint accessed")
+    rate_limiter = get_rate_limiter()
+    return rate_limiter.stats() if rate_limiter else None
+
+@router.get("/revocations")
+async def revocation_status():
+    logger.debug("Revocation status endpoint accessed")
+    revocation_list = get_revocation_list()
+    return revocation_list.stats() if revocation_list else None
+
+@router.get("/jobs")
+async def job_queue_status():
+    logger.debug("Job queue status endpoint accessed")
+    job_queue = get_job_queue()
+    return job_queue.stats() if job_queue else None
\ No newline at end of file
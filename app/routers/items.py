@@ -1,37 +1,140 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.schemas.item import ItemCreate, ItemResponse
-from app.models.item import Item
+from app.schemas.item import ItemCreate, ItemResponse, BulkItemError, BulkItemResponse
+from app.schemas.user import UserResponse
+from app.models.item import Item, SEARCH_CONFIG, item_search_vector
 from app.models.user import User
-from app.core.database import AsyncSessionLocal
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, register_hot_statements
 from app.core.security import decode_access_token
 from app.core.logging import logger, log_exceptions
+from app.core.pagination import (
+    InvalidCursor, decode_cursor, decode_search_cursor, encode_cursor, encode_search_cursor,
+)
+from app.core.revocation import get_revocation_list
+from app.core.audit import audit
+from app.core.response_cache import (
+    CachedResponse, compute_etag, etag_matches, get_response_cache, invalidate_user_responses, render_cached,
+)
+from app.core.responses import encode_json, json_response
+from app.core.user_cache import get_user_cache
 from fastapi.security import OAuth2PasswordBearer
-from typing import List
-from sqlalchemy import select
+from typing import List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import REAL, delete, func, insert, literal, or_, select, tuple_
+from pydantic import TypeAdapter, ValidationError
+import json
+import re
 import traceback
 
 router = APIRouter(prefix="/api/items", tags=["items"])
+
+ITEM_ADAPTER = TypeAdapter(ItemResponse)
+ITEM_LIST_ADAPTER = TypeAdapter(List[ItemResponse])
+BULK_ITEM_ADAPTER = TypeAdapter(BulkItemResponse)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Read endpoints select only the response columns and map the Core rows
+# straight into the response models: no ORM instances, identity map or
+# attribute instrumentation on the hot path.
+ITEM_COLUMNS = (Item.id, Item.title, Item.description, Item.owner_id, Item.created_at)
+USER_COLUMNS = (User.id, User.username, User.email, User.is_active, User.created_at)
+
+def _user_by_username_query(username: str):
+    return select(*USER_COLUMNS).where(User.username == username)
+
+def _owned_item_query(item_id: int, owner_id: int):
+    return select(*ITEM_COLUMNS).where(Item.id == item_id, Item.owner_id == owner_id)
+
+def _delete_owned_item_query(item_id: int, owner_id: int):
+    # Single DELETE ... RETURNING; nothing is loaded into the session first
+    return (
+        delete(Item)
+        .where(Item.id == item_id, Item.owner_id == owner_id)
+        .returning(Item.id, Item.title)
+        .execution_options(synchronize_session=False)
+    )
+
+def _items_version_query(owner_id: int):
+    # Changes whenever the owner's items do (items are immutable and ids
+    # unique, so an insert or delete always moves count or sum). One pass
+    # over ix_items_owner_id_created_at_id, cheaper than the page itself.
+    return select(func.count(), func.coalesce(func.sum(Item.id), 0), func.max(Item.id)).where(Item.owner_id == owner_id)
+
+register_hot_statements(
+    _user_by_username_query(""), _owned_item_query(0, 0), _delete_owned_item_query(0, 0), _items_version_query(0),
+)
+
+def _response_cache_key(request: Request) -> str:
+    return f"{request.url.path}?{request.url.query}"
+
+async def _items_etag(db: AsyncSession, request: Request, user_id: int) -> str:
+    # Probed on every request, so a write handled by another worker (whose
+    # cache invalidation this worker never sees) still changes the ETag
+    result = await db.execute(_items_version_query(user_id))
+    return compute_etag((), *map(str, result.one()), _response_cache_key(request))
+
+def _cached_response(request: Request, user_id: int, etag: str) -> Optional[Response]:
+    # A client already holding this version gets a 304 before the page is read
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag):
+        return render_cached(CachedResponse(etag, b""), if_none_match)
+    cache = get_response_cache()
+    cached = cache.get(user_id, _response_cache_key(request)) if cache else None
+    if cached is None or cached.etag != etag:
+        return None
+    return render_cached(cached, None)
+
+def _etag_response(request: Request, user_id: int, etag: str, adapter: TypeAdapter, data,
+                   headers: Optional[dict] = None, cache_response: bool = True) -> Response:
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag):
+        return render_cached(CachedResponse(etag, b"", headers or {}), if_none_match)
+    cached = CachedResponse(etag, encode_json(adapter, data), headers or {})
+    cache = get_response_cache()
+    if cache and cache_response:
+        cache.set(user_id, _response_cache_key(request), cached)
+    return render_cached(cached, None)
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
     try:
         payload = decode_access_token(token)
         if not payload or payload.get("type") != "access":
             logger.warning("Authentication failed: Invalid access token")
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
         
-        result = await db.execute(select(User).where(User.username == payload["sub"]))
-        user = result.scalars().first()
+        username = payload["sub"]
+        # Answered from the Bloom filter unless the token id is (probably) revoked
+        jti = payload.get("jti")
+        revocation_list = get_revocation_list()
+        if jti and revocation_list and await revocation_list.is_revoked(db, jti):
+            logger.warning(f"Authentication failed: Revoked access token for username: {username}")
+            raise HTTPException(status_code=401, detail="Token has been revoked")
         
-        if not user:
-            logger.warning(f"Authentication failed: User not found for username: {payload['sub']}")
+        user_cache = get_user_cache()
+        user = user_cache.get(username) if user_cache else None
+        if user:
+            request.state.user_id = user.id
+            logger.debug(f"User authenticated from cache: {user.username} (ID: {user.id})")
+            return user
+        
+        result = await db.execute(_user_by_username_query(username))
+        db_user = result.first()
+        
+        if not db_user:
+            logger.warning(f"Authentication failed: User not found for username: {username}")
             raise HTTPException(status_code=401, detail="User not found")
         
+        user = UserResponse.model_validate(db_user)
+        if user_cache:
+            user_cache.set(username, user)
+        request.state.user_id = user.id
+        
         logger.debug(f"User authenticated: {user.username} (ID: {user.id})")
         return user
         
@@ -44,57 +147,296 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
 
 @router.post("/", response_model=ItemResponse)
 @log_exceptions
-async def create_item(item: ItemCreate, request: Request, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_item(item: ItemCreate, request: Request, db: AsyncSession = Depends(get_db), current_user: UserResponse = Depends(get_current_user)):
     logger.info(f"Item creation attempt by user: {current_user.username} (ID: {current_user.id})")
     logger.info(f"Item details: title='{item.title}', description='{item.description}'")
     
     try:
         db_item = Item(**item.dict(), owner_id=current_user.id)
         db.add(db_item)
+        # id and created_at come back via RETURNING on the INSERT (eager_defaults)
         await db.commit()
-        await db.refresh(db_item)
+        invalidate_user_responses(current_user.id)
         
         logger.info(f"Item created successfully: ID={db_item.id}, title='{db_item.title}', owner={current_user.username}")
-        return db_item
+        return json_response(ITEM_ADAPTER, db_item)
         
     except Exception as e:
         logger.error(f"Item creation error for user {current_user.username}: {str(e)}")
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail="Failed to create item")
 
+async def _bulk_payloads(request: Request):
+    # Yields (index, payload, is_json_text) from a JSON array or an NDJSON body.
+    # NDJSON is consumed incrementally so large uploads are never held whole.
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type:
+        index = 0
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield index, line, True
+                    index += 1
+        if buffer.strip():
+            yield index, buffer, True
+        return
+    
+    try:
+        payload = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    for index, obj in enumerate(payload):
+        yield index, obj, False
+
+async def _insert_item_batch(db: AsyncSession, rows: List[dict]) -> List[int]:
+    # One multi-row INSERT ... RETURNING per batch, ids in parameter order
+    result = await db.execute(insert(Item).returning(Item.id, sort_by_parameter_order=True), rows)
+    return list(result.scalars())
+
+_BULK_ITEMS_SCHEMA = {"type": "array", "items": {"$ref": "#/components/schemas/ItemCreate"}}
+
+@router.post(
+    "/bulk",
+    response_model=BulkItemResponse,
+    openapi_extra={"requestBody": {"required": True, "content": {
+        "application/json": {"schema": _BULK_ITEMS_SCHEMA},
+        "application/x-ndjson": {"schema": {"$ref": "#/components/schemas/ItemCreate"}},
+    }}},
+)
+@log_exceptions
+async def create_items_bulk(request: Request, db: AsyncSession = Depends(get_db), current_user: UserResponse = Depends(get_current_user)):
+    logger.info(f"Bulk item creation by user: {current_user.username} (ID: {current_user.id})")
+    
+    batch_size = settings.ITEMS_BULK_BATCH_SIZE
+    ids: List[int] = []
+    errors: List[BulkItemError] = []
+    batch: List[dict] = []
+    received = 0
+    
+    try:
+        async for index, payload, is_json_text in _bulk_payloads(request):
+            received += 1
+            if received > settings.ITEMS_BULK_MAX_ITEMS:
+                logger.warning(f"Bulk item creation rejected for user {current_user.username}: more than {settings.ITEMS_BULK_MAX_ITEMS} items")
+                raise HTTPException(status_code=413, detail=f"At most {settings.ITEMS_BULK_MAX_ITEMS} items per request")
+            
+            try:
+                if is_json_text:
+                    item = ItemCreate.model_validate_json(payload)
+                else:
+                    item = ItemCreate.model_validate(payload)
+            except ValidationError as e:
+                errors.append(BulkItemError(
+                    index=index,
+                    errors=[{"loc": err["loc"], "msg": err["msg"], "type": err["type"]} for err in e.errors()],
+                ))
+                continue
+            
+            batch.append({**item.model_dump(), "owner_id": current_user.id})
+            if len(batch) >= batch_size:
+                ids.extend(await _insert_item_batch(db, batch))
+                batch = []
+        
+        if batch:
+            ids.extend(await _insert_item_batch(db, batch))
+        await db.commit()
+        if ids:
+            invalidate_user_responses(current_user.id)
+        
+        logger.info(f"Bulk item creation for user {current_user.username}: {len(ids)} created, {len(errors)} rejected")
+        return json_response(BULK_ITEM_ADAPTER, BulkItemResponse(created=len(ids), ids=ids, errors=errors))
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Bulk item creation error for user {current_user.username}: {str(e)}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        raise HTTPException(status_code=500, detail="Failed to create items")
+
+def _owned_items_query(owner_id: int, after: Optional[Tuple[datetime, int]]):
+    # Keyset pagination on (created_at, id), served by ix_items_owner_id_created_at_id
+    query = select(*ITEM_COLUMNS).where(Item.owner_id == owner_id)
+    if after:
+        # Bound with the column types: the cursor's created_at is tz-aware and
+        # asyncpg rejects it for a TIMESTAMP WITHOUT TIME ZONE parameter
+        query = query.where(
+            tuple_(Item.created_at, Item.id)
+            > tuple_(literal(after[0], Item.created_at.type), literal(after[1], Item.id.type))
+        )
+    return query.order_by(Item.created_at, Item.id)
+
+async def _stream_items(owner_id: int, after: Optional[Tuple[datetime, int]], fmt: str):
+    # The request-scoped session is closed before the body is sent, so the
+    # stream owns its session and reads through a server-side cursor.
+    chunk_size = settings.ITEMS_STREAM_CHUNK_SIZE
+    first = True
+    if fmt == "json":
+        yield b"["
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(
+            _owned_items_query(owner_id, after).execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.partitions():
+            if fmt == "ndjson":
+                yield b"".join(encode_json(ITEM_ADAPTER, row) + b"\n" for row in partition)
+            else:
+                # Drop the list brackets; the stream supplies the outer array
+                yield (b"" if first else b",") + encode_json(ITEM_LIST_ADAPTER, partition)[1:-1]
+            first = False
+    if fmt == "json":
+        yield b"]"
+
 @router.get("/", response_model=List[ItemResponse])
 @log_exceptions
-async def read_items(request: Request = None, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def read_items(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=settings.ITEMS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    stream: Optional[str] = Query(None, pattern="^(ndjson|json)$"),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserResponse = Depends(get_current_user),
+):
     logger.info(f"Items list request by user: {current_user.username} (ID: {current_user.id})")
     
     try:
-        # Show all items without any limit
-        result = await db.execute(select(Item))
-        items = result.scalars().all()
+        after = decode_cursor(cursor)
+    except InvalidCursor:
+        logger.warning(f"Items list failed: invalid cursor from user {current_user.username}")
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    if stream:
+        logger.info(f"Streaming items ({stream}) for user {current_user.username}")
+        media_type = "application/x-ndjson" if stream == "ndjson" else "application/json"
+        return StreamingResponse(_stream_items(current_user.id, after, stream), media_type=media_type)
+    
+    try:
+        etag = await _items_etag(db, request, current_user.id)
+        cached = _cached_response(request, current_user.id, etag)
+        if cached is not None:
+            logger.info(f"Items list served from response cache for user {current_user.username} (status {cached.status_code})")
+            return cached
+        
+        page_size = limit or settings.ITEMS_PAGE_SIZE
+        # Fetch one extra row to learn whether another page exists
+        result = await db.execute(_owned_items_query(current_user.id, after).limit(page_size + 1))
+        items = result.all()
+        
+        headers = {}
+        if len(items) > page_size:
+            items = items[:page_size]
+            last = items[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
         
         logger.info(f"Items retrieved successfully for user {current_user.username}: {len(items)} items")
-        return items
+        return _etag_response(request, current_user.id, etag, ITEM_LIST_ADAPTER, items, headers)
         
     except Exception as e:
         logger.error(f"Items list error for user {current_user.username}: {str(e)}")
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail="Failed to retrieve items")
 
+_SEARCH_TERM = re.compile(r"[^\W_]+")
+
+def _prefix_tsquery(q: str) -> Optional[str]:
+    # Every word must match and the last one may be incomplete ("fast ser"
+    # finds "fast server"). Only plain alphanumeric words are kept, so no
+    # tsquery syntax from the client reaches to_tsquery.
+    terms = _SEARCH_TERM.findall(q.lower().replace("'", ""))
+    if not terms:
+        return None
+    terms[-1] += ":*"
+    return " & ".join(terms)
+
+def _search_items_query(owner_id: int, q: str, tsquery: str, after: Optional[Tuple[float, int]]):
+    # Full-text matches (GIN on search_vector) plus typo-tolerant title
+    # matches (trigram GIN, title %> q), ranked by both scores.
+    # Keyset pagination on (rank, id), both descending.
+    query = func.to_tsquery(SEARCH_CONFIG, tsquery)
+    rank = (
+        func.ts_rank_cd(item_search_vector, query, type_=REAL)
+        + func.word_similarity(q, Item.title, type_=REAL)
+    ).label("rank")
+    matches = (
+        select(*ITEM_COLUMNS, rank)
+        .where(Item.owner_id == owner_id, or_(item_search_vector.op("@@")(query), Item.title.op("%>")(q)))
+        .subquery()
+    )
+    ranked = select(*(matches.c[column.key] for column in ITEM_COLUMNS), matches.c.rank)
+    if after:
+        ranked = ranked.where(tuple_(matches.c.rank, matches.c.id) < tuple_(*after))
+    return ranked.order_by(matches.c.rank.desc(), matches.c.id.desc())
+
+@router.get("/search", response_model=List[ItemResponse])
+@log_exceptions
+async def search_items(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=settings.ITEMS_SEARCH_MAX_QUERY_LENGTH),
+    limit: Optional[int] = Query(None, ge=1, le=settings.ITEMS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserResponse = Depends(get_current_user),
+):
+    logger.info(f"Items search by user: {current_user.username} (ID: {current_user.id}), q='{q}'")
+    
+    tsquery = _prefix_tsquery(q)
+    if tsquery is None:
+        logger.warning(f"Items search failed: no search terms in q='{q}' from user {current_user.username}")
+        raise HTTPException(status_code=400, detail="Search query must contain at least one word")
+    try:
+        after = decode_search_cursor(cursor)
+    except InvalidCursor:
+        logger.warning(f"Items search failed: invalid cursor from user {current_user.username}")
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    try:
+        etag = await _items_etag(db, request, current_user.id)
+        cached = _cached_response(request, current_user.id, etag)
+        if cached is not None:
+            logger.info(f"Items search served from response cache for user {current_user.username} (status {cached.status_code})")
+            return cached
+        
+        page_size = limit or settings.ITEMS_PAGE_SIZE
+        result = await db.execute(_search_items_query(current_user.id, q, tsquery, after).limit(page_size + 1))
+        items = result.all()
+        
+        headers = {}
+        if len(items) > page_size:
+            items = items[:page_size]
+            last = items[-1]
+            headers["X-Next-Cursor"] = encode_search_cursor(last.rank, last.id)
+        
+        logger.info(f"Items search for user {current_user.username}: {len(items)} results")
+        return _etag_response(request, current_user.id, etag, ITEM_LIST_ADAPTER, items, headers)
+        
+    except Exception as e:
+        logger.error(f"Items search error for user {current_user.username}: {str(e)}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        raise HTTPException(status_code=500, detail="Failed to search items")
+
 @router.get("/{item_id}", response_model=ItemResponse)
 @log_exceptions
-async def read_item(item_id: int, request: Request, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def read_item(item_id: int, request: Request, db: AsyncSession = Depends(get_db), current_user: UserResponse = Depends(get_current_user)):
     logger.info(f"Item detail request by user: {current_user.username} (ID: {current_user.id}) for item ID: {item_id}")
     
     try:
-        result = await db.execute(select(Item).where(Item.id == item_id, Item.owner_id == current_user.id))
-        item = result.scalars().first()
+        # Not response-cached: confirming the item still exists costs the
+        # same query as reading it, so only the encoding would be saved
+        result = await db.execute(_owned_item_query(item_id, current_user.id))
+        item = result.first()
         
         if not item:
             logger.warning(f"Item not found: ID={item_id}, requested by user={current_user.username}")
             raise HTTPException(status_code=404, detail="Item not found")
         
         logger.info(f"Item retrieved successfully: ID={item.id}, title='{item.title}', owner={current_user.username}")
-        return item
+        return _etag_response(
+            request, current_user.id, compute_etag([(item.id, item.created_at)]), ITEM_ADAPTER, item, cache_response=False,
+        )
         
     except HTTPException:
         raise
@@ -105,21 +447,22 @@ async def read_item(item_id: int, request: Request, db: AsyncSession = Depends(g
 
 @router.delete("/{item_id}")
 @log_exceptions
-async def delete_item(item_id: int, request: Request, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def delete_item(item_id: int, request: Request, db: AsyncSession = Depends(get_db), current_user: UserResponse = Depends(get_current_user)):
     logger.info(f"Item deletion request by user: {current_user.username} (ID: {current_user.id}) for item ID: {item_id}")
     
     try:
-        result = await db.execute(select(Item).where(Item.id == item_id, Item.owner_id == current_user.id))
-        item = result.scalars().first()
+        result = await db.execute(_delete_owned_item_query(item_id, current_user.id))
+        item = result.first()
         
         if not item:
             logger.warning(f"Item not found for deletion: ID={item_id}, requested by user={current_user.username}")
             raise HTTPException(status_code=404, detail="Item not found")
         
-        await db.delete(item)
         await db.commit()
+        invalidate_user_responses(current_user.id)
         
         logger.info(f"Item deleted successfully: ID={item.id}, title='{item.title}', owner={current_user.username}")
+        await audit("item.deleted", request, current_user.username, current_user.id, item_id=item.id)
         return {"msg": "Item deleted"}
         
     except HTTPException:
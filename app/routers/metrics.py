@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.security import require_internal_token
+
+router = APIRouter(tags=["internal"], include_in_schema=False, dependencies=[Depends(require_internal_token)])
+
+class PrometheusResponse(PlainTextResponse):
+    media_type = "text/plain; version=0.0.4"
+
+@router.get("/metrics", response_class=PrometheusResponse)
+async def metrics():
+    return PrometheusResponse(registry.render(settings.METRICS_MULTIPROC_DIR))
\ No newline at end of file
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Request, Response
+from app.core.config import settings
+from app.core.keys import EMPTY_JWKS
+from app.core.logging import logger
+from app.core.response_cache import etag_matches
+from app.core.security import token_codec
+
+router = APIRouter(prefix="/.well-known", tags=["well-known"])
+
+_EMPTY_JWKS_ETAG = '"empty"'
+
+@router.get("/jwks.json")
+async def jwks(request: Request):
+    """Public keys verifying our tokens, by kid (empty while signing with HS256)"""
+    logger.debug("JWKS endpoint accessed")
+    key_ring = token_codec.key_ring
+    body, etag = key_ring.jwks() if key_ring else (EMPTY_JWKS, _EMPTY_JWKS_ETAG)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE_SECONDS}"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
\ No newline at end of file
@@ -1,7 +1,8 @@
 from .user import UserBase, UserCreate, UserResponse
-from .item import ItemBase, ItemCreate, ItemResponse
+from .item import ItemBase, ItemCreate, ItemResponse, BulkItemError, BulkItemResponse
 
 __all__ = [
     "UserBase", "UserCreate", "UserResponse",
-    "ItemBase", "ItemCreate", "ItemResponse"
+    "ItemBase", "ItemCreate", "ItemResponse",
+    "BulkItemError", "BulkItemResponse"
 ] 
\ No newline at end of file
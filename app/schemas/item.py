@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, List, Optional
 from datetime import datetime
 
 class ItemBase(BaseModel):
@@ -15,4 +15,13 @@ class ItemResponse(ItemBase):
     created_at: datetime
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class BulkItemError(BaseModel):
+    index: int
+    errors: List[Any]
+
+class BulkItemResponse(BaseModel):
+    created: int
+    ids: List[int]
+    errors: List[BulkItemError]
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Production entry point
+
+    python -m app.server
+
+Runs SERVER_WORKERS uvicorn worker processes (CPU count by default) under
+uvicorn's supervisor. Every worker is restarted if it dies; SIGHUP restarts
+all workers one by one for a graceful reload, SIGTTIN/SIGTTOU add or remove
+a worker. The root ``main.py`` stays the single-process development server
+with auto-reload.
+"""
+
+import importlib.util
+import os
+import tempfile
+from pathlib import Path
+
+import uvicorn
+
+from app.core.config import settings
+from app.core.logging import ensure_logging, logger, start_log_writer
+
+
+def worker_count() -> int:
+    return settings.SERVER_WORKERS or os.cpu_count() or 1
+
+
+def _size_worker_pools(workers: int) -> None:
+    """Split the connection and password-hashing budgets between the workers.
+
+    Workers are spawned fresh and read their Settings from the environment,
+    so the per-worker sizes are handed down as environment variables.
+    """
+    per_worker = max(1, settings.DB_MAX_CONNECTIONS // workers)
+    pool_size = min(settings.DB_POOL_SIZE, per_worker)
+    max_overflow = min(settings.DB_MAX_OVERFLOW, per_worker - pool_size)
+    if (pool_size, max_overflow) != (settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW):
+        logger.warning(
+            f"DB_POOL_SIZE={settings.DB_POOL_SIZE} + DB_MAX_OVERFLOW={settings.DB_MAX_OVERFLOW} per worker "
+            f"exceeds DB_MAX_CONNECTIONS={settings.DB_MAX_CONNECTIONS} over {workers} workers; "
+            f"using {pool_size} + {max_overflow}"
+        )
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(max_overflow)
+
+    cpus = os.cpu_count() or 1
+    hash_workers = settings.PASSWORD_HASH_WORKERS
+    if settings.PASSWORD_HASH_EXECUTOR != "inline":
+        if not hash_workers:
+            # One hashing process per CPU for the whole server, not per worker
+            hash_workers = max(1, cpus // workers)
+            os.environ["PASSWORD_HASH_WORKERS"] = str(hash_workers)
+        elif hash_workers * workers > cpus:
+            logger.warning(
+                f"PASSWORD_HASH_WORKERS={hash_workers} x {workers} workers oversubscribes {cpus} CPUs"
+            )
+
+    logger.info(
+        f"Per worker: {pool_size} + {max_overflow} database connections "
+        f"({workers * (pool_size + max_overflow)} in total), "
+        f"{hash_workers if settings.PASSWORD_HASH_EXECUTOR != 'inline' else 0} password hash {settings.PASSWORD_HASH_EXECUTOR} workers"
+    )
+
+
+def _resolve(option: str, preferred: str, fallback: str) -> str:
+    # uvicorn's "auto" silently falls back; resolve it here so the choice is logged
+    if option != "auto":
+        return option
+    return preferred if importlib.util.find_spec(preferred) is not None else fallback
+
+
+def _prepare_metrics_dir(workers: int):
+    """Give the workers a clean shared directory for their metrics snapshots"""
+    if not settings.METRICS_ENABLED or workers <= 1:
+        return
+    directory = settings.METRICS_MULTIPROC_DIR
+    if not directory:
+        directory = tempfile.mkdtemp(prefix="fastapi_metrics_")
+        # Workers are spawned fresh and read their Settings from the environment
+        os.environ["METRICS_MULTIPROC_DIR"] = directory
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    for stale in path.glob("metrics_*.json"):
+        stale.unlink(missing_ok=True)
+    logger.info(f"Metrics snapshots shared through {directory}")
+
+
+def main():
+    ensure_logging()
+    workers = worker_count()
+    loop = _resolve(settings.SERVER_LOOP, "uvloop", "asyncio")
+    http = _resolve(settings.SERVER_HTTP, "httptools", "h11")
+    _prepare_metrics_dir(workers)
+    _size_worker_pools(workers)
+    if workers > 1:
+        log_socket = start_log_writer()
+        if log_socket:
+            os.environ["LOG_SOCKET_PATH"] = log_socket
+            logger.info("Worker log records are written to the log files by the launcher")
+
+    logger.info(
+        f"Starting {workers} worker(s) on {settings.HOST}:{settings.PORT} (loop={loop}, http={http}, "
+        f"max_requests={settings.SERVER_LIMIT_MAX_REQUESTS or 'unlimited'})"
+    )
+    uvicorn.run(
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_TIMEOUT,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+        limit_max_requests=settings.SERVER_LIMIT_MAX_REQUESTS or None,
+        proxy_headers=settings.SERVER_PROXY_HEADERS,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+        # Requests are already recorded by the application's access log
+        access_log=False,
+        log_level=settings.LOG_CONSOLE_LEVEL.lower(),
+    )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
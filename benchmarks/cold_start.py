@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Worker cold-start time: create_all on boot vs schema version check
+
+Boots W fresh worker processes at once, as a scale-out or rolling restart
+does, and times each one's startup database work:
+
+    create_all  the previous startup: Base.metadata.create_all (catalog
+                inspection per table/index, DDL locks when anything is missing)
+    verify      the current startup: one SELECT against schema_migrations
+
+Migrations are applied first, so both modes run against an up-to-date
+schema. Needs the Postgres from .env. Run from the repository root:
+
+    python -m benchmarks.cold_start --workers 8 --rounds 5
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from benchmarks.common import percentile, print_table, write_json
+
+MODES = ("create_all", "verify")
+
+
+async def child(mode: str):
+    start = time.perf_counter()
+    from app.core.database import Base, dispose_engine, get_engine
+    from app.core.migrations import verify_schema_version
+    import app.main  # noqa: F401  (full application import, as a worker does)
+    imported = time.perf_counter()
+
+    if mode == "create_all":
+        async with get_engine().begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    else:
+        await verify_schema_version(get_engine())
+    ready = time.perf_counter()
+    await dispose_engine()
+    print(json.dumps({"import_s": imported - start, "startup_s": ready - imported}))
+
+
+def boot_round(mode: str, workers: int):
+    processes = [
+        subprocess.Popen([sys.executable, "-m", "benchmarks.cold_start", "--child", mode],
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        for _ in range(workers)
+    ]
+    timings = []
+    for process in processes:
+        out, _ = process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"{mode} worker failed with exit code {process.returncode}")
+        timings.append(json.loads(out.strip().splitlines()[-1]))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=8, help="workers booted at the same time")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        import logging
+        logging.disable(logging.CRITICAL)
+        asyncio.run(child(args.child))
+        return
+
+    from app.core.migrations import upgrade
+    asyncio.run(upgrade())
+
+    results = {}
+    for mode in MODES:
+        timings = [t for _ in range(args.rounds) for t in boot_round(mode, args.workers)]
+        startup = [t["startup_s"] for t in timings]
+        results[mode] = {
+            "import_ms": sum(t["import_s"] for t in timings) / len(timings) * 1000,
+            "startup_p50_ms": percentile(startup, 50) * 1000,
+            "startup_p95_ms": percentile(startup, 95) * 1000,
+            "startup_max_ms": max(startup) * 1000,
+        }
+
+    print_table(f"Worker cold start ({args.workers} workers booting together, {args.rounds} rounds)", results)
+    write_json(args.output, {"benchmark": "cold_start", "workers": args.workers, "results": results})
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
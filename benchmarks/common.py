@@ -0,0 +1,195 @@
+"""
+Shared helpers for the benchmark scripts
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def quiet_logging():
+    """Silence application logging so it does not skew timings"""
+    logging.disable(logging.CRITICAL)
+
+
+async def asgi_request(
+    app,
+    method: str,
+    path: str,
+    headers: Optional[Dict[str, str]] = None,
+    body: bytes = b"",
+    query_string: str = "",
+) -> Tuple[int, Dict[str, str], bytes]:
+    """Call an ASGI app in-process and return (status, headers, body)"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("latin-1"),
+        "root_path": "",
+        "query_string": query_string.encode("latin-1"),
+        "headers": [
+            (k.lower().encode("latin-1"), v.encode("latin-1"))
+            for k, v in (headers or {}).items()
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    request_sent = False
+    status = 0
+    response_headers: Dict[str, str] = {}
+    chunks: List[bytes] = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for k, v in message.get("headers", []):
+                response_headers[k.decode("latin-1")] = v.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(chunks)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: Iterable[float], elapsed: Optional[float] = None) -> Dict[str, float]:
+    """Latency summary in milliseconds (input in seconds)"""
+    values = list(latencies)
+    summary = {
+        "count": len(values),
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": max(values) * 1000 if values else 0.0,
+    }
+    if elapsed:
+        summary["rps"] = len(values) / elapsed
+    return summary
+
+
+def print_table(title: str, rows: Dict[str, Dict[str, float]]):
+    print("\n" + "=" * 72)
+    print(f" {title}")
+    print("=" * 72)
+    columns: List[str] = []
+    for row in rows.values():
+        for key in row:
+            if key not in columns:
+                columns.append(key)
+    widths = {c: max(12, len(c) + 2) for c in columns}
+    print(f"{'':<18}" + "".join(f"{c:>{widths[c]}}" for c in columns))
+    for name, row in rows.items():
+        cells = "".join(
+            f"{row.get(c, 0):>{widths[c]}.2f}" if isinstance(row.get(c), float)
+            else f"{row.get(c, ''):>{widths[c]}}"
+            for c in columns
+        )
+        print(f"{name:<18}{cells}")
+
+
+def write_json(path: Optional[str], payload: dict):
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, default=str)
+        print(f"\nResults written to {path}")
+
+
+class AsgiClient:
+    """Sends requests straight into an ASGI app, no sockets involved"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method, path, headers=None, body=b"", query_string=""):
+        return await asgi_request(self.app, method, path, headers, body, query_string)
+
+    async def close(self):
+        pass
+
+
+class HttpClient:
+    """Minimal HTTP/1.1 keep-alive client over asyncio streams.
+
+    Keeps a pool of open connections so concurrent workers do not pay a TCP
+    handshake per request. Only what the benchmarks need: Content-Length and
+    chunked response bodies.
+    """
+
+    def __init__(self, base_url: str):
+        from urllib.parse import urlsplit
+
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 80
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def _connect(self):
+        if self._idle:
+            return self._idle.pop()
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, headers=None, body=b"", query_string=""):
+        reader, writer = await self._connect()
+        target = f"{path}?{query_string}" if query_string else path
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        try:
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionError("connection closed by server")
+            status = int(status_line.split()[1])
+            response_headers: Dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                key, _, value = line.decode("latin-1").partition(":")
+                response_headers[key.strip().lower()] = value.strip()
+
+            if response_headers.get("transfer-encoding") == "chunked":
+                chunks = []
+                while True:
+                    size = int((await reader.readline()).strip(), 16)
+                    if size == 0:
+                        await reader.readline()
+                        break
+                    chunks.append(await reader.readexactly(size))
+                    await reader.readline()
+                response_body = b"".join(chunks)
+            else:
+                response_body = await reader.readexactly(int(response_headers.get("content-length", "0")))
+        except Exception:
+            writer.close()
+            raise
+
+        if response_headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self._idle.append((reader, writer))
+        return status, response_headers, response_body
+
+    async def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Import-time profile of the application, with a budget check
+
+Imports ``app.main`` in fresh interpreters under ``python -X importtime``
+and reports the median per-module cost (self and cumulative) and the cost
+per top-level package. Exits non-zero when a module that must stay lazy
+(DB driver, crypto backends, password hashing) was imported, or when the
+median import exceeds --budget-ms if one is given; wall time varies too
+much between machines to gate on by default. tests/test_import_time.py
+runs the lazy-module check under pytest. Run from the repository root:
+
+    python -m benchmarks.import_time --runs 5 --top 15
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from benchmarks.common import print_table, write_json
+
+# Created on first use (get_engine, TokenCodec, get_pwd_context), never by the import
+LAZY_MODULES = ("asyncpg", "passlib", "bcrypt", "jose.jwk", "jose.jwt", "cryptography")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+_CHILD = (
+    "import time; start = time.perf_counter(); import app.main; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def profile_once() -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """One fresh interpreter: (wall ms, {module: (self us, cumulative us)})"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD], capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"import app.main failed:\n{process.stderr[-2000:]}")
+    modules = {}
+    for line in process.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return float(process.stdout.strip().splitlines()[-1]), modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to profile")
+    parser.add_argument("--budget-ms", type=float,
+                        help="fail when the median import of app.main takes longer (default: report only)")
+    parser.add_argument("--top", type=int, default=15, help="modules and packages to list")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    walls: List[float] = []
+    samples: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    for _ in range(args.runs):
+        wall_ms, modules = profile_once()
+        walls.append(wall_ms)
+        for name, costs in modules.items():
+            samples[name].append(costs)
+
+    modules = {
+        name: {
+            "self_ms": statistics.median(s for s, _ in costs) / 1000,
+            "cumulative_ms": statistics.median(c for _, c in costs) / 1000,
+        }
+        for name, costs in samples.items()
+    }
+    packages: Dict[str, Dict[str, float]] = defaultdict(lambda: {"self_ms": 0.0, "modules": 0})
+    for name, row in modules.items():
+        package = packages[name.split(".")[0]]
+        package["self_ms"] += row["self_ms"]
+        package["modules"] += 1
+
+    by_self = sorted(modules.items(), key=lambda item: item[1]["self_ms"], reverse=True)[:args.top]
+    by_package = sorted(packages.items(), key=lambda item: item[1]["self_ms"], reverse=True)[:args.top]
+    print_table(f"Slowest modules by self time (median of {args.runs} runs)", dict(by_self))
+    print_table("Import cost per top-level package", dict(by_package))
+
+    wall_ms = statistics.median(walls)
+    eager = [name for name in LAZY_MODULES if name in modules]
+    budget = f", budget {args.budget_ms:.0f} ms" if args.budget_ms else ""
+    print(f"\nimport app.main: {wall_ms:.0f} ms median over {args.runs} runs ({len(modules)} modules{budget})")
+    write_json(args.output, {
+        "benchmark": "import_time",
+        "wall_ms": wall_ms,
+        "budget_ms": args.budget_ms,
+        "eager_lazy_modules": eager,
+        "modules": modules,
+        "packages": dict(packages),
+    })
+
+    failed = False
+    if args.budget_ms and wall_ms > args.budget_ms:
+        print(f"FAIL: import time {wall_ms:.0f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+    if eager:
+        print(f"FAIL: imported eagerly, should load on first use: {', '.join(eager)}")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print(f"OK: {'within budget, ' if args.budget_ms else ''}no lazy module imported at startup")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
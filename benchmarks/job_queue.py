@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Background job queue: request-path cost of deferred work
+
+A stand-in job awaits --job-ms (the round trip of a small write such as
+an audit row). For each mode, --jobs calls to enqueue_job are timed as a
+request handler would see them:
+
+    inline   no queue, the job runs in the request (JOBS_BACKEND=inline)
+    memory   MemoryJobQueue: the request only enqueues; "drain_s" is how
+             long its JOBS_WORKERS tasks then take to finish everything
+
+No database is needed (the stand-in job never touches its session). Run
+from the repository root:
+
+    python -m benchmarks.job_queue --jobs 2000 --job-ms 2 --workers 2,8
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import print_table, quiet_logging, summarize, write_json
+
+JOB_NAME = "benchmark_sleep"
+
+
+async def measure(queue, jobs: int, job_ms: float) -> dict:
+    from app.core.jobs import enqueue_job, set_job_queue
+
+    set_job_queue(queue)
+    if queue is not None:
+        queue.start()
+    latencies = []
+    start = time.perf_counter()
+    for i in range(jobs):
+        call_start = time.perf_counter()
+        await enqueue_job(JOB_NAME, {"n": i, "sleep": job_ms / 1000})
+        latencies.append(time.perf_counter() - call_start)
+    enqueue_s = time.perf_counter() - start
+    drain_start = time.perf_counter()
+    if queue is not None:
+        await queue.drain(timeout=3600)
+    drain_s = time.perf_counter() - drain_start
+
+    summary = summarize(latencies)
+    return {
+        "p50_ms": summary["p50_ms"],
+        "p99_ms": summary["p99_ms"],
+        "requests_per_s": jobs / enqueue_s,
+        "drain_s": drain_s,
+        "jobs_per_s": jobs / (enqueue_s + drain_s),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--job-ms", type=float, default=2.0, help="simulated work per job")
+    parser.add_argument("--workers", default="2,8", help="comma-separated memory queue worker counts")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from app.core.jobs import MemoryJobQueue, job_handler
+
+    @job_handler(JOB_NAME)
+    async def sleep_job(payload, db):
+        await asyncio.sleep(payload["sleep"])
+
+    results = {"inline": await measure(None, args.jobs, args.job_ms)}
+    for workers in (int(w) for w in args.workers.split(",") if w):
+        queue = MemoryJobQueue(workers=workers, max_size=args.jobs)
+        results[f"memory x{workers}"] = await measure(queue, args.jobs, args.job_ms)
+
+    print_table(f"enqueue_job for {args.jobs} jobs of {args.job_ms:g} ms", results)
+    write_json(args.output, {"benchmark": "job_queue", "jobs": args.jobs, "job_ms": args.job_ms, "results": results})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
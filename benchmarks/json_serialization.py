@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Serialization time for large item lists: FastAPI default vs TypeAdapter
+
+"fastapi" runs the exact pipeline FastAPI applies to a returned list of
+ORM objects (response-model validation, jsonable_encoder, JSONResponse
+with stdlib json); "type_adapter" is app.core.responses.json_response.
+No database is needed: the items are transient ORM instances. Run from
+the repository root:
+
+    python -m benchmarks.json_serialization --items 10000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from benchmarks.common import print_table, quiet_logging, summarize, write_json
+
+
+def build_items(count: int):
+    from app.models.item import Item
+
+    start = datetime(2024, 1, 1)
+    return [
+        Item(
+            id=i,
+            title=f"Item {i}",
+            description=f"Description for benchmark item number {i}",
+            owner_id=1,
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+async def time_rounds(func, rounds: int) -> List[float]:
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from app.core.config import settings
+    from app.core.responses import json_response
+    from app.routers.items import ITEM_LIST_ADAPTER
+    from app.schemas.item import ItemResponse
+
+    settings.FAST_JSON_RESPONSES = True
+    items = build_items(args.items)
+    field = create_model_field(name="Response_read_items", type_=List[ItemResponse], mode="serialization")
+
+    async def fastapi_default():
+        content = await serialize_response(field=field, response_content=items, is_coroutine=True)
+        return JSONResponse(content).body
+
+    async def type_adapter():
+        return json_response(ITEM_LIST_ADAPTER, items).body
+
+    assert len(await fastapi_default()) > 0 and len(await type_adapter()) > 0
+
+    results = {}
+    for name, func in (("fastapi", fastapi_default), ("type_adapter", type_adapter)):
+        await func()  # warm up
+        summary = summarize(await time_rounds(func, args.rounds))
+        results[name] = {k: summary[k] for k in ("p50_ms", "p95_ms", "max_ms")}
+        results[name]["body_bytes"] = len(await func())
+
+    speedup = results["fastapi"]["p50_ms"] / results["type_adapter"]["p50_ms"]
+    print_table(f"Serializing {args.items} items ({args.rounds} rounds), {speedup:.1f}x faster", results)
+    write_json(args.output, {"benchmark": "json_serialization", "items": args.items, "results": results})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
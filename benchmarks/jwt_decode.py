@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Bearer token decode throughput, cold vs cached
+
+"cold" verifies every token with python-jose; "cached" serves repeat tokens
+from the verified-token cache. Run from the repository root:
+
+    python -m benchmarks.jwt_decode --tokens 100 --iterations 50000
+"""
+
+import argparse
+import time
+
+from benchmarks.common import print_table, quiet_logging, write_json
+
+
+def measure(decode, tokens, iterations: int):
+    count = len(tokens)
+    start = time.perf_counter()
+    for i in range(iterations):
+        decode(tokens[i % count])
+    elapsed = time.perf_counter() - start
+    return {"tokens_per_s": iterations / elapsed, "us_per_token": elapsed / iterations * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=100, help="distinct tokens in rotation")
+    parser.add_argument("--iterations", type=int, default=50000)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from jose import jwt
+    from app.core.config import settings
+    from app.core import security
+
+    tokens = [security.create_access_token({"sub": f"bench-user-{i}"}) for i in range(args.tokens)]
+
+    results = {}
+    results["jose_per_call"] = measure(
+        lambda t: jwt.decode(t, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]),
+        tokens, args.iterations,
+    )
+    results["codec_cold"] = measure(security.token_codec.decode, tokens, args.iterations)
+
+    security.token_cache.clear()
+    results["decode_cached"] = measure(security.decode_access_token, tokens, args.iterations)
+
+    print_table(f"JWT decode throughput ({args.tokens} distinct tokens)", results)
+    write_json(args.output, {"benchmark": "jwt_decode", "results": results})
+
+
+if __name__ == "__main__":
+    main()
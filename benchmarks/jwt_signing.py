@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+JWT sign/verify throughput: HS256 vs ES256 vs EdDSA
+
+Each algorithm goes through TokenCodec as the app uses it: HS256 with
+SECRET_KEY, ES256 and EdDSA with a key ring holding one freshly generated
+key in a temporary directory (tokens carry its kid). Claims match an
+access token; the verified-token cache is not involved, so "verify" is
+the cost of every first-seen token. token_bytes is the encoded length a
+client sends on each request. Run from the repository root:
+
+    python -m benchmarks.jwt_signing --iterations 20000
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from benchmarks.common import print_table, quiet_logging, write_json
+
+ALGORITHMS = ("HS256", "ES256", "EdDSA")
+
+
+def measure(codec, iterations: int) -> dict:
+    claims = {"sub": "bench-user", "exp": int(time.time()) + 1800, "type": "access", "jti": uuid.uuid4().hex}
+    token = codec.encode(claims)  # warms imports and key construction
+    codec.decode(token)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        codec.encode(claims)
+    sign_s = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        codec.decode(token)
+    verify_s = (time.perf_counter() - start) / iterations
+
+    return {
+        "sign_per_s": 1 / sign_s,
+        "verify_per_s": 1 / verify_s,
+        "sign_us": sign_s * 1e6,
+        "verify_us": verify_s * 1e6,
+        "token_bytes": len(token),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000, help="signs and verifies per algorithm")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from app.core.config import settings
+    from app.core.keys import KeyRing, write_key
+    from app.core.security import TokenCodec
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for algorithm in ALGORITHMS:
+            key_ring = None
+            if algorithm != "HS256":
+                directory = Path(tmp) / algorithm
+                write_key(directory, algorithm, time.time())
+                key_ring = KeyRing(str(directory), reload_seconds=60.0)
+            codec = TokenCodec(settings.SECRET_KEY, algorithm, key_ring)
+            results[algorithm] = measure(codec, args.iterations)
+
+    print_table(f"JWT sign/verify, {args.iterations} iterations per algorithm", results)
+    write_json(args.output, {"benchmark": "jwt_signing", "iterations": args.iterations, "results": results})
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Load generator for every API endpoint
+
+Runs each scenario with N concurrent workers and reports RPS and
+p50/p95/p99 latency. By default requests go straight into the ASGI app
+in-process (the app's startup/shutdown hooks run, so the database from .env
+must be reachable, e.g. `docker compose up db`); `--base-url` targets a
+running server over HTTP instead. Run from the repository root:
+
+    python -m benchmarks.load --concurrency 20 --requests 2000 --output results.json
+    python -m benchmarks.load --base-url http://localhost:8000 --scenarios health,list_items
+    python -m benchmarks.load --compare results.json   # show change against an earlier run
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import time
+import uuid
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+from benchmarks.common import AsgiClient, HttpClient, print_table, quiet_logging, summarize, write_json
+
+SCENARIOS = [
+    "health", "root", "register", "login", "refresh",
+    "create_item", "list_items", "get_item", "delete_item",
+]
+ANONYMOUS_SCENARIOS = {"health", "root"}
+PASSWORD = "benchmark-password"
+JSON = {"content-type": "application/json"}
+FORM = {"content-type": "application/x-www-form-urlencoded"}
+
+
+class Session:
+    """Per-worker state: a registered user, its tokens and its items"""
+
+    def __init__(self, client, run_id: str, worker: int):
+        self.client = client
+        self.username = f"load_{run_id}_{worker}"
+        self.access_token = None
+        self.refresh_token = None
+        self.item_ids = []
+        self.counter = 0
+
+    @property
+    def auth(self):
+        return {"authorization": f"Bearer {self.access_token}", **JSON}
+
+    async def checked(self, method, path, **kwargs):
+        status, headers, body = await self.client.request(method, path, **kwargs)
+        if status >= 400:
+            raise RuntimeError(f"{method} {path} -> {status}: {body[:200]!r}")
+        return json.loads(body) if body else None
+
+    async def setup(self):
+        await self.checked("POST", "/api/auth/register", headers=JSON, body=json.dumps(
+            {"username": self.username, "email": f"{self.username}@example.com", "password": PASSWORD}
+        ).encode())
+        tokens = await self.checked("POST", "/api/auth/login", headers=FORM,
+                                    body=f"username={self.username}&password={PASSWORD}".encode())
+        self.access_token = tokens["access_token"]
+        self.refresh_token = tokens["refresh_token"]
+        for i in range(10):
+            item = await self.checked("POST", "/api/items/", headers=self.auth,
+                                      body=json.dumps({"title": f"seed {i}"}).encode())
+            self.item_ids.append(item["id"])
+
+    # Each scenario returns the request it times as (method, path, kwargs);
+    # any untimed preparation happens before returning.
+
+    async def health(self):
+        return "GET", "/health", {}
+
+    async def root(self):
+        return "GET", "/", {}
+
+    async def register(self):
+        self.counter += 1
+        name = f"{self.username}_r{self.counter}"
+        return "POST", "/api/auth/register", {"headers": JSON, "body": json.dumps(
+            {"username": name, "email": f"{name}@example.com", "password": PASSWORD}
+        ).encode()}
+
+    async def login(self):
+        return "POST", "/api/auth/login", {
+            "headers": FORM, "body": f"username={self.username}&password={PASSWORD}".encode()
+        }
+
+    async def refresh(self):
+        return "POST", "/api/auth/refresh", {"query_string": f"refresh_token={quote(self.refresh_token)}"}
+
+    def refresh_done(self, body: bytes):
+        # Refresh tokens are single use; continue with the rotated one
+        self.refresh_token = json.loads(body)["refresh_token"]
+
+    async def create_item(self):
+        self.counter += 1
+        return "POST", "/api/items/", {"headers": self.auth,
+                                        "body": json.dumps({"title": f"load item {self.counter}"}).encode()}
+
+    async def list_items(self):
+        return "GET", "/api/items/", {"headers": self.auth, "query_string": "limit=50"}
+
+    async def get_item(self):
+        self.counter += 1
+        return "GET", f"/api/items/{self.item_ids[self.counter % len(self.item_ids)]}", {"headers": self.auth}
+
+    async def delete_item(self):
+        item = await self.checked("POST", "/api/items/", headers=self.auth,
+                                  body=json.dumps({"title": "to delete"}).encode())
+        return "DELETE", f"/api/items/{item['id']}", {"headers": self.auth}
+
+
+async def run_scenario(sessions, scenario: str, total: int, duration: float):
+    latencies = []
+    errors = 0
+    issued = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker(session: Session):
+        nonlocal errors, issued
+        # Optional <scenario>_done(body) hook, called with each successful response
+        done = getattr(session, f"{scenario}_done", None)
+        while (deadline is None and issued < total) or (deadline and time.perf_counter() < deadline):
+            issued += 1
+            method, path, kwargs = await getattr(session, scenario)()
+            start = time.perf_counter()
+            try:
+                status, _, body = await session.client.request(method, path, **kwargs)
+            except Exception:
+                status, body = None, None
+            latencies.append(time.perf_counter() - start)
+            if status is None or status >= 400:
+                errors += 1
+            elif done:
+                done(body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(s) for s in sessions))
+    elapsed = time.perf_counter() - started
+    summary = summarize(latencies, elapsed)
+    summary["errors"] = errors
+    return summary
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return None
+
+
+def print_comparison(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = {}
+    for name, current in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        rows[name] = {
+            f"{key}_change_%": (current[key] - previous[key]) / previous[key] * 100
+            for key in ("rps", "p50_ms", "p99_ms")
+            if previous.get(key)
+        }
+    print_table(f"Change against {baseline_path} ({baseline.get('revision')})", rows)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="target a running server instead of the in-process app")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma separated, from: " + ", ".join(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--duration", type=float, default=0, help="seconds per scenario (overrides --requests)")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="earlier JSON results to compare against")
+    args = parser.parse_args()
+
+    scenarios = [s for s in args.scenarios.split(",") if s]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    app = None
+    if args.base_url:
+        make_client = lambda: HttpClient(args.base_url)
+    else:
+        quiet_logging()
+        from app.core.config import settings
+        from app.main import app
+        # Every worker logs in from the same address; measure the endpoints, not the limiter
+        settings.RATE_LIMIT_ENABLED = False
+        await app.router.startup()
+        make_client = lambda: AsgiClient(app)
+
+    run_id = uuid.uuid4().hex[:8]
+    sessions = [Session(make_client(), run_id, i) for i in range(args.concurrency)]
+    try:
+        if any(s not in ANONYMOUS_SCENARIOS for s in scenarios):
+            await asyncio.gather(*(s.setup() for s in sessions))
+        results = {}
+        for scenario in scenarios:
+            results[scenario] = await run_scenario(sessions, scenario, args.requests, args.duration)
+    finally:
+        for s in sessions:
+            await s.client.close()
+        if app is not None:
+            await app.router.shutdown()
+
+    target = args.base_url or "in-process ASGI"
+    print_table(f"Load test against {target}, concurrency {args.concurrency}", results)
+    if args.compare:
+        print_comparison(results, args.compare)
+    write_json(args.output, {
+        "benchmark": "load",
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "target": target,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "duration": args.duration,
+        "results": results,
+    })
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Requests/sec with INFO logging: direct handlers vs the queued pipeline
+
+Drives /health and / in-process with the application's real log handlers
+(written to a temporary directory). Run from the repository root:
+
+    python -m benchmarks.logging_pipeline --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import tempfile
+import time
+
+from benchmarks.common import asgi_request, print_table, write_json
+
+
+async def drive(app, total: int, concurrency: int) -> float:
+    paths = ["/health", "/"]
+    per_worker = total // concurrency
+
+    async def worker(n: int):
+        for i in range(per_worker):
+            await asgi_request(app, "GET", paths[(n + i) % 2])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--console", action="store_true", help="keep console output instead of discarding it")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    from app.core.config import settings
+    from app.core import logging as app_logging
+    from app.main import app
+
+    settings.LOG_LEVEL = settings.LOG_FILE_LEVEL = settings.LOG_CONSOLE_LEVEL = "INFO"
+    results = {}
+    for name, queued in (("direct", False), ("queued", True)):
+        with tempfile.TemporaryDirectory() as log_dir:
+            with open(os.devnull, "w") as devnull:
+                stderr = contextlib.nullcontext() if args.console else contextlib.redirect_stderr(devnull)
+                with stderr:
+                    app_logging.setup_logging(queue_enabled=queued, log_dir=log_dir)
+                    elapsed = await drive(app, args.requests, args.concurrency)
+                    stats = app_logging.get_log_queue_stats()
+                    drain_start = time.perf_counter()
+                    app_logging.stop_logging()
+                    drain = time.perf_counter() - drain_start
+            results[name] = {
+                "rps": args.requests / elapsed,
+                "elapsed_s": elapsed,
+                "drain_s": drain,
+                "dropped": stats.get("dropped", 0),
+            }
+
+    print_table(f"/health + / with INFO logging ({args.requests} requests)", results)
+    write_json(args.output, {"benchmark": "logging_pipeline", "results": results})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+RPS on / and /health: BaseHTTPMiddleware vs the pure ASGI middleware
+
+Both apps serve the real root and health endpoints and do the same
+per-request work (metrics + access log); only the middleware plumbing
+differs. Run from the repository root:
+
+    python -m benchmarks.middleware_overhead --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+
+from benchmarks.common import asgi_request, print_table, quiet_logging, write_json
+
+
+def build_apps():
+    from app.core.database import request_db_stats
+    from app.core.middleware import RequestLoggingMiddleware, record_request
+    from app.main import health_check, root
+
+    def with_routes(app):
+        app.get("/")(root)
+        app.get("/health")(health_check)
+        return app
+
+    legacy = with_routes(FastAPI())
+
+    # The previous @app.middleware("http") implementation
+    @legacy.middleware("http")
+    async def log_requests(request: Request, call_next):
+        start_time = time.perf_counter()
+        db_stats = [0, 0.0]
+        request_db_stats.set(db_stats)
+        try:
+            response = await call_next(request)
+            content_length = response.headers.get("content-length")
+            record_request(request.scope, response.status_code, time.perf_counter() - start_time,
+                           db_stats, int(content_length) if content_length else None)
+            return response
+        except Exception as e:
+            record_request(request.scope, 500, time.perf_counter() - start_time, db_stats, error=str(e))
+            raise
+
+    asgi = with_routes(FastAPI())
+    asgi.add_middleware(RequestLoggingMiddleware)
+    return {"base_http": legacy, "pure_asgi": asgi}
+
+
+async def drive(app, path: str, total: int, concurrency: int) -> float:
+    per_worker = total // concurrency
+
+    async def worker():
+        for _ in range(per_worker):
+            await asgi_request(app, "GET", path)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return per_worker * concurrency / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    apps = build_apps()
+    results = {}
+    for name, app in apps.items():
+        await drive(app, "/health", 500, 10)  # warm up
+        results[name] = {
+            "health_rps": await drive(app, "/health", args.requests, args.concurrency),
+            "root_rps": await drive(app, "/", args.requests, args.concurrency),
+        }
+
+    print_table(f"Middleware overhead ({args.requests} requests, concurrency {args.concurrency})", results)
+    write_json(args.output, {"benchmark": "middleware_overhead", "results": results})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
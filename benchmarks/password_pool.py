@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+/health latency while bcrypt logins are in flight
+
+Compares verifying passwords on the event loop (the old behaviour) with the
+executor-backed password service. Run from the repository root:
+
+    python -m benchmarks.password_pool --concurrency 8 --duration 10
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import asgi_request, print_table, quiet_logging, summarize, write_json
+
+
+async def run_mode(app, executor: str, concurrency: int, duration: float, hashed: str):
+    from app.core.password_service import PasswordService, PasswordServiceBusy
+
+    service = PasswordService(executor=executor, max_pending=0)
+    stop_at = time.perf_counter() + duration
+    verified = 0
+    latencies = []
+
+    async def login_worker():
+        nonlocal verified
+        while time.perf_counter() < stop_at:
+            try:
+                await service.verify("benchmark-password", hashed)
+                verified += 1
+            except PasswordServiceBusy:
+                await asyncio.sleep(0.01)
+            # Yield like a real handler does between awaits
+            await asyncio.sleep(0)
+
+    async def health_prober():
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            await asgi_request(app, "GET", "/health")
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0.005)
+
+    # Warm the pool so process start-up is not measured
+    await service.verify("benchmark-password", hashed)
+    started = time.perf_counter()
+    await asyncio.gather(health_prober(), *(login_worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    service.shutdown()
+
+    summary = summarize(latencies)
+    summary["logins_per_s"] = verified / elapsed
+    return summary
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent logins in flight")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per mode")
+    parser.add_argument("--modes", default="inline,process", help="comma separated executors to compare")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from app.main import app
+    from app.core.security import get_pwd_context
+
+    hashed = get_pwd_context().hash("benchmark-password")
+    results = {}
+    for mode in args.modes.split(","):
+        results[mode] = await run_mode(app, mode, args.concurrency, args.duration, hashed)
+
+    print_table(f"/health latency with {args.concurrency} concurrent logins", results)
+    write_json(args.output, {"benchmark": "password_pool", "concurrency": args.concurrency, "results": results})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
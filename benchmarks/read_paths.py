@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Listing cost per row: ORM entities vs column projections
+
+Loads N items into an in-memory SQLite database and times the full read
+path of GET /api/items/ for both query shapes: fetch the rows, map them
+into ItemResponse and encode the JSON body. "orm" selects Item entities
+(the previous implementation), "core" selects ITEM_COLUMNS as the router
+does now. CPU time is process time; memory is the tracemalloc peak while
+the rows are held. SQLite stands in for Postgres so the comparison
+isolates the Python-side cost. Run from the repository root:
+
+    python -m benchmarks.read_paths --items 100000 --rounds 3
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from benchmarks.common import print_table, quiet_logging, write_json
+
+
+def build_database(count: int):
+    from app.core.database import Base
+    from app.models.item import Item
+    from app.models.user import User
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{
+            "id": 1, "username": "bench", "email": "bench@example.com", "hashed_password": "x", "is_active": True,
+        }])
+        conn.execute(insert(Item), [
+            {
+                "title": f"Item {i}",
+                "description": f"Description for benchmark item number {i}",
+                "owner_id": 1,
+                "created_at": start + timedelta(seconds=i),
+            }
+            for i in range(count)
+        ])
+    return engine
+
+
+def run_listing(engine, query, scalars: bool, adapter):
+    with Session(engine) as session:
+        result = session.execute(query)
+        rows = result.scalars().all() if scalars else result.all()
+        body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+        return len(rows), len(body)
+
+
+def measure(engine, query, scalars: bool, adapter, rounds: int) -> dict:
+    run_listing(engine, query, scalars, adapter)  # warm up
+    cpu = []
+    for _ in range(rounds):
+        gc.collect()
+        start = time.process_time()
+        rows, body_bytes = run_listing(engine, query, scalars, adapter)
+        cpu.append(time.process_time() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    run_listing(engine, query, scalars, adapter)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(cpu)
+    return {
+        "rows": rows,
+        "cpu_ms": best * 1000,
+        "cpu_us_per_row": best / rows * 1e6,
+        "peak_mb": peak / 1024 / 1024,
+        "bytes_per_row": peak / rows,
+        "body_bytes": body_bytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from app.models.item import Item
+    from app.routers.items import ITEM_COLUMNS, ITEM_LIST_ADAPTER
+
+    engine = build_database(args.items)
+    order = (Item.created_at, Item.id)
+    results = {
+        "orm": measure(engine, select(Item).order_by(*order), True, ITEM_LIST_ADAPTER, args.rounds),
+        "core": measure(engine, select(*ITEM_COLUMNS).order_by(*order), False, ITEM_LIST_ADAPTER, args.rounds),
+    }
+
+    print_table(f"Listing {args.items} items (best of {args.rounds} rounds)", results)
+    write_json(args.output, {"benchmark": "read_paths", "items": args.items, "results": results})
+
+
+if __name__ == "__main__":
+    main()
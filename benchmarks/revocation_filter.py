@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Revocation Bloom filter: false-positive rate, per-check cost and memory
+
+Builds the filter get_current_user consults for each access token, holding
+N revoked token ids (uuid4 hex, as issued), at REVOCATION_BLOOM_FP_RATE,
+and probes it with ids that were never revoked:
+
+    fp_*_ppm      never-revoked ids per million reported as "maybe" (each
+                  costs one Postgres lookup): "built" is the filter as
+                  rebuilt by the workers (sized at twice the ids, for the
+                  revocations added until the next rebuild), "full" one
+                  filled to its capacity; "target" is the configured rate
+    check_us      RevocationList.is_revoked for a never-revoked id, the
+                  path taken by almost every authenticated request
+    set_check_us  the same membership test against a Python set, which
+                  needs far more memory (set_bytes) for the same ids
+
+No database is needed. Run from the repository root:
+
+    python -m benchmarks.revocation_filter --sizes 10000,100000,1000000 --probes 1000000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+
+from benchmarks.common import print_table, quiet_logging, write_json
+
+
+async def measure(size: int, probes: int, fp_rate: float) -> dict:
+    from app.core.revocation import BloomFilter, RevocationList
+
+    revoked = [uuid.uuid4().hex for _ in range(size)]
+    absent = [uuid.uuid4().hex for _ in range(probes)]
+    revocation_list = RevocationList(fp_rate=fp_rate, min_capacity=size)
+
+    start = time.perf_counter()
+    bloom = revocation_list.build(revoked)
+    build_s = time.perf_counter() - start
+    revocation_list.install(bloom)
+
+    assert all(jti in bloom for jti in revoked[:1000])  # no false negatives
+    false_positives = [jti for jti in absent if jti in bloom]
+    negatives = [jti for jti in absent if jti not in bloom]
+
+    full = BloomFilter(size, fp_rate)
+    for jti in revoked:
+        full.add(jti)
+    full_false_positives = sum(1 for jti in absent if jti in full)
+
+    # Bloom negatives never touch the session, so no database is needed
+    start = time.perf_counter()
+    for jti in negatives:
+        await revocation_list.is_revoked(None, jti)
+    check_s = (time.perf_counter() - start) / len(negatives)
+
+    revoked_set = set(revoked)
+    start = time.perf_counter()
+    for jti in negatives:
+        jti in revoked_set
+    set_check_s = (time.perf_counter() - start) / len(negatives)
+    set_bytes = sys.getsizeof(revoked_set) + sum(sys.getsizeof(jti) for jti in revoked)
+
+    return {
+        "fp_built_ppm": 1e6 * len(false_positives) / probes,
+        "fp_full_ppm": 1e6 * full_false_positives / probes,
+        "target_ppm": 1e6 * fp_rate,
+        "check_us": check_s * 1e6,
+        "set_check_us": set_check_s * 1e6,
+        "build_ms": build_s * 1000,
+        "bloom_bytes": bloom.size_bytes,
+        "set_bytes": set_bytes,
+        "hashes": bloom.hash_count,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma-separated revoked id counts")
+    parser.add_argument("--probes", type=int, default=1000000, help="never-revoked ids checked per size")
+    parser.add_argument("--fp-rate", type=float, help="target false-positive rate (default from settings)")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from app.core.config import settings
+
+    fp_rate = args.fp_rate or settings.REVOCATION_BLOOM_FP_RATE
+    results = {}
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        results[f"{size} revoked"] = await measure(size, args.probes, fp_rate)
+
+    print_table(f"Revocation filter at target FP rate {fp_rate:g}, {args.probes} probes", results)
+    write_json(args.output, {"benchmark": "revocation_filter", "fp_rate": fp_rate, "results": results})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Item search latency: full-text/trigram search vs an ILIKE scan
+
+Seeds one user with --items items (1M by default; reused across runs when
+the count already matches) in the configured Postgres (see .env), then
+times one page of results per query:
+
+    search  the GET /api/items/search query: search_vector @@ prefix tsquery
+            or title %> q, ranked, served by the GIN indexes
+    ilike   title ILIKE '%q%' OR description ILIKE '%q%', oldest first,
+            what a search without the indexes looks like
+
+Queries cover a common word, a rare word, a two-word phrase, a prefix and
+a misspelling. Run from the repository root:
+
+    python -m benchmarks.search --items 1000000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from benchmarks.common import print_table, quiet_logging, summarize, write_json
+
+USERNAME = "search_bench"
+SYLLABLES = ("ka", "lo", "mi", "ser", "tan", "vo", "rel", "dra", "pin", "gu", "nex", "ta", "bor", "li", "fen")
+
+
+def vocabulary(rng: random.Random, size: int = 5000):
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    words = sorted(words)
+    rng.shuffle(words)  # so word frequency is unrelated to spelling
+    return words
+
+
+def make_text(rng: random.Random, words, count: int) -> str:
+    # Zipf-like: low indexes are picked far more often than high ones
+    return " ".join(words[min(int(rng.paretovariate(1.0)) - 1, len(words) - 1)] for _ in range(count))
+
+
+async def seed(items: int, words) -> int:
+    import asyncpg
+    from app.core.database import get_engine
+    from app.core.migrations import _asyncpg_dsn
+    from app.models.item import Item
+    from app.models.user import User
+
+    engine = get_engine()
+    async with engine.begin() as conn:
+        await conn.execute(pg_insert(User).values(
+            username=USERNAME, email=f"{USERNAME}@example.com", hashed_password="x", is_active=True,
+        ).on_conflict_do_nothing())
+        owner_id = (await conn.execute(select(User.id).where(User.username == USERNAME))).scalar_one()
+        existing = (await conn.execute(select(func.count()).where(Item.owner_id == owner_id))).scalar_one()
+        if existing == items:
+            return owner_id
+        await conn.execute(delete(Item).where(Item.owner_id == owner_id))
+
+    print(f"Seeding {items} items for {USERNAME} ...")
+    rng = random.Random(42)
+    conn = await asyncpg.connect(_asyncpg_dsn())
+    try:
+        batch_size = 50000
+        for start in range(0, items, batch_size):
+            records = [
+                (make_text(rng, words, rng.randint(3, 6)), make_text(rng, words, rng.randint(8, 20)), owner_id)
+                for _ in range(min(batch_size, items - start))
+            ]
+            await conn.copy_records_to_table("items", records=records, columns=["title", "description", "owner_id"])
+        await conn.execute("ANALYZE items")
+    finally:
+        await conn.close()
+    return owner_id
+
+
+def queries(words):
+    common, rare = words[0], words[len(words) // 2]
+    typo = rare[:3] + rare[4:]  # one letter dropped
+    return {
+        "common": common,
+        "rare": rare,
+        "phrase": f"{common} {words[1]}",
+        "prefix": rare[:4],
+        "typo": typo,
+    }
+
+
+async def measure(statement_for, owner_id: int, q: str, rounds: int) -> dict:
+    from app.core.database import get_engine
+
+    latencies = []
+    rows = 0
+    async with get_engine().connect() as conn:
+        for i in range(rounds + 1):
+            start = time.perf_counter()
+            rows = len((await conn.execute(statement_for(owner_id, q))).all())
+            if i:  # the first run warms the connection and the plan
+                latencies.append(time.perf_counter() - start)
+    summary = summarize(latencies)
+    return {"p50_ms": summary["p50_ms"], "p95_ms": summary["p95_ms"], "rows": rows}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000000)
+    parser.add_argument("--rounds", type=int, default=20, help="timed runs per query")
+    parser.add_argument("--limit", type=int, default=50, help="page size")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from app.core.database import dispose_engine
+    from app.core.migrations import upgrade
+    from app.models.item import Item
+    from app.routers.items import ITEM_COLUMNS, _prefix_tsquery, _search_items_query
+
+    def search(owner_id: int, q: str):
+        return _search_items_query(owner_id, q, _prefix_tsquery(q), None).limit(args.limit + 1)
+
+    def ilike(owner_id: int, q: str):
+        pattern = f"%{q}%"
+        return (
+            select(*ITEM_COLUMNS)
+            .where(Item.owner_id == owner_id, or_(Item.title.ilike(pattern), Item.description.ilike(pattern)))
+            .order_by(Item.created_at, Item.id)
+            .limit(args.limit + 1)
+        )
+
+    await upgrade()
+    words = vocabulary(random.Random(7))
+    owner_id = await seed(args.items, words)
+
+    results = {}
+    for name, q in queries(words).items():
+        for mode, statement_for in (("search", search), ("ilike", ilike)):
+            results[f"{mode}:{name} ({q})"] = await measure(statement_for, owner_id, q, args.rounds)
+
+    await dispose_engine()
+    print_table(f"Search latency over {args.items} items, page of {args.limit}", results)
+    write_json(args.output, {"benchmark": "search", "items": args.items, "results": results})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
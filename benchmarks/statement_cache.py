@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+get_current_user lookup latency with and without statement caching
+
+Runs the user-by-username projection from get_current_user against the
+configured Postgres (see .env) under three engine setups:
+
+    uncached  prepared statement cache and compiled SQL cache disabled
+    cached    DB_STATEMENT_CACHE_SIZE / DB_COMPILED_CACHE_SIZE defaults
+    prewarm   cached, plus hot statements prepared on connect
+
+Each round opens a fresh single-connection engine, so "first_ms" is the
+first lookup on a new connection and the warm figures cover the lookups
+after it. Run from the repository root:
+
+    python -m benchmarks.statement_cache --rounds 20 --lookups 500
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.common import print_table, quiet_logging, summarize, write_json
+
+
+CONFIGS = {
+    "uncached": {"statement_cache_size": 0, "compiled_cache_size": 0, "prewarm": False},
+    "cached": {"statement_cache_size": None, "compiled_cache_size": None, "prewarm": False},
+    "prewarm": {"statement_cache_size": None, "compiled_cache_size": None, "prewarm": True},
+}
+
+
+def cache_counts():
+    from app.core.database import db_statement_cache_total
+    return {
+        key: int(db_statement_cache_total.labels(*key).value)
+        for key in (("prepared", "hit"), ("prepared", "miss"), ("compiled", "hit"), ("compiled", "miss"))
+    }
+
+
+async def run_config(config: dict, username: str, rounds: int, lookups: int) -> dict:
+    from app.core import database
+    from app.core.config import settings
+    from app.routers.items import _user_by_username_query
+
+    statement_cache_size = config["statement_cache_size"]
+    if statement_cache_size is None:
+        statement_cache_size = settings.DB_STATEMENT_CACHE_SIZE
+    compiled_cache_size = config["compiled_cache_size"]
+    if compiled_cache_size is None:
+        compiled_cache_size = settings.DB_COMPILED_CACHE_SIZE
+    settings.DB_STATEMENT_CACHE_SIZE = statement_cache_size
+    settings.DB_PREWARM_STATEMENTS = config["prewarm"]
+
+    first, warm = [], []
+    before = cache_counts()
+    for _ in range(rounds):
+        engine = create_async_engine(
+            database.DATABASE_URL,
+            pool_size=1,
+            max_overflow=0,
+            query_cache_size=compiled_cache_size,
+            connect_args={"prepared_statement_cache_size": statement_cache_size},
+        )
+        event.listen(engine.sync_engine.pool, "connect", database._prewarm_statements)
+        event.listen(engine.sync_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, parameters, context, executemany:
+                     database._record_cache_lookups(conn, statement, context, executemany))
+        async with engine.connect() as conn:
+            for i in range(lookups + 1):
+                start = time.perf_counter()
+                row = (await conn.execute(_user_by_username_query(username))).first()
+                elapsed = time.perf_counter() - start
+                assert row is not None
+                (warm if i else first).append(elapsed)
+        await engine.dispose()
+    after = cache_counts()
+
+    summary = summarize(warm)
+    result = {
+        "first_ms": sum(first) / len(first) * 1000,
+        "p50_ms": summary["p50_ms"],
+        "p99_ms": summary["p99_ms"],
+    }
+    for cache in ("prepared", "compiled"):
+        hits = after[(cache, "hit")] - before[(cache, "hit")]
+        misses = after[(cache, "miss")] - before[(cache, "miss")]
+        result[f"{cache}_hit_%"] = 100.0 * hits / (hits + misses) if hits + misses else 0.0
+    return result
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20, help="fresh connections per setup")
+    parser.add_argument("--lookups", type=int, default=500, help="warm lookups per connection")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from app.core.database import dispose_engine, get_engine
+    from app.core.migrations import upgrade
+    from app.models.user import User
+
+    username = f"bench_{uuid.uuid4().hex[:8]}"
+    await upgrade()
+    async with get_engine().begin() as conn:
+        await conn.execute(pg_insert(User).values(
+            username=username, email=f"{username}@example.com", hashed_password="x", is_active=True,
+        ).on_conflict_do_nothing())
+    await dispose_engine()
+
+    results = {}
+    for name, config in CONFIGS.items():
+        results[name] = await run_config(config, username, args.rounds, args.lookups)
+
+    print_table(f"get_current_user lookup ({args.rounds} connections x {args.lookups} lookups)", results)
+    write_json(args.output, {"benchmark": "statement_cache", "results": results})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Throughput scaling of the production server across worker counts
+
+Starts `python -m app.server` once per worker count (SERVER_WORKERS=1, 2,
+4, 8 by default) on a free local port, drives it over HTTP keep-alive from
+several load-generator processes so the client is not the bottleneck, and
+reports RPS and latency per worker count. The server's startup hooks run,
+so the database from .env must be reachable. Run from the repository root
+on a machine with at least as many cores as the largest worker count:
+
+    python -m benchmarks.worker_scaling --workers 1,2,4,8 --duration 15 --path /health
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+from benchmarks.common import HttpClient, print_table, summarize, write_json
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(port: int, process: subprocess.Popen, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited with code {process.returncode} during startup")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server did not accept connections within {timeout:.0f}s")
+
+
+async def generate_load(port: int, path: str, concurrency: int, duration: float):
+    client = HttpClient(f"http://127.0.0.1:{port}")
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                status, _, _ = await client.request("GET", path)
+                if status >= 400:
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    await client.close()
+    return latencies, errors
+
+
+def client_process(args):
+    return asyncio.run(generate_load(*args))
+
+
+def run_workers(workers: int, args) -> dict:
+    port = free_port()
+    env = {
+        **os.environ,
+        "SERVER_WORKERS": str(workers),
+        "PORT": str(port),
+        "HOST": "127.0.0.1",
+        "LOG_CONSOLE_LEVEL": "WARNING",
+        "LOG_FILE_LEVEL": "WARNING",
+        "ACCESS_LOG_ENABLED": "false",
+    }
+    server = subprocess.Popen([sys.executable, "-m", "app.server"], env=env)
+    try:
+        wait_until_ready(port, server)
+        time.sleep(args.settle)  # let every worker finish its startup hooks
+        per_client = max(1, args.concurrency // args.clients)
+        job = (port, args.path, per_client, args.duration)
+        started = time.perf_counter()
+        with multiprocessing.Pool(args.clients) as pool:
+            results = pool.map(client_process, [job] * args.clients)
+        elapsed = time.perf_counter() - started
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    latencies = [value for values, _ in results for value in values]
+    summary = summarize(latencies, elapsed)
+    summary["errors"] = sum(errors for _, errors in results)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4,8", help="comma-separated worker counts")
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds of load per worker count")
+    parser.add_argument("--concurrency", type=int, default=64, help="open connections in total")
+    parser.add_argument("--clients", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="load-generator processes")
+    parser.add_argument("--settle", type=float, default=2.0, help="seconds to wait after the port opens")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    results = {}
+    for workers in (int(w) for w in args.workers.split(",") if w):
+        results[f"{workers} worker(s)"] = run_workers(workers, args)
+
+    baseline = next(iter(results.values()))["rps"]
+    for row in results.values():
+        row["speedup"] = row["rps"] / baseline if baseline else 0.0
+
+    print_table(f"GET {args.path}: {args.concurrency} connections, {args.clients} client process(es), "
+                f"{args.duration:.0f}s each", results)
+    write_json(args.output, {"benchmark": "worker_scaling", "cpu_count": os.cpu_count(), "results": results})
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Database round trips and latency per write endpoint
+
+Drives register, create item and delete item in-process against the
+configured Postgres (see .env) and counts the database round trips each
+request makes: SQL statements, transaction control (BEGIN/COMMIT/ROLLBACK)
+and pre-ping checks. Run from the repository root:
+
+    python -m benchmarks.write_roundtrips --iterations 200
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from collections import defaultdict
+
+from sqlalchemy import event
+
+from benchmarks.common import asgi_request, print_table, quiet_logging, summarize, write_json
+
+
+class RoundTripCounter:
+    def __init__(self, sync_engine, pre_ping: bool):
+        self.count = 0
+        self.pre_ping = pre_ping
+        event.listen(sync_engine, "before_cursor_execute", self._bump)
+        for name in ("begin", "commit", "rollback"):
+            event.listen(sync_engine, name, self._bump)
+        event.listen(sync_engine.pool, "checkout", self._checkout)
+
+    def _bump(self, *args, **kwargs):
+        self.count += 1
+
+    def _checkout(self, *args):
+        if self.pre_ping:
+            self.count += 1
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200, help="items created and deleted")
+    parser.add_argument("--users", type=int, default=5, help="users registered")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    quiet_logging()
+    from app.core.config import settings
+    from app.core.database import dispose_engine, get_engine
+    from app.core.migrations import upgrade
+    from app.main import app
+
+    await upgrade()
+
+    counter = RoundTripCounter(get_engine().sync_engine, settings.DB_POOL_PRE_PING)
+    latencies = defaultdict(list)
+    round_trips = defaultdict(list)
+
+    async def call(name, method, path, **kwargs):
+        counter.count = 0
+        start = time.perf_counter()
+        status, headers, body = await asgi_request(app, method, path, **kwargs)
+        latencies[name].append(time.perf_counter() - start)
+        round_trips[name].append(counter.count)
+        if status >= 400:
+            raise RuntimeError(f"{method} {path} failed with {status}: {body[:200]!r}")
+        return json.loads(body) if body else None
+
+    run_id = uuid.uuid4().hex[:8]
+    password = "benchmark-password"
+    for i in range(args.users):
+        username = f"bench_{run_id}_{i}"
+        await call("register", "POST", "/api/auth/register",
+                   headers={"content-type": "application/json"},
+                   body=json.dumps({"username": username, "email": f"{username}@example.com", "password": password}).encode())
+
+    tokens = await asgi_request(app, "POST", "/api/auth/login",
+                                headers={"content-type": "application/x-www-form-urlencoded"},
+                                body=f"username=bench_{run_id}_0&password={password}".encode())
+    auth = {"authorization": f"Bearer {json.loads(tokens[2])['access_token']}", "content-type": "application/json"}
+
+    for i in range(args.iterations):
+        item = await call("create_item", "POST", "/api/items/", headers=auth,
+                          body=json.dumps({"title": f"bench item {i}"}).encode())
+        await call("delete_item", "DELETE", f"/api/items/{item['id']}", headers=auth)
+
+    results = {}
+    for name in latencies:
+        results[name] = summarize(latencies[name])
+        results[name]["round_trips"] = sum(round_trips[name]) / len(round_trips[name])
+
+    await dispose_engine()
+    print_table("Write endpoints: latency and DB round trips per request", results)
+    write_json(args.output, {"benchmark": "write_roundtrips", "results": results})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
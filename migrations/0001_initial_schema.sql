@@ -0,0 +1,29 @@
+-- Users and items tables as originally created by Base.metadata.create_all.
+-- IF NOT EXISTS lets databases created that way adopt versioned migrations.
+
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL NOT NULL,
+    username VARCHAR NOT NULL,
+    email VARCHAR NOT NULL,
+    hashed_password VARCHAR NOT NULL,
+    is_active BOOLEAN,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    PRIMARY KEY (id)
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email);
+CREATE INDEX IF NOT EXISTS ix_users_id ON users (id);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users (username);
+
+CREATE TABLE IF NOT EXISTS items (
+    id SERIAL NOT NULL,
+    title VARCHAR NOT NULL,
+    description VARCHAR,
+    owner_id INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    PRIMARY KEY (id),
+    FOREIGN KEY (owner_id) REFERENCES users (id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_items_id ON items (id);
+CREATE INDEX IF NOT EXISTS ix_items_title ON items (title);
\ No newline at end of file
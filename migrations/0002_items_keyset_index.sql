@@ -0,0 +1,7 @@
+-- migrate: no-transaction
+-- Composite index backing keyset pagination of GET /api/items/. Built
+-- CONCURRENTLY so existing tables stay writable, which cannot run inside a
+-- transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_owner_id_created_at_id
+    ON items (owner_id, created_at, id);
\ No newline at end of file
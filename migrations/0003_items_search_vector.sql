@@ -0,0 +1,12 @@
+-- Weighted full-text document for GET /api/items/search: title terms rank
+-- above description terms. Adding a STORED generated column rewrites the
+-- table under an ACCESS EXCLUSIVE lock, so on a large table apply this in
+-- a quiet window. pg_trgm backs the typo-tolerant title match (0005).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE items ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED;
\ No newline at end of file
@@ -0,0 +1,6 @@
+-- migrate: no-transaction
+-- GIN index answering search_vector @@ tsquery, including prefix terms.
+-- The owner filter is combined with it through ix_items_owner_id_created_at_id.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_search_vector
+    ON items USING gin (search_vector);
\ No newline at end of file
@@ -0,0 +1,6 @@
+-- migrate: no-transaction
+-- Trigram index on titles for the typo-tolerant match (title %> query);
+-- it also serves title ILIKE '%...%'.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_title_trgm
+    ON items USING gin (title gin_trgm_ops);
\ No newline at end of file
@@ -0,0 +1,13 @@
+-- Revoked token ids (jti): access and refresh tokens ended by logout, and
+-- refresh tokens consumed by rotation. Rows past expires_at are purged by
+-- the workers when they rebuild their revocation filter.
+
+CREATE TABLE IF NOT EXISTS revoked_tokens (
+    jti VARCHAR NOT NULL,
+    token_type VARCHAR NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    revoked_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    PRIMARY KEY (jti)
+);
+
+CREATE INDEX IF NOT EXISTS ix_revoked_tokens_expires_at ON revoked_tokens (expires_at);
\ No newline at end of file
@@ -0,0 +1,19 @@
+-- Durable job queue (JOBS_BACKEND=postgres). Workers claim due jobs with
+-- SELECT ... FOR UPDATE SKIP LOCKED and delete them in the same transaction
+-- as the job's own writes. A failed attempt moves run_at back; the last
+-- allowed attempt sets failed_at instead, leaving the row for inspection.
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id BIGSERIAL NOT NULL,
+    name VARCHAR NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    failed_at TIMESTAMP WITH TIME ZONE,
+    last_error VARCHAR,
+    PRIMARY KEY (id)
+);
+
+-- Workers only ever look for pending jobs, oldest due first
+CREATE INDEX IF NOT EXISTS ix_jobs_pending_run_at ON jobs (run_at, id) WHERE failed_at IS NULL;
\ No newline at end of file
@@ -0,0 +1,16 @@
+-- Security-relevant events (registrations, logins, logouts, refreshes),
+-- written by the "audit" background job. occurred_at is the request time,
+-- not the write time. Not keyed to users: failed logins may name no user.
+
+CREATE TABLE IF NOT EXISTS audit_events (
+    id BIGSERIAL NOT NULL,
+    event VARCHAR NOT NULL,
+    username VARCHAR,
+    user_id INTEGER,
+    client_ip VARCHAR,
+    details JSONB NOT NULL DEFAULT '{}',
+    occurred_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_audit_events_username_occurred_at ON audit_events (username, occurred_at);
\ No newline at end of file
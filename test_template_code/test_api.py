@@ -170,7 +170,9 @@ class FastAPITester:
         """Logout current user"""
         self.print_header("User Logout")
         
-        result = self.make_request("POST", "/api/auth/logout")
+        # Revokes the access token (sent by make_request) and the refresh token
+        endpoint = f"/api/auth/logout?refresh_token={self.refresh_token}" if self.refresh_token else "/api/auth/logout"
+        result = self.make_request("POST", endpoint)
         
         if result["success"]:
             self.print_success("Logout successful")
@@ -209,6 +211,8 @@ class FastAPITester:
         
         if result["success"]:
             self.access_token = result["data"].get("access_token")
+            # Refresh tokens are single use; the response carries the next one
+            self.refresh_token = result["data"].get("refresh_token", self.refresh_token)
             self.print_success("Access token refreshed successfully")
             self.print_info(f"New access token: {self.access_token[:20]}...")
             return True
@@ -0,0 +1,21 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.import_time import LAZY_MODULES
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_CHILD = (
+    "import sys; import app.main; lazy = sys.argv[1:]; "
+    "print(' '.join(sorted(m for m in sys.modules if m in lazy or m.startswith(tuple(f'{n}.' for n in lazy)))))"
+)
+
+
+def test_importing_app_loads_no_lazy_modules():
+    # A fresh interpreter: this test process may already hold them
+    process = subprocess.run(
+        [sys.executable, "-c", _CHILD, *LAZY_MODULES], cwd=ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert process.returncode == 0, process.stderr[-2000:]
+    assert process.stdout.split() == [], f"imported eagerly, should load on first use: {process.stdout.strip()}"
@@ -0,0 +1,37 @@
+import logging
+import queue
+
+from app.core.logging import BoundedQueueHandler
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord("app", level, __file__, 0, msg, None, None)
+
+
+def _queued(handler: BoundedQueueHandler):
+    return [record.msg for record in handler.queue.queue]
+
+
+def test_full_queue_never_blocks_and_keeps_errors():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2))
+    for msg in ("info 1", "info 2", "info 3"):
+        handler.enqueue(_record(logging.INFO, msg))
+    assert _queued(handler) == ["info 1", "info 2"]
+
+    # Each error takes the place of the oldest queued INFO record
+    handler.enqueue(_record(logging.ERROR, "error 1"))
+    handler.enqueue(_record(logging.WARNING, "warning 1"))
+    assert _queued(handler) == ["error 1", "warning 1"]
+
+    # Nothing left to evict: the new record is dropped instead of waiting
+    handler.enqueue(_record(logging.ERROR, "error 2"))
+    assert _queued(handler) == ["error 1", "warning 1"]
+    assert (handler.enqueued, handler.dropped) == (4, 4)
+
+
+def test_drop_oldest_discards_oldest_low_record():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2), overflow="drop_oldest")
+    handler.enqueue(_record(logging.WARNING, "warning"))
+    handler.enqueue(_record(logging.INFO, "info 1"))
+    handler.enqueue(_record(logging.INFO, "info 2"))
+    assert _queued(handler) == ["warning", "info 2"]
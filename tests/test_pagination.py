@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.routers.items import _owned_items_query
+
+
+def test_cursor_round_trip_keeps_timezone():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+def test_next_page_binds_cursor_as_timestamptz():
+    # asyncpg encodes a tz-aware datetime only for a timestamptz parameter
+    after = decode_cursor(encode_cursor(datetime(2024, 5, 1, tzinfo=timezone.utc), 42))
+    compiled = _owned_items_query(7, after).compile(dialect=asyncpg.dialect())
+
+    sql = str(compiled)
+    assert "(items.created_at, items.id) > ($2::TIMESTAMP WITH TIME ZONE, $3::INTEGER)" in sql
+    assert "WITHOUT TIME ZONE" not in sql
+    params = compiled.construct_params()
+    assert list(params.values()) == [7, after[0], 42]
+
+
+def test_first_page_has_no_keyset_condition():
+    sql = str(_owned_items_query(7, None).compile(dialect=asyncpg.dialect()))
+    assert ">" not in sql
+    assert sql.endswith("ORDER BY items.created_at, items.id")
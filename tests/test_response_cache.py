@@ -0,0 +1,57 @@
+import asyncio
+
+from starlette.requests import Request
+
+from app.core.response_cache import InMemoryResponseCache, get_response_cache, set_response_cache
+from app.routers.items import ITEM_LIST_ADAPTER, _cached_response, _etag_response, _items_etag
+
+
+class _VersionResult:
+    def __init__(self, row):
+        self._row = row
+
+    def one(self):
+        return self._row
+
+
+class _VersionSession:
+    """Stands in for the session: answers the items version probe only"""
+
+    def __init__(self, row):
+        self.row = row
+
+    async def execute(self, query):
+        return _VersionResult(self.row)
+
+
+def _request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/api/items/", "query_string": b"limit=2", "headers": headers})
+
+
+def _etag(db):
+    return asyncio.run(_items_etag(db, _request(), 1))
+
+
+def test_write_on_another_worker_bypasses_cached_page():
+    previous = get_response_cache()
+    set_response_cache(InMemoryResponseCache())
+    try:
+        db = _VersionSession((2, 3, 2))
+        etag = _etag(db)
+        _etag_response(_request(), 1, etag, ITEM_LIST_ADAPTER, [])
+        assert _cached_response(_request(), 1, etag) is not None
+
+        # Another worker deleted item 1 and created item 3: this worker's
+        # cache was never invalidated, but the probe no longer matches
+        db.row = (2, 5, 3)
+        assert _cached_response(_request(), 1, _etag(db)) is None
+    finally:
+        set_response_cache(previous)
+
+
+def test_matching_if_none_match_gets_304_without_the_page():
+    etag = _etag(_VersionSession((1, 7, 7)))
+    response = _cached_response(_request(etag), 1, etag)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
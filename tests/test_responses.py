@@ -0,0 +1,34 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.core.responses import encode_json
+from app.routers.items import ITEM_ADAPTER, ITEM_LIST_ADAPTER
+
+ROWS = [
+    SimpleNamespace(id=1, title="Über", description=None, owner_id=7,
+                    created_at=datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)),
+    SimpleNamespace(id=2, title="second", description="x", owner_id=7,
+                    created_at=datetime(2024, 5, 2, 8, 30, 15, 250000, tzinfo=timezone.utc)),
+]
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_encode_json_follows_fast_json_setting(monkeypatch, fast):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast)
+    body = encode_json(ITEM_LIST_ADAPTER, ROWS)
+    assert json.loads(body) == [
+        {"id": 1, "title": "Über", "description": None, "owner_id": 7, "created_at": "2024-05-01T12:00:00Z"},
+        {"id": 2, "title": "second", "description": "x", "owner_id": 7, "created_at": "2024-05-02T08:30:15.250000Z"},
+    ]
+    # Both pipelines emit compact JSON, so streamed chunks can be spliced
+    assert b'},{' in body and b'": ' not in body
+
+
+def test_default_pipeline_is_used_when_fast_json_is_off(monkeypatch):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+    monkeypatch.setattr(ITEM_ADAPTER, "dump_json", None, raising=False)
+    assert json.loads(encode_json(ITEM_ADAPTER, ROWS[0]))["id"] == 1